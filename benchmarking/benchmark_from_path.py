@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+
+"""Benchmark the throughput and the peak memory of loading triples factories from (large) files."""
+
+import itertools as itt
+import multiprocessing
+import pathlib
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Optional, Tuple
+
+import click
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import seaborn as sns
+from tqdm import tqdm
+
+from pykeen.utils import get_benchmark
+from pykeen.version import get_git_hash
+
+FROM_PATH_DIRECTORY = get_benchmark("from_path")
+tsv_path = FROM_PATH_DIRECTORY / "from_path_benchmark.tsv"
+png_path = FROM_PATH_DIRECTORY / "from_path_benchmark.png"
+columns = [
+    "hash",
+    "num_triples",
+    "compression",
+    "chunk_size",
+    "replicate",
+    "file_size",
+    "time",
+    "triples_per_second",
+    "baseline_rss",
+    "peak_rss",
+]
+
+
+def _log(s):
+    tqdm.write(f'[{datetime.now().strftime("%H:%M:%S")}] {s}')
+
+
+def _reset_peak_rss() -> None:
+    """Reset the peak resident set size of the current process, if supported by the platform (Linux only)."""
+    try:
+        pathlib.Path("/proc/self/clear_refs").write_text("5")
+    except OSError:
+        pass
+
+
+def _get_peak_rss() -> int:
+    """Return the peak resident set size of the current process, in bytes."""
+    try:
+        status = pathlib.Path("/proc/self/status").read_text()
+    except OSError:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # note: Linux reports kilobytes, macOS bytes
+        return max_rss if sys.platform == "darwin" else 1024 * max_rss
+    # cf. man proc(5): "VmHWM: Peak resident set size", in kB
+    for line in status.splitlines():
+        if line.startswith("VmHWM:"):
+            return 1024 * int(line.split()[1])
+    raise RuntimeError("Could not determine peak resident set size")
+
+
+def _generate(path: pathlib.Path, num_triples: int, num_entities: int, num_relations: int, chunk_size: int = 1_000_000):
+    """Write random label-based triples to a file, chunk by chunk."""
+    generator = np.random.default_rng(seed=42)
+    for start in range(0, num_triples, chunk_size):
+        n = min(chunk_size, num_triples - start)
+        df = pd.DataFrame(
+            {
+                "head": pd.Series(generator.integers(num_entities, size=n)).map("entity_{:d}".format),
+                "relation": pd.Series(generator.integers(num_relations, size=n)).map("relation_{:d}".format),
+                "tail": pd.Series(generator.integers(num_entities, size=n)).map("entity_{:d}".format),
+            }
+        )
+        df.to_csv(path, sep="\t", header=False, index=False, mode="w" if start == 0 else "a")
+
+
+def _load(path: pathlib.Path, chunk_size: Optional[int]) -> Tuple[float, int, int]:
+    """Load a triples factory in a fresh process, and return the elapsed time, and the baseline and peak RSS."""
+    from pykeen.triples import TriplesFactory
+
+    _reset_peak_rss()
+    baseline_rss = _get_peak_rss()
+    start = time.perf_counter()
+    tf = TriplesFactory.from_path(path, chunk_size=chunk_size)
+    elapsed = time.perf_counter() - start
+    assert tf.num_triples > 0
+    return elapsed, baseline_rss, _get_peak_rss()
+
+
+@click.command()
+@click.option("-n", "--num-triples", "num_triples_list", type=int, multiple=True, default=[100_000, 1_000_000])
+@click.option("-e", "--num-entities", type=int, default=100_000, show_default=True)
+@click.option("--num-relations", type=int, default=1_000, show_default=True)
+@click.option("-c", "--chunk-size", "chunk_sizes", type=int, multiple=True, default=[0, 10_000, 100_000])
+@click.option("-z", "--compression", "compressions", multiple=True, default=["", "gz"])
+@click.option("-r", "--replicates", type=int, default=3, show_default=True)
+def main(num_triples_list, num_entities: int, num_relations: int, chunk_sizes, compressions, replicates: int):
+    """Compare the throughput and peak memory of loading triples with and without chunking.
+
+    A chunk size of 0 denotes loading the complete file at once. Each measurement runs in a fresh process, such that
+    the peak resident set size (RSS) is not affected by previous runs.
+    """
+    git_hash = get_git_hash()
+    click.echo(f"output directory: {FROM_PATH_DIRECTORY.as_posix()}")
+    context = multiprocessing.get_context("spawn")
+    rows = []
+    for num_triples, compression in itt.product(num_triples_list, compressions):
+        path = FROM_PATH_DIRECTORY.joinpath(f"triples_{num_triples}.tsv" + (f".{compression}" if compression else ""))
+        if not path.is_file():
+            _log(f"generating {path.as_uri()}")
+            _generate(path=path, num_triples=num_triples, num_entities=num_entities, num_relations=num_relations)
+        file_size = path.stat().st_size
+        it = tqdm(
+            itt.product(chunk_sizes, range(1, 1 + replicates)),
+            total=len(chunk_sizes) * replicates,
+            desc=path.name,
+        )
+        for chunk_size, replicate in it:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                elapsed, baseline_rss, peak_rss = executor.submit(_load, path, chunk_size or None).result()
+            rows.append(
+                (
+                    git_hash,
+                    num_triples,
+                    compression or "none",
+                    chunk_size,
+                    replicate,
+                    file_size,
+                    elapsed,
+                    num_triples / elapsed,
+                    baseline_rss,
+                    peak_rss,
+                )
+            )
+
+    df = pd.DataFrame(rows, columns=columns)
+    df["peak_rss_increase"] = df["peak_rss"] - df["baseline_rss"]
+    df.to_csv(tsv_path, sep="\t", index=False)
+    click.echo(
+        df.groupby(["num_triples", "compression", "chunk_size"])[["triples_per_second", "peak_rss_increase"]].mean()
+    )
+    _plot(df, git_hash)
+
+
+def _plot(df, git_hash):
+    """Make the chart comparing throughput and peak memory by chunk size."""
+    fig, axes = plt.subplots(ncols=2, figsize=(12, 4))
+    for ax, y, label in zip(
+        axes,
+        ("triples_per_second", "peak_rss_increase"),
+        ("Triples / s", "Peak RSS Increase [B]"),
+    ):
+        sns.barplot(data=df, x="num_triples", y=y, hue="chunk_size", ax=ax)
+        ax.set(yscale="log", xlabel="Number of Triples", ylabel=label)
+    fig.suptitle(git_hash)
+    fig.tight_layout()
+    fig.savefig(png_path, dpi=300)
+    plt.close(fig)
+
+
+if __name__ == "__main__":
+    main()
@@ -48,10 +48,45 @@ def _log(s):
     tqdm.write(f'[{datetime.now().strftime("%H:%M:%S")}] {s}')
 
 
+#: the splitting methods, as pairs of (method, randomize_cleanup)
+METHODS = {
+    'cleanup': ('cleanup', False),
+    'cleanup-randomized': ('cleanup', True),
+    'coverage': ('coverage', False),
+    'randomizedcoverage': ('randomizedcoverage', False),
+}
+
+
+def _generate_triples(
+    num_triples: int,
+    num_entities: int,
+    num_relations: int,
+    skew: float = 3.0,
+    seed: int = 42,
+) -> torch.LongTensor:
+    """Generate random triples with a skewed, power-law like entity and relation distribution."""
+    generator = torch.Generator().manual_seed(seed)
+    triples = torch.empty(num_triples, 3, dtype=torch.long)
+    for column, max_id in enumerate((num_entities, num_relations, num_entities)):
+        triples[:, column] = (torch.rand(num_triples, generator=generator) ** skew * max_id).long()
+    # compact the IDs, such that each ID occurs at least once
+    for columns in ([0, 2], [1]):
+        triples[:, columns] = triples[:, columns].unique(return_inverse=True)[1]
+    return triples
+
+
 @click.command()
 @click.option('-r', '--replicates', type=int, default=5, show_default=True)
 @click.option('-f', '--force', is_flag=True)
-def main(replicates: int, force: bool):
+@click.option('-d', '--dataset', 'datasets', multiple=True, help='Defaults to all datasets.')
+@click.option('-s', '--synthetic-size', 'synthetic_sizes', type=int, multiple=True, default=[1_000_000, 10_000_000])
+@click.option('-m', '--method', 'methods', type=click.Choice(sorted(METHODS)), multiple=True,
+              default=['cleanup', 'coverage', 'randomizedcoverage'])
+def main(replicates: int, force: bool, datasets, synthetic_sizes, methods):
+    """Compare the splitting time of all methods on datasets and synthetic skewed graphs.
+
+    The randomized cleanup is not included by default, since it may take very long for larger graphs.
+    """
     import pykeen.triples.splitting
     pykeen.triples.splitting.logger.setLevel(logging.ERROR)
     import pykeen.triples.triples_factory
@@ -60,12 +95,13 @@ def main(replicates: int, force: bool):
     pykeen.utils.logger.setLevel(logging.ERROR)
 
     git_hash = get_git_hash()
-    methods = ['cleanup', 'coverage']
     ratios = [0.8]
 
     click.echo(f'output directory: {SPLITTING_DIRECTORY.as_posix()}')
     rows = []
-    outer_it = tqdm(sorted(dataset_resolver.lookup_dict), desc='Dataset')
+    datasets = sorted(datasets or dataset_resolver.lookup_dict)
+    synthetic = [f'synthetic-{num_triples}' for num_triples in synthetic_sizes]
+    outer_it = tqdm(datasets + synthetic, desc='Dataset')
     for dataset in outer_it:
         dataset_path = RESULTS_DIRECTORY / f'{dataset}.tsv'
         if dataset_path.exists() and not force:
@@ -74,25 +110,39 @@ def main(replicates: int, force: bool):
             rows.extend(df.values)
             continue
 
-        _log(f'loading {dataset}')
-        t = time.time()
-        dataset = get_dataset(dataset=dataset)
-        dataset_name = dataset.__class__.__name__
-        ccl = [
-            dataset.training.mapped_triples,
-            dataset.testing.mapped_triples,
-            dataset.validation.mapped_triples,
-        ]
-        load_time = time.time() - t
-        _log(f'done loading {dataset_name} after {load_time:.3f} seconds')
-        _log(f'concatenating {dataset_name}')
-        t = time.time()
-        mapped_triples: torch.LongTensor = torch.cat(ccl, dim=0)
-        concat_time = time.time() - t
-        _log(f'done concatenating {dataset_name} after {concat_time:.3f} seconds')
-        _log(f'deleting {dataset_name}')
-        del dataset
-        _log(f'done deleting {dataset_name}')
+        if dataset in synthetic:
+            num_triples = int(dataset.split('-')[-1])
+            dataset_name = dataset
+            _log(f'generating {dataset_name}')
+            t = time.time()
+            mapped_triples = _generate_triples(
+                num_triples=num_triples,
+                num_entities=max(num_triples // 20, 1),
+                num_relations=max(num_triples // 10_000, 1),
+            )
+            load_time = time.time() - t
+            concat_time = 0.0
+            _log(f'done generating {dataset_name} after {load_time:.3f} seconds')
+        else:
+            _log(f'loading {dataset}')
+            t = time.time()
+            dataset = get_dataset(dataset=dataset)
+            dataset_name = dataset.__class__.__name__
+            ccl = [
+                dataset.training.mapped_triples,
+                dataset.testing.mapped_triples,
+                dataset.validation.mapped_triples,
+            ]
+            load_time = time.time() - t
+            _log(f'done loading {dataset_name} after {load_time:.3f} seconds')
+            _log(f'concatenating {dataset_name}')
+            t = time.time()
+            mapped_triples: torch.LongTensor = torch.cat(ccl, dim=0)
+            concat_time = time.time() - t
+            _log(f'done concatenating {dataset_name} after {concat_time:.3f} seconds')
+            _log(f'deleting {dataset_name}')
+            del dataset
+            _log(f'done deleting {dataset_name}')
 
         dataset_rows = []
         inner_it = itt.product(methods, ratios, range(1, 1 + replicates))
@@ -102,11 +152,13 @@ def main(replicates: int, force: bool):
             desc=f'{dataset_name} ({intword(mapped_triples.shape[0])})',
         )
         for method, ratio, replicate in inner_it:
+            split_method, randomize_cleanup = METHODS[method]
             t = time.time()
             results = split(
                 mapped_triples,
                 ratios=[ratio, (1 - ratio) / 2],
-                method=method,
+                method=split_method,
+                randomize_cleanup=randomize_cleanup,
                 random_state=replicate,
             )
             split_time = time.time() - t
@@ -132,6 +184,7 @@ def main(replicates: int, force: bool):
 
     df = pd.DataFrame(rows, columns=columns)
     df.to_csv(tsv_path, sep='\t', index=False)
+    click.echo(df.groupby(['dataset', 'method'])['split_time'].mean())
     _make_1(df, git_hash)
     _make_2(df, git_hash)
 
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+"""Benchmark the speed and the statistics of subgraph sampling for sLCWA training."""
+
+import itertools as itt
+import logging
+import time
+from datetime import datetime
+
+import click
+import matplotlib.pyplot as plt
+import pandas as pd
+import seaborn as sns
+import torch
+from tqdm import tqdm
+
+from pykeen.datasets import get_dataset
+from pykeen.triples.triples_factory import SLCWA_SAMPLERS
+from pykeen.utils import get_benchmark
+from pykeen.version import get_git_hash
+
+SAMPLING_DIRECTORY = get_benchmark("subgraph_sampling")
+tsv_path = SAMPLING_DIRECTORY / "subgraph_sampling_benchmark.tsv"
+png_path = SAMPLING_DIRECTORY / "subgraph_sampling_benchmark.png"
+columns = [
+    "hash",
+    "dataset",
+    "num_triples",
+    "sampler",
+    "batch_size",
+    "replicate",
+    "index_time",
+    "num_batches",
+    "batches_per_second",
+    "mean_num_nodes",
+]
+
+
+def _log(s):
+    tqdm.write(f'[{datetime.now().strftime("%H:%M:%S")}] {s}')
+
+
+@click.command()
+@click.option("-d", "--dataset", "datasets", multiple=True, default=["nations", "kinships", "fb15k237"])
+@click.option("-b", "--batch-size", "batch_sizes", type=int, multiple=True, default=[256, 1024, 4096])
+@click.option("-n", "--num-batches", type=int, default=10, show_default=True)
+@click.option("-r", "--replicates", type=int, default=3, show_default=True)
+def main(datasets, batch_sizes, num_batches: int, replicates: int):
+    """Compare the number of subgraph batches per second, and the number of nodes per batch, for all samplers."""
+    import pykeen.triples.triples_factory
+
+    pykeen.triples.triples_factory.logger.setLevel(logging.ERROR)
+
+    git_hash = get_git_hash()
+    samplers = [sampler for sampler in SLCWA_SAMPLERS if sampler is not None]
+    click.echo(f"output directory: {SAMPLING_DIRECTORY.as_posix()}")
+    rows = []
+    for dataset in tqdm(datasets, desc="Dataset"):
+        _log(f"loading {dataset}")
+        training = get_dataset(dataset=dataset).training
+        it = tqdm(
+            itt.product(samplers, batch_sizes, range(1, 1 + replicates)),
+            total=len(samplers) * len(batch_sizes) * replicates,
+            desc=dataset,
+        )
+        for sampler, batch_size, replicate in it:
+            torch.manual_seed(replicate)
+            t = time.time()
+            instances = training.create_slcwa_instances(sampler=sampler, batch_size=batch_size)
+            index_time = time.time() - t
+            num_nodes = []
+            t = time.time()
+            for _ in range(num_batches):
+                triple_ids = instances.subgraph_sample()
+                num_nodes.append(instances.mapped_triples[triple_ids][:, [0, 2]].unique().numel())
+            sample_time = time.time() - t
+            rows.append(
+                (
+                    git_hash,
+                    dataset,
+                    training.num_triples,
+                    sampler,
+                    batch_size,
+                    replicate,
+                    index_time,
+                    num_batches,
+                    num_batches / sample_time,
+                    sum(num_nodes) / len(num_nodes),
+                )
+            )
+
+    df = pd.DataFrame(rows, columns=columns)
+    df.to_csv(tsv_path, sep="\t", index=False)
+    click.echo(df.groupby(["dataset", "batch_size", "sampler"])[["batches_per_second", "mean_num_nodes"]].mean())
+    _plot(df, git_hash)
+
+
+def _plot(df, git_hash):
+    """Make the chart comparing the batches per second by sampler."""
+    g = sns.catplot(data=df, x="batch_size", y="batches_per_second", hue="sampler", col="dataset", kind="bar")
+    g.set(yscale="log")
+    g.set_axis_labels("Batch Size", "Batches / s")
+    g.fig.suptitle(git_hash)
+    g.tight_layout()
+    g.savefig(png_path, dpi=300)
+    plt.close(g.fig)
+
+
+if __name__ == "__main__":
+    main()
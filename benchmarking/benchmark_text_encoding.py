@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+"""Benchmark the throughput of encoding labels with and without length-bucketed, de-duplicated batching."""
+
+import itertools as itt
+import string
+import time
+from datetime import datetime
+from typing import List
+
+import click
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import seaborn as sns
+import torch
+from tqdm import tqdm
+
+from pykeen.nn.text import _encode_all_memory_utilization_optimized, text_encoder_resolver
+from pykeen.utils import get_benchmark
+from pykeen.version import get_git_hash
+
+TEXT_ENCODING_DIRECTORY = get_benchmark("text_encoding")
+tsv_path = TEXT_ENCODING_DIRECTORY / "text_encoding_benchmark.tsv"
+png_path = TEXT_ENCODING_DIRECTORY / "text_encoding_benchmark.png"
+columns = [
+    "hash",
+    "encoder",
+    "num_labels",
+    "num_unique_labels",
+    "batch_size",
+    "method",
+    "replicate",
+    "time",
+    "labels_per_second",
+    "padding_ratio",
+]
+
+
+def _log(s):
+    tqdm.write(f'[{datetime.now().strftime("%H:%M:%S")}] {s}')
+
+
+def _generate_labels(num_labels: int, duplicate_ratio: float, seed: int = 42) -> List[str]:
+    """Generate labels with a long-tailed (log-normal) number of words, and some duplicates.
+
+    Entity labels are mostly short names, but some are long descriptions, e.g., titles of works.
+    """
+    generator = np.random.default_rng(seed=seed)
+    num_unique = max(1, int(num_labels * (1 - duplicate_ratio)))
+    num_words = np.clip(generator.lognormal(mean=1.0, sigma=0.8, size=num_unique).astype(int), 1, 64)
+    letters = np.asarray(list(string.ascii_lowercase))
+    unique_labels = [
+        " ".join("".join(generator.choice(letters, size=generator.integers(2, 10))) for _ in range(n))
+        for n in num_words.tolist()
+    ]
+    return [unique_labels[i] for i in generator.integers(num_unique, size=num_labels).tolist()]
+
+
+def _padding_ratio(lengths: np.ndarray, batch_size: int) -> float:
+    """Return the fraction of padding positions when encoding batches with the given lengths."""
+    padded = sum(
+        len(batch) * max(batch) for batch in np.array_split(lengths, range(batch_size, len(lengths), batch_size))
+    )
+    return 1.0 - lengths.sum() / padded
+
+
+@click.command()
+@click.option("-e", "--encoder", default="characterembedding", show_default=True)
+@click.option("-m", "--model", help="the pretrained model name or path, for the transformer encoder")
+@click.option("-n", "--num-labels", "num_labels_list", type=int, multiple=True, default=[1_000, 10_000])
+@click.option("--duplicate-ratio", type=float, default=0.1, show_default=True)
+@click.option("-b", "--batch-size", "batch_sizes", type=int, multiple=True, default=[32, 256])
+@click.option("-r", "--replicates", type=int, default=3, show_default=True)
+def main(encoder: str, model, num_labels_list, duplicate_ratio: float, batch_sizes, replicates: int):
+    """Compare the throughput of encoding labels in their original order, and bucketed by length.
+
+    The original method encodes all labels in the given order, while the bucketed method encodes unique labels
+    only, sorted by their length.
+    """
+    git_hash = get_git_hash()
+    click.echo(f"output directory: {TEXT_ENCODING_DIRECTORY.as_posix()}")
+    encoder_kwargs = None if model is None else dict(pretrained_model_name_or_path=model)
+    text_encoder = text_encoder_resolver.make(encoder, encoder_kwargs).eval()
+    rows = []
+    for num_labels in num_labels_list:
+        labels = _generate_labels(num_labels=num_labels, duplicate_ratio=duplicate_ratio)
+        unique_labels = list(dict.fromkeys(labels))
+        lengths = text_encoder.get_lengths(labels)
+        padding_ratios = dict(
+            original=lambda batch_size: _padding_ratio(lengths, batch_size),
+            bucketed=lambda batch_size: _padding_ratio(
+                np.sort(text_encoder.get_lengths(unique_labels))[::-1], batch_size
+            ),
+        )
+        it = tqdm(
+            itt.product(batch_sizes, ("original", "bucketed"), range(1, 1 + replicates)),
+            total=len(batch_sizes) * 2 * replicates,
+            desc=f"{num_labels:,} labels",
+        )
+        for batch_size, method, replicate in it:
+            start = time.perf_counter()
+            if method == "original":
+                with torch.inference_mode():
+                    _encode_all_memory_utilization_optimized(encoder=text_encoder, labels=labels, batch_size=batch_size)
+            else:
+                text_encoder.encode_all(labels=labels, batch_size=batch_size)
+            elapsed = time.perf_counter() - start
+            rows.append(
+                (
+                    git_hash,
+                    encoder,
+                    num_labels,
+                    len(unique_labels),
+                    batch_size,
+                    method,
+                    replicate,
+                    elapsed,
+                    num_labels / elapsed,
+                    padding_ratios[method](batch_size),
+                )
+            )
+
+    df = pd.DataFrame(rows, columns=columns)
+    df.to_csv(tsv_path, sep="\t", index=False)
+    click.echo(df.groupby(["num_labels", "batch_size", "method"])[["labels_per_second", "padding_ratio"]].mean())
+    _plot(df, git_hash)
+
+
+def _plot(df, git_hash):
+    """Make the chart comparing the throughput by method."""
+    g = sns.catplot(data=df, x="batch_size", y="labels_per_second", hue="method", col="num_labels", kind="bar")
+    g.set(yscale="log")
+    g.set_axis_labels("Batch Size", "Labels / s")
+    g.fig.suptitle(git_hash)
+    g.tight_layout()
+    g.savefig(png_path, dpi=300)
+    plt.close(g.fig)
+
+
+if __name__ == "__main__":
+    main()
@@ -264,9 +264,10 @@ class LCWALitModule(LitModule):
         self, triples_factory: CoreTriplesFactory, shuffle: bool = False
     ) -> torch.utils.data.DataLoader:  # noqa: D102
         return torch.utils.data.DataLoader(
-            dataset=triples_factory.create_lcwa_instances(),
-            batch_size=self.batch_size,
-            shuffle=shuffle,
+            dataset=triples_factory.create_lcwa_instances(batch_size=self.batch_size, shuffle=shuffle),
+            # disable automatic batching in data loader
+            batch_size=None,
+            batch_sampler=None,
         )
 
 
@@ -199,6 +199,7 @@ def get_relation_pattern_types_df(
     parts: Optional[Collection[str]] = None,
     force: bool = False,
     add_labels: bool = True,
+    num_workers: int = 0,
 ) -> pd.DataFrame:
     r"""
     Categorize relations based on patterns from RotatE [sun2019]_.
@@ -238,6 +239,9 @@ def get_relation_pattern_types_df(
         Whether to enforce re-calculation even if a cached version is available.
     :param add_labels:
         Whether to add relation labels (if available).
+    :param num_workers:
+        The number of worker processes for mining the composition patterns, cf.
+        :func:`pykeen.triples.analysis.iter_patterns`.
 
     .. warning ::
 
@@ -259,10 +263,7 @@ def get_relation_pattern_types_df(
 
     # re-use cached file if possible
     if not cache_path.is_file() or force:
-        # select triples
-        mapped_triples = torch.cat([dataset.factory_dict[part].mapped_triples for part in parts], dim=0).tolist()
-
-        df = triple_analysis.relation_pattern_types(mapped_triples=mapped_triples)
+        df = triple_analysis.relation_pattern_types(mapped_triples=mapped_triples, num_workers=num_workers)
 
         # save to file
         cache_path.parent.mkdir(exist_ok=True, parents=True)
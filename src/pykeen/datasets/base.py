@@ -193,8 +193,21 @@ class Dataset(ExtraReprMixin):
         return cls.from_tf(tf=tf, ratios=ratios)
 
     @classmethod
-    def from_directory_binary(cls, path: Union[str, pathlib.Path]) -> "Dataset":
-        """Load a dataset from a directory."""
+    def from_directory_binary(cls, path: Union[str, pathlib.Path], mmap: bool = False) -> "Dataset":
+        """
+        Load a dataset from a directory.
+
+        :param path:
+            the directory, as written by :meth:`to_directory_binary`
+        :param mmap:
+            whether to memory-map the numeric triples, cf. :meth:`pykeen.triples.CoreTriplesFactory.from_path_binary`
+
+        :raises NotADirectoryError:
+            if the path is not a directory
+
+        :return:
+            the loaded dataset
+        """
         path = pathlib.Path(path)
 
         if not path.is_dir():
@@ -205,7 +218,7 @@ class Dataset(ExtraReprMixin):
         for key in ("training", "testing", "validation"):
             tf_path = path.joinpath(key)
             if tf_path.is_dir():
-                tfs[key] = cls.triples_factory_cls.from_path_binary(path=tf_path)
+                tfs[key] = cls.triples_factory_cls.from_path_binary(path=tf_path, mmap=mmap)
             else:
                 logger.warning(f"{tf_path.as_uri()} does not exist.")
         metadata_path = path.joinpath(cls.metadata_file_name)
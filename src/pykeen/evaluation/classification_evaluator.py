@@ -2,7 +2,7 @@
 
 """Implementation of wrapper around sklearn metrics."""
 
-from typing import Mapping, MutableMapping, Optional, Tuple, Type, cast
+from typing import Any, Mapping, MutableMapping, Optional, Tuple, Type, cast
 
 import numpy as np
 import torch
@@ -103,6 +103,15 @@ class ClassificationEvaluator(Evaluator):
         self.all_positives.clear()
         self.all_scores.clear()
 
+    # docstr-coverage: inherited
+    def get_state(self) -> Mapping[str, Any]:  # noqa: D102
+        return dict(all_scores=dict(self.all_scores), all_positives=dict(self.all_positives))
+
+    # docstr-coverage: inherited
+    def merge_state_(self, state: Mapping[str, Any]) -> None:  # noqa: D102
+        self.all_scores.update(state["all_scores"])
+        self.all_positives.update(state["all_positives"])
+
     # docstr-coverage: inherited
     def finalize(self) -> ClassificationMetricResults:  # noqa: D102
         # Because the order of the values of an dictionary is not guaranteed,
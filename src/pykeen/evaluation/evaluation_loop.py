@@ -6,7 +6,22 @@ import dataclasses
 import logging
 from abc import abstractmethod
 from collections import defaultdict
-from typing import Any, Collection, DefaultDict, Generic, Iterable, List, Mapping, Optional, Tuple, TypeVar, Union, cast
+from typing import (
+    Any,
+    Collection,
+    DefaultDict,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 
 import numpy
 import pandas
@@ -249,28 +264,63 @@ class FilterIndex:
             raise ValueError(f"Missing columns: {sorted(expected_columns.difference(df.columns))}")
 
         # group key = everything except the prediction target
-        key = [c for c in df.columns if c != target]
-        # initialize data structure
-        triple_id_to_key_id = numpy.empty_like(df.index)
-        indices = []
-        bounds = [0]
-        # group by key
-        for key_id, (_, group) in enumerate(df.groupby(by=key)):
-            unique_targets = group[target].unique()
-            triple_id_to_key_id[group.index] = key_id
-            indices.extend(unique_targets)
-            bounds.append(len(indices))
-        # convert lists to arrays
-        indices = cast(torch.LongTensor, torch.as_tensor(indices))
-        bounds = numpy.asarray(bounds)
-        # instantiate
+        key_columns = [c for c in COLUMN_LABELS if c != target]
+        first, second = (df[c].to_numpy(dtype=numpy.int64) for c in key_columns)
+        targets = df[target].to_numpy(dtype=numpy.int64)
+        if not len(targets):
+            return cls(
+                triple_id_to_key_id=numpy.empty_like(df.index),
+                bounds=numpy.zeros(1, dtype=numpy.int64),
+                indices=cast(torch.LongTensor, torch.empty(0, dtype=torch.long)),
+            )
+        # pack keys such that their order is lexicographic in the key columns, i.e., the same as for groupby
+        keys = first * (second.max() + 1) + second
+        _, triple_id_to_key_id = numpy.unique(keys, return_inverse=True)
+        num_keys = triple_id_to_key_id.max() + 1
+        # unique (key, target) pairs, with the position of their first occurrence
+        _, first_occurrence = numpy.unique(triple_id_to_key_id * (targets.max() + 1) + targets, return_index=True)
+        # order by key, and within each key by first occurrence (cf. pandas.Series.unique)
+        first_occurrence = first_occurrence[numpy.lexsort((first_occurrence, triple_id_to_key_id[first_occurrence]))]
+        counts = numpy.bincount(triple_id_to_key_id[first_occurrence], minlength=num_keys)
+        bounds = numpy.zeros(num_keys + 1, dtype=numpy.int64)
+        numpy.cumsum(counts, out=bounds[1:])
+        indices = cast(torch.LongTensor, torch.as_tensor(targets[first_occurrence]))
         return cls(triple_id_to_key_id=triple_id_to_key_id, bounds=bounds, indices=indices)
 
-    def __getitem__(self, item: int) -> numpy.ndarray:  # noqa: D105
-        # return indices corresponding to the `item`-th triple
-        key_id = self.triple_id_to_key_id[item]
-        low, high = self.bounds[key_id : key_id + 2]
-        return self.indices[low:high]
+    @overload
+    def __getitem__(self, item: int) -> torch.LongTensor:
+        ...
+
+    @overload
+    def __getitem__(self, item: Union[Sequence[int], numpy.ndarray]) -> torch.LongTensor:
+        ...
+
+    def __getitem__(self, item):
+        """
+        Get the filter targets for one or multiple triples.
+
+        :param item:
+            a single triple ID, or a sequence of triple IDs
+
+        :return:
+            for a single triple ID, shape: (k,), the unique targets for the triple's key.
+            for a sequence of triple IDs, shape: (m, 2), the targets in sparse format [(batch_index, target_id)]
+        """
+        if numpy.ndim(item) == 0:
+            # return indices corresponding to the `item`-th triple
+            key_id = self.triple_id_to_key_id[item]
+            low, high = self.bounds[key_id : key_id + 2]
+            return self.indices[low:high]
+        key_ids = self.triple_id_to_key_id[numpy.asarray(item)]
+        low = self.bounds[key_ids]
+        counts = self.bounds[key_ids + 1] - low
+        # expand CSR ranges
+        batch_ids = numpy.repeat(numpy.arange(len(key_ids)), counts)
+        positions = numpy.repeat(low - (numpy.cumsum(counts) - counts), counts) + numpy.arange(len(batch_ids))
+        return torch.stack(
+            [torch.as_tensor(batch_ids, dtype=torch.long), self.indices[torch.as_tensor(positions, dtype=torch.long)]],
+            dim=-1,
+        )
 
 
 class LCWAEvaluationDataset(Dataset[Mapping[Target, Tuple[MappedTriples, Optional[torch.Tensor]]]]):
@@ -347,11 +397,43 @@ class LCWAEvaluationDataset(Dataset[Mapping[Target, Tuple[MappedTriples, Optiona
         nnz = None if self.filter_indices is None else self.filter_indices[target][index]
         return target, triple, nnz
 
+    def __getitems__(self, indices: Sequence[int]) -> Mapping[Target, Tuple[MappedTriples, Optional[torch.Tensor]]]:
+        """
+        Get a whole batch, already collated.
+
+        .. note ::
+            This method is used by :class:`torch.utils.data.DataLoader` instead of :meth:`__getitem__` for each index.
+
+        :param indices:
+            the indices of the evaluation tasks
+
+        :return:
+            the batch, grouped by target, cf. :meth:`collate`
+        """
+        target_ids, triple_ids = numpy.divmod(numpy.asarray(indices, dtype=numpy.int64), self.num_triples)
+        result = {}
+        # note: this loop runs over the (few) targets, not the batch elements
+        for target_id in numpy.unique(target_ids):
+            target = self.targets[target_id]
+            target_triple_ids = triple_ids[target_ids == target_id]
+            result[target] = (
+                self.mapped_triples[torch.as_tensor(target_triple_ids)],
+                None if self.filter_indices is None else self.filter_indices[target][target_triple_ids],
+            )
+        return result
+
     @staticmethod
     def collate(
-        batch: Iterable[Tuple[Target, MappedTriples, Optional[torch.LongTensor]]]
+        batch: Union[
+            Iterable[Tuple[Target, MappedTriples, Optional[torch.LongTensor]]],
+            Mapping[Target, Tuple[MappedTriples, Optional[torch.Tensor]]],
+        ]
     ) -> Mapping[Target, Tuple[MappedTriples, Optional[torch.Tensor]]]:
         """Collate batches by grouping by target."""
+        # batches obtained via __getitems__ are already collated
+        if isinstance(batch, Mapping):
+            return batch
+
         # group by target
         triples: DefaultDict[Target, List[torch.LongTensor]] = defaultdict(list)
         nnz: DefaultDict[Target, List[torch.LongTensor]] = defaultdict(list)
@@ -7,6 +7,7 @@ import logging
 import timeit
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
+from functools import partial
 from math import ceil
 from typing import Any, ClassVar, Collection, List, Mapping, Optional, Tuple, Type, Union, cast
 
@@ -17,10 +18,13 @@ from tqdm.autonotebook import tqdm
 from ..constants import COLUMN_LABELS, TARGET_TO_INDEX, TARGET_TO_KEY_LABELS
 from ..metrics.utils import Metric
 from ..models import Model
+from ..nn.representation import cached_representations
 from ..triples.triples_factory import restrict_triples
 from ..triples.utils import get_entities, get_relations
 from ..typing import LABEL_HEAD, LABEL_RELATION, LABEL_TAIL, InductiveMode, MappedTriples, Target
 from ..utils import (
+    LinearMemoryEstimate,
+    estimate_peak_memory,
     format_relative_comparison,
     is_cuda_oom_error,
     is_cudnn_error,
@@ -32,6 +36,7 @@ from ..utils import (
 __all__ = [
     "Evaluator",
     "MetricResults",
+    "PositiveFilterIndex",
     "filter_scores_",
     "evaluate",
     "prepare_filter_triples",
@@ -99,6 +104,7 @@ class Evaluator(ABC):
         slice_size: Optional[int] = None,
         automatic_memory_optimization: bool = True,
         mode: Optional[InductiveMode] = None,
+        memory_budget: Optional[int] = None,
     ):
         """Initialize the evaluator.
 
@@ -110,6 +116,10 @@ class Evaluator(ABC):
             evaluation with regards to the hardware at hand.
         :param mode:
             the inductive mode, or None for transductive evaluation
+        :param memory_budget:
+            the memory budget in bytes for automatic memory optimization. If given, the batch and slice size are
+            selected by extrapolating the peak memory of small probe batches, cf. :meth:`memory_budget_search`. This
+            also works on CPU, where out-of-memory errors cannot be caught.
         """
         self.filtered = filtered
         self.requires_positive_mask = requires_positive_mask
@@ -117,6 +127,9 @@ class Evaluator(ABC):
         self.slice_size = slice_size
         self.automatic_memory_optimization = automatic_memory_optimization
         self.mode = mode
+        self.memory_budget = memory_budget
+        #: the predicted peak memory of the sizes selected by :meth:`memory_budget_search`, in bytes
+        self.predicted_peak_memory: Optional[int] = None
 
     @classmethod
     def get_normalized_name(cls) -> str:
@@ -154,6 +167,41 @@ class Evaluator(ABC):
         """Compute the final results, and clear buffers."""
         raise NotImplementedError
 
+    def get_state(self) -> Mapping[str, Any]:
+        """Get the evaluator's buffers in a serializable form.
+
+        The state only contains CPU tensors, numpy arrays, and built-in Python types, such that it can be pickled,
+        e.g., to send it from a worker process to the main process.
+
+        :return:
+            the evaluator's state, which can be passed to :meth:`merge_state_`
+
+        :raises NotImplementedError:
+            if the evaluator does not support exporting its state
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support exporting its state.")
+
+    def merge_state_(self, state: Mapping[str, Any]) -> None:
+        """Merge the state of another evaluator into this one's buffers (in-place).
+
+        This allows to combine the results of evaluators which processed disjoint parts of the evaluation triples.
+
+        :param state:
+            the other evaluator's state, cf. :meth:`get_state`
+
+        :raises NotImplementedError:
+            if the evaluator does not support merging states
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support merging states.")
+
+    def merge_(self, other: "Evaluator") -> None:
+        """Merge the buffers of another evaluator into this one (in-place).
+
+        :param other:
+            the other evaluator, which processed a disjoint part of the evaluation triples
+        """
+        self.merge_state_(state=other.get_state())
+
     def evaluate(
         self,
         model: Model,
@@ -187,7 +235,17 @@ class Evaluator(ABC):
             logger.warning(f"Ignoring provided mode={mode}, and use the evaluator's mode={self.mode} instead")
         kwargs["mode"] = self.mode
 
-        if batch_size is None and self.automatic_memory_optimization:
+        if batch_size is None and self.automatic_memory_optimization and self.memory_budget is not None:
+            batch_size, slice_size = self.memory_budget_search(
+                model=model,
+                mapped_triples=mapped_triples,
+                memory_budget=self.memory_budget,
+                **kwargs,
+            )
+            # The batch_size and slice_size should be accessible to outside objects for re-use, e.g. early stoppers.
+            self.batch_size = batch_size
+            self.slice_size = slice_size
+        elif batch_size is None and self.automatic_memory_optimization:
             # Using automatic memory optimization on CPU may result in undocumented crashes due to OS' OOM killer.
             if model.device.type == "cpu":
                 logger.info(
@@ -281,6 +339,130 @@ class Evaluator(ABC):
 
         return batch_size, slice_size
 
+    def _probe_peak_memory(
+        self,
+        model: Model,
+        mapped_triples: MappedTriples,
+        batch_size: int,
+        slice_size: Optional[int] = None,
+        targets: Collection[Target] = (LABEL_HEAD, LABEL_TAIL),
+        **kwargs,
+    ) -> int:
+        """
+        Estimate the peak memory of evaluating a single probe batch.
+
+        The forward pass is run with gradient tracking, such that the tensors saved for backward can serve as an upper
+        bound of the intermediate tensors, cf. :func:`pykeen.utils.estimate_peak_memory`.
+
+        :param model:
+            the model
+        :param mapped_triples: shape: (n, 3)
+            the evaluation triples
+        :param batch_size:
+            the probe batch size
+        :param slice_size:
+            the slice size, if any
+        :param targets:
+            the prediction targets
+        :param kwargs:
+            ignored keyword-based parameters for :func:`evaluate`
+
+        :return:
+            the estimated peak memory in bytes, i.e., the maximum over all targets
+        """
+        batch = mapped_triples[:batch_size].to(model.device)
+        parameters = list(model.parameters())
+        # the filtered evaluation and the dense positive masks create additional score-sized tensors
+        num_copies = int(self.filtered) + int(self.requires_positive_mask)
+        num_bytes = torch.finfo(torch.get_default_dtype()).bits // 8
+        peak = 0
+        with torch.enable_grad():
+            for target in targets:
+                num_candidates = model.num_relations if target == LABEL_RELATION else model.num_entities
+                target_peak = estimate_peak_memory(
+                    closure=partial(
+                        model.predict, hrt_batch=batch, target=target, slice_size=slice_size, mode=self.mode
+                    ),
+                    exclude=parameters,
+                )
+                peak = max(peak, target_peak + num_copies * batch.shape[0] * num_candidates * num_bytes)
+        model._free_graph_and_cache()
+        return peak
+
+    def memory_budget_search(
+        self,
+        model: Model,
+        mapped_triples: MappedTriples,
+        memory_budget: int,
+        **kwargs,
+    ) -> Tuple[int, Optional[int]]:
+        """Select the batch size and slice size for evaluation for a memory budget.
+
+        In contrast to :meth:`batch_and_slice`, this method does not rely on catching out-of-memory errors, and thus
+        also works on CPU. Instead, the peak memory is estimated for a few small probe batches and extrapolated
+        linearly to larger batches, cf. :class:`pykeen.utils.LinearMemoryEstimate`. The predicted peak memory is
+        stored in :attr:`predicted_peak_memory`.
+
+        :param model:
+            The model to evaluate.
+        :param mapped_triples:
+            The triples on which to evaluate.
+        :param memory_budget:
+            The memory budget, in bytes
+        :param kwargs:
+            additional keyword-based parameters passed to :func:`pykeen.evaluation.evaluate`
+
+        :return:
+            Maximum possible batch size and, if necessary, the slice_size, which defaults to None.
+
+        :raises MemoryError:
+            If it is not possible to evaluate the model within the budget.
+        """
+        logger.info(f"Starting estimation-based memory optimization for evaluation with budget={memory_budget:_} B.")
+        maximum = mapped_triples.shape[0]
+        sizes = sorted({min(size, maximum) for size in (4, 8, 16)})
+        estimate = LinearMemoryEstimate.from_probes(
+            sizes=sizes,
+            peaks=[
+                self._probe_peak_memory(model=model, mapped_triples=mapped_triples, batch_size=size, **kwargs)
+                for size in sizes
+            ],
+        )
+        batch_size = estimate.get_max_size(budget=memory_budget, maximum=maximum)
+        slice_size = None
+        if batch_size == 0:
+            targets: Collection[Target] = kwargs.get("targets", (LABEL_HEAD, LABEL_TAIL))
+            predict_entities = bool({LABEL_HEAD, LABEL_TAIL}.intersection(targets))
+            predict_relations = LABEL_RELATION in targets
+            self._check_slicing_availability(
+                model, batch_size=1, entities=predict_entities, relations=predict_relations
+            )
+            batch_size = 1
+            max_id = max(
+                model.num_entities if predict_entities else -1, model.num_relations if predict_relations else -1
+            )
+            sizes = sorted({min(size, max_id) for size in (4, 8, 16)})
+            estimate = LinearMemoryEstimate.from_probes(
+                sizes=sizes,
+                peaks=[
+                    self._probe_peak_memory(
+                        model=model, mapped_triples=mapped_triples, batch_size=1, slice_size=size, **kwargs
+                    )
+                    for size in sizes
+                ],
+            )
+            slice_size = estimate.get_max_size(budget=memory_budget, maximum=max_id)
+            if slice_size == 0:
+                raise MemoryError(
+                    "The current model can't be evaluated within the memory budget with these parameters."
+                )
+        self.predicted_peak_memory = estimate(slice_size or batch_size)
+        logger.info(
+            f"Concluded memory optimization with batch_size={batch_size}, slice_size={slice_size}, and a predicted "
+            f"peak memory of {self.predicted_peak_memory:_} B.",
+        )
+        return batch_size, slice_size
+
     def _param_size_search(
         self,
         key: str,
@@ -469,6 +651,114 @@ def create_sparse_positive_filter_(
     return filter_batch, relation_filter
 
 
+class PositiveFilterIndex:
+    """
+    A device-resident index over positive triples for filtered evaluation (roughly following CSR).
+
+    For each filter column, the (entity, relation) pairs of the remaining columns are packed into a single integer key.
+    The keys are sorted once, and the filter targets are stored in key order, such that the positives for a batch of
+    triples can be looked up by binary search instead of comparing each batch triple against *all* positive triples.
+    """
+
+    #: the sorted unique packed keys for each filter column, shape: (num_unique_keys,)
+    keys: Mapping[int, torch.LongTensor]
+
+    #: the offsets into the target array for each key, shape: (num_unique_keys + 1,)
+    offsets: Mapping[int, torch.LongTensor]
+
+    #: the filter targets, i.e., entity IDs, grouped by key, shape: (num_positive_triples,)
+    targets: Mapping[int, torch.LongTensor]
+
+    def __init__(self, all_pos_triples: MappedTriples, num_relations: Optional[int] = None) -> None:
+        """
+        Initialize the index.
+
+        :param all_pos_triples: shape: (num_positive_triples, 3)
+            All positive triples to base the filtering on.
+        :param num_relations:
+            the number of relations. Is increased if the positive triples contain larger relation IDs.
+        """
+        if all_pos_triples.numel():
+            num_relations = max(num_relations or 0, int(all_pos_triples[:, 1].max().item()) + 1)
+        self.num_relations = num_relations or 1
+        self.keys = dict()
+        self.offsets = dict()
+        self.targets = dict()
+        for filter_col in (0, 2):
+            other_col = 2 - filter_col
+            keys, order = self._pack(entities=all_pos_triples[:, other_col], relations=all_pos_triples[:, 1]).sort()
+            unique_keys, counts = torch.unique_consecutive(keys, return_counts=True)
+            offsets = counts.new_zeros(unique_keys.shape[0] + 1)
+            torch.cumsum(counts, dim=0, out=offsets[1:])
+            self.keys[filter_col] = unique_keys
+            self.offsets[filter_col] = offsets
+            self.targets[filter_col] = all_pos_triples[order, filter_col]
+
+    def _pack(self, entities: torch.LongTensor, relations: torch.LongTensor) -> torch.LongTensor:
+        """Pack (entity, relation) pairs into a single integer key."""
+        return entities.long() * self.num_relations + relations.long()
+
+    @property
+    def device(self) -> torch.device:
+        """The device of the index."""
+        return self.keys[0].device
+
+    def to(self, device: torch.device) -> "PositiveFilterIndex":
+        """Move the index to the given device (in-place)."""
+        for buffers in (self.keys, self.offsets, self.targets):
+            for filter_col, buffer in buffers.items():
+                buffers[filter_col] = buffer.to(device=device)
+        return self
+
+    def lookup(self, hrt_batch: MappedTriples, filter_col: int = 0) -> torch.LongTensor:
+        """
+        Compute indices of all positives for a batch.
+
+        For simplicity, only the head-side is described, i.e. filter_col=0. The tail-side is processed alike.
+
+        For each (h, r, t) triple in the batch, the entity identifiers are computed such that (h', r, t) exists in all
+        positive triples.
+
+        :param hrt_batch: shape: (batch_size, 3)
+            A batch of triples.
+        :param filter_col:
+            The column along which to filter. Allowed are {0, 2}, where 0 corresponds to filtering head-based and 2
+            corresponds to filtering tail-based.
+
+        :return: shape: (m, 2)
+            The indices of positives in format [(batch_index, entity_id)].
+
+        :raises NotImplementedError:
+            if the `filter_col` is not in `{0, 2}`
+        """
+        if filter_col not in self.keys:
+            raise NotImplementedError(
+                "This code has only been written for updating head (filter_col=0) or "
+                f"tail (filter_col=2) mask, but filter_col={filter_col} was given.",
+            )
+        keys, offsets, targets = self.keys[filter_col], self.offsets[filter_col], self.targets[filter_col]
+        if keys.numel() == 0:
+            return hrt_batch.new_empty(0, 2)
+
+        # pack queries; relations outside the known range cannot match, and must not alias other keys
+        other_col = 2 - filter_col
+        relations = hrt_batch[:, 1]
+        query = self._pack(entities=hrt_batch[:, other_col], relations=relations)
+        query = torch.where(relations < self.num_relations, query, torch.full_like(query, fill_value=-1))
+
+        # binary search for the key's position
+        position = torch.searchsorted(keys, query).clamp_max_(keys.shape[0] - 1)
+        found = keys[position] == query
+        start = offsets[position]
+        counts = torch.where(found, offsets[position + 1] - start, torch.zeros_like(start))
+
+        # expand CSR ranges to (batch_index, entity_id) pairs
+        batch_ids = torch.repeat_interleave(torch.arange(hrt_batch.shape[0], device=hrt_batch.device), counts)
+        group_start = torch.repeat_interleave(start - (torch.cumsum(counts, dim=0) - counts), counts)
+        positions = group_start + torch.arange(batch_ids.shape[0], device=hrt_batch.device)
+        return torch.stack([batch_ids, targets[positions]], dim=-1)
+
+
 def create_dense_positive_mask_(
     zero_tensor: torch.FloatTensor,
     filter_batch: torch.LongTensor,
@@ -534,6 +824,8 @@ def evaluate(
     additional_filter_triples: Union[None, MappedTriples, List[MappedTriples]] = None,
     pre_filtered_triples: bool = True,
     targets: Collection[Target] = (LABEL_HEAD, LABEL_TAIL),
+    num_workers: int = 0,
+    cache_representations: bool = True,
     *,
     mode: Optional[InductiveMode],
 ) -> MetricResults:
@@ -588,13 +880,23 @@ def evaluate(
         additional true triples to filter out during filtered evaluation.
     :param targets:
         the prediction targets
+    :param num_workers:
+        the number of worker processes. If positive, the evaluation triples are split into shards, which are
+        evaluated in parallel by a pool of worker processes sharing the model's memory. The workers' evaluator
+        states are merged into the given evaluator before finalization, cf. :meth:`Evaluator.merge_state_`.
+        Only supported for models on CPU. Ignored for size probing.
+    :param cache_representations:
+        whether to compute the representations of expensive representation modules, e.g., message passing, only once
+        for the whole evaluation rather than for every batch, cf. :func:`pykeen.nn.cached_representations`. Caching is
+        automatically disabled for representations whose cache would not fit into the available memory.
     :param mode:
         the inductive mode, or None for transductive evaluation
 
     :raises NotImplementedError:
         if relation prediction evaluation is requested
     :raises ValueError:
-        if the pre_filtered_triples contain unwanted entities (can only be detected with the time-consuming checks).
+        if the pre_filtered_triples contain unwanted entities (can only be detected with the time-consuming checks),
+        or if multi-process evaluation is requested for a model which is not on CPU.
 
     :return:
         the evaluation results
@@ -636,18 +938,23 @@ def evaluate(
     if device is not None:
         model = model.to(device)
     device = model.device
+    if num_workers > 0 and device.type != "cpu":
+        raise ValueError(f"Multi-process evaluation is only supported on CPU, but the model is on {device}.")
 
     # Ensure evaluation mode
     model.eval()
 
     # Prepare for result filtering
     if evaluator.filtered or evaluator.requires_positive_mask:
-        all_pos_triples = prepare_filter_triples(
-            mapped_triples=mapped_triples,
-            additional_filter_triples=additional_filter_triples,
-        ).to(device=device)
+        filter_index = PositiveFilterIndex(
+            all_pos_triples=prepare_filter_triples(
+                mapped_triples=mapped_triples,
+                additional_filter_triples=additional_filter_triples,
+            ).to(device=device),
+            num_relations=model.num_relations,
+        )
     else:
-        all_pos_triples = None
+        filter_index = None
 
     # Send tensors to device
     mapped_triples = mapped_triples.to(device=device)
@@ -674,32 +981,48 @@ def evaluate(
     )
     if tqdm_kwargs:
         _tqdm_kwargs.update(tqdm_kwargs)
-    with optional_context_manager(use_tqdm, tqdm(**_tqdm_kwargs)) as progress_bar, torch.inference_mode():
-        # batch-wise processing
-        for batch in mapped_triples.split(split_size=batch_size):
-            batch_size = batch.shape[0]
-            relation_filter = None
-            for target in targets:
-                relation_filter = _evaluate_batch(
-                    batch=batch,
-                    model=model,
-                    target=target,
-                    evaluator=evaluator,
-                    slice_size=slice_size,
-                    all_pos_triples=all_pos_triples,
-                    relation_filter=relation_filter,
-                    restrict_entities_to=restrict_entities_to,
-                    mode=mode,
-                )
+    # compute expensive representations only once, since the parameters do not change during evaluation
+    caching = optional_context_manager(cache_representations, cached_representations(model))
+    with optional_context_manager(use_tqdm, tqdm(**_tqdm_kwargs)) as progress_bar, torch.inference_mode(), caching:
+        if num_workers > 0 and not only_size_probing:
+            # shard-wise processing in worker processes
+            _evaluate_sharded(
+                mapped_triples=mapped_triples,
+                num_workers=num_workers,
+                progress_bar=progress_bar,
+                evaluator=evaluator,
+                model=model,
+                batch_size=batch_size,
+                targets=targets,
+                slice_size=slice_size,
+                filter_index=filter_index,
+                restrict_entities_to=restrict_entities_to,
+                mode=mode,
+            )
+        else:
+            # batch-wise processing
+            for batch in mapped_triples.split(split_size=batch_size):
+                batch_size = batch.shape[0]
+                for target in targets:
+                    _evaluate_batch(
+                        batch=batch,
+                        model=model,
+                        target=target,
+                        evaluator=evaluator,
+                        slice_size=slice_size,
+                        filter_index=filter_index,
+                        restrict_entities_to=restrict_entities_to,
+                        mode=mode,
+                    )
 
-            # If we only probe sizes we do not need more than one batch
-            if only_size_probing and evaluated_once:
-                break
+                # If we only probe sizes we do not need more than one batch
+                if only_size_probing and evaluated_once:
+                    break
 
-            evaluated_once = True
+                evaluated_once = True
 
-            if use_tqdm:
-                progress_bar.update(batch_size)
+                if use_tqdm:
+                    progress_bar.update(batch_size)
 
         # Finalize
         result = evaluator.finalize()
@@ -713,18 +1036,90 @@ def evaluate(
     return result
 
 
+#: the evaluation context of a worker process in multi-process evaluation, cf. :func:`_init_evaluation_worker`
+_WORKER_CONTEXT: Optional[Mapping[str, Any]] = None
+
+
+def _init_evaluation_worker(context: Mapping[str, Any], num_threads: int) -> None:
+    """Store the (shared-memory) evaluation context in a worker process."""
+    global _WORKER_CONTEXT
+    # avoid over-subscription of the CPU cores by the workers' intra-op parallelism
+    torch.set_num_threads(num_threads)
+    _WORKER_CONTEXT = context
+
+
+def _evaluate_shard(shard: MappedTriples) -> Tuple[int, Mapping[str, Any]]:
+    """Evaluate a shard of triples in a worker process, and return the number of triples and the evaluator's state."""
+    assert _WORKER_CONTEXT is not None
+    context = dict(_WORKER_CONTEXT)
+    evaluator: Evaluator = context.pop("evaluator")
+    batch_size: int = context.pop("batch_size")
+    targets: Collection[Target] = context.pop("targets")
+    evaluator.clear()
+    with torch.inference_mode():
+        for batch in shard.split(split_size=batch_size):
+            for target in targets:
+                _evaluate_batch(batch=batch, target=target, evaluator=evaluator, **context)
+    return shard.shape[0], evaluator.get_state()
+
+
+def _evaluate_sharded(
+    mapped_triples: MappedTriples,
+    num_workers: int,
+    progress_bar: Optional[tqdm],
+    evaluator: Evaluator,
+    model: Model,
+    batch_size: int,
+    targets: Collection[Target],
+    **kwargs,
+) -> None:
+    """
+    Evaluate shards of the triples in a pool of worker processes, and merge their states into the evaluator.
+
+    :param mapped_triples: shape: (n, 3)
+        the evaluation triples
+    :param num_workers:
+        the number of worker processes
+    :param progress_bar:
+        the progress bar to update, if any
+    :param evaluator:
+        the evaluator. Each worker receives a copy, whose state is merged into this evaluator.
+    :param model:
+        the model. Its parameters are moved to shared memory, such that they are not copied to the workers.
+    :param batch_size:
+        the batch size used by the workers
+    :param targets:
+        the prediction targets
+    :param kwargs:
+        additional keyword-based parameters passed to :func:`_evaluate_batch`
+    """
+    model.share_memory()
+    # use multiple shards per worker for load balancing, and a smooth progress bar
+    num_batches = ceil(mapped_triples.shape[0] / batch_size)
+    shard_size = batch_size * max(1, ceil(num_batches / (4 * num_workers)))
+    context = dict(evaluator=evaluator, model=model, batch_size=batch_size, targets=targets, **kwargs)
+    num_threads = max(1, torch.get_num_threads() // num_workers)
+    # note: forking a process with an initialized OpenMP thread pool may cause dead-locks
+    with torch.multiprocessing.get_context("spawn").Pool(
+        processes=num_workers, initializer=_init_evaluation_worker, initargs=(context, num_threads)
+    ) as pool:
+        for num_triples, state in pool.imap_unordered(_evaluate_shard, mapped_triples.split(split_size=shard_size)):
+            evaluator.merge_state_(state=state)
+            if progress_bar is not None:
+                progress_bar.update(num_triples)
+
+
 def _evaluate_batch(
     batch: MappedTriples,
     model: Model,
     target: Target,
     evaluator: Evaluator,
     slice_size: Optional[int],
-    all_pos_triples: Optional[MappedTriples],
-    relation_filter: Optional[torch.BoolTensor],
+    filter_index: Optional[PositiveFilterIndex],
     restrict_entities_to: Optional[torch.LongTensor],
     *,
     mode: Optional[InductiveMode],
-) -> torch.BoolTensor:
+) -> None:
     """
     Evaluate ranking for batch.
 
@@ -738,10 +1133,8 @@ def _evaluate_batch(
         The evaluator
     :param slice_size:
         An optional slice size for computing the scores.
-    :param all_pos_triples:
-        All positive triples (required if filtering is necessary).
-    :param relation_filter:
-        The relation filter. Can be re-used.
+    :param filter_index:
+        The index of all positive triples (required if filtering is necessary).
     :param restrict_entities_to:
         Restriction to evaluate only for these entities.
     :param mode:
@@ -749,29 +1142,21 @@ def _evaluate_batch(
 
     :raises ValueError:
         if all positive triples are required (either due to filtered evaluation, or requiring dense masks).
-
-    :return:
-        The relation filter, which can be re-used for the same batch.
     """
     scores = model.predict(hrt_batch=batch, target=target, slice_size=slice_size, mode=mode)
 
     if evaluator.filtered or evaluator.requires_positive_mask:
         column = TARGET_TO_INDEX[target]
-        if all_pos_triples is None:
+        if filter_index is None:
             raise ValueError(
-                "If filtering_necessary of positive_masks_required is True, all_pos_triples has to be "
+                "If filtering_necessary of positive_masks_required is True, filter_index has to be "
                 "provided, but is None."
             )
 
         # Create filter
-        positive_filter, relation_filter = create_sparse_positive_filter_(
-            hrt_batch=batch,
-            all_pos_triples=all_pos_triples,
-            relation_filter=relation_filter,
-            filter_col=column,
-        )
+        positive_filter = filter_index.lookup(hrt_batch=batch, filter_col=column)
     else:
-        positive_filter = relation_filter = None
+        positive_filter = None
 
     if evaluator.filtered:
         assert positive_filter is not None
@@ -808,8 +1193,6 @@ def _evaluate_batch(
         dense_positive_mask=positive_mask,
     )
 
-    return relation_filter
-
 
 def get_candidate_set_size(
     mapped_triples: MappedTriples,
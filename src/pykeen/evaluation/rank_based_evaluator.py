@@ -9,8 +9,10 @@ import math
 import random
 from collections import defaultdict
 from typing import (
+    Any,
     Callable,
     DefaultDict,
+    Dict,
     Iterable,
     List,
     Mapping,
@@ -264,6 +266,7 @@ class RankBasedEvaluator(Evaluator):
     num_entities: Optional[int]
     ranks: MutableMapping[Tuple[Target, RankType], List[np.ndarray]]
     num_candidates: MutableMapping[Target, List[np.ndarray]]
+    statistics: MutableMapping[Tuple[Target, RankType], Dict[str, torch.Tensor]]
 
     def __init__(
         self,
@@ -272,6 +275,7 @@ class RankBasedEvaluator(Evaluator):
         metrics_kwargs: OptionalKwargs = None,
         add_defaults: bool = True,
         clear_on_finalize: bool = True,
+        streaming: bool = False,
         **kwargs,
     ):
         """Initialize rank-based evaluator.
@@ -291,8 +295,16 @@ class RankBasedEvaluator(Evaluator):
             .. warning ::
                 disabling this option may lead to memory leaks and incorrect results when used from the pipeline
 
+        :param streaming:
+            whether to accumulate sufficient statistics of the ranks on the device, instead of storing all individual
+            ranks. This requires constant memory and makes the evaluator's buffers mergeable, but only supports metrics
+            which can be computed from sufficient statistics, cf. :attr:`RankBasedMetric.supports_streaming`. Default
+            metrics without support are skipped.
         :param kwargs:
             Additional keyword arguments that are passed to the base class.
+
+        :raises ValueError:
+            if streaming is enabled, and one of the explicitly requested metrics does not support it
         """
         super().__init__(
             filtered=filtered,
@@ -303,6 +315,11 @@ class RankBasedEvaluator(Evaluator):
             add_defaults = True
             metrics = []
         self.metrics = rank_based_metric_resolver.make_many(metrics, metrics_kwargs)
+        self.streaming = streaming
+        if streaming:
+            unsupported = [metric for metric in self.metrics if not metric.supports_streaming]
+            if unsupported:
+                raise ValueError(f"The following metrics do not support streaming: {unsupported}")
         if add_defaults:
             hits_at_k_keys = [rank_based_metric_resolver.normalize_cls(cls) for cls in HITS_METRICS]
             ks = (1, 3, 5, 10)
@@ -311,9 +328,13 @@ class RankBasedEvaluator(Evaluator):
             for hits_at_k_key in hits_at_k_keys:
                 metrics += [hits_at_k_key] * len(ks)
                 metrics_kwargs += [dict(k=k) for k in ks]
-            self.metrics.extend(rank_based_metric_resolver.make_many(metrics, metrics_kwargs))
+            default_metrics = rank_based_metric_resolver.make_many(metrics, metrics_kwargs)
+            if streaming:
+                default_metrics = [metric for metric in default_metrics if metric.supports_streaming]
+            self.metrics.extend(default_metrics)
         self.ranks = defaultdict(list)
         self.num_candidates = defaultdict(list)
+        self.statistics = defaultdict(dict)
         self.num_entities = None
         self.clear_on_finalize = clear_on_finalize
 
@@ -334,23 +355,102 @@ class RankBasedEvaluator(Evaluator):
             all_scores=scores,
         )
         self.num_entities = scores.shape[1]
+        if self.streaming:
+            for rank_type, v in batch_ranks.items():
+                self._update_statistics(
+                    key=(target, rank_type), ranks=v.detach(), num_candidates=batch_ranks.number_of_options
+                )
+            return
         for rank_type, v in batch_ranks.items():
             self.ranks[target, rank_type].append(v.detach().cpu().numpy())
         self.num_candidates[target].append(batch_ranks.number_of_options.detach().cpu().numpy())
 
+    def _update_statistics(
+        self, key: Tuple[Target, RankType], ranks: torch.FloatTensor, num_candidates: torch.LongTensor
+    ) -> None:
+        """Accumulate the metrics' sufficient statistics for a batch of ranks."""
+        # statistics of the same name are shared between metrics, and thus only accumulated once
+        batch_statistics: Dict[str, torch.Tensor] = dict()
+        for metric in self.metrics:
+            batch_statistics.update(metric.get_sufficient_statistics(ranks=ranks, num_candidates=num_candidates))
+        statistics = self.statistics[key]
+        for name, value in batch_statistics.items():
+            statistics[name] = statistics[name] + value if name in statistics else value
+
     # docstr-coverage: inherited
     def clear(self) -> None:  # noqa: D102
         self.ranks.clear()
         self.num_candidates.clear()
+        self.statistics.clear()
+
+    # docstr-coverage: inherited
+    def get_state(self) -> Mapping[str, Any]:  # noqa: D102
+        return dict(
+            streaming=self.streaming,
+            num_entities=self.num_entities,
+            ranks={key: list(ranks) for key, ranks in self.ranks.items()},
+            num_candidates={target: list(num_candidates) for target, num_candidates in self.num_candidates.items()},
+            statistics={
+                key: {name: value.cpu() for name, value in statistics.items()}
+                for key, statistics in self.statistics.items()
+            },
+        )
+
+    def merge_state_(self, state: Mapping[str, Any]) -> None:
+        """
+        Merge the state of another evaluator into this one's buffers (in-place).
+
+        :param state:
+            the other evaluator's state, cf. :meth:`get_state`. Has to use the same streaming mode.
+
+        :raises ValueError:
+            if the streaming mode of both evaluators differs
+        """
+        if self.streaming != state["streaming"]:
+            raise ValueError("Cannot merge evaluators with different streaming modes.")
+        for key, ranks in state["ranks"].items():
+            self.ranks[key].extend(ranks)
+        for target, num_candidates in state["num_candidates"].items():
+            self.num_candidates[target].extend(num_candidates)
+        for key, other_statistics in state["statistics"].items():
+            statistics = self.statistics[key]
+            for name, value in other_statistics.items():
+                statistics[name] = statistics[name] + value.to(statistics[name].device) if name in statistics else value
+        if self.num_entities is None:
+            self.num_entities = state["num_entities"]
+
+    def _finalize_streaming(self) -> RankBasedMetricResults:
+        """Compute the metrics from the accumulated sufficient statistics."""
+        sides = sorted({target for target, _ in self.statistics.keys()})
+        statistics: Dict[Tuple[ExtendedTarget, RankType], Mapping[str, np.ndarray]] = dict()
+        for rank_type in RANK_TYPES:
+            for side in sides:
+                statistics[side, rank_type] = {
+                    name: value.cpu().numpy() for name, value in self.statistics[side, rank_type].items()
+                }
+            # since the statistics are additive, the combined statistics are the sum of the individual sides'
+            statistics[SIDE_BOTH, rank_type] = {
+                name: sum(statistics[side, rank_type][name] for side in sides)
+                for name in statistics[sides[0], rank_type].keys()
+            }
+        return RankBasedMetricResults(
+            data={
+                (metric.key, side, rank_type): metric.from_sufficient_statistics(statistics=statistics[side, rank_type])
+                for metric, rank_type, side in itertools.product(self.metrics, RANK_TYPES, [*sides, SIDE_BOTH])
+            }
+        )
 
     # docstr-coverage: inherited
     def finalize(self) -> RankBasedMetricResults:  # noqa: D102
         if self.num_entities is None:
             raise ValueError
-        result = RankBasedMetricResults.from_ranks(
-            metrics=self.metrics,
-            rank_and_candidates=_iter_ranks(ranks=self.ranks, num_candidates=self.num_candidates),
-        )
+        if self.streaming:
+            result = self._finalize_streaming()
+        else:
+            result = RankBasedMetricResults.from_ranks(
+                metrics=self.metrics,
+                rank_and_candidates=_iter_ranks(ranks=self.ranks, num_candidates=self.num_candidates),
+            )
         if self.clear_on_finalize:
             self.clear()
         return result
@@ -365,7 +465,12 @@ class RankBasedEvaluator(Evaluator):
 
         :return:
             a flat dictionary from metric names to list of values
+
+        :raises ValueError:
+            if the evaluator is in streaming mode, i.e., did not store the individual ranks
         """
+        if self.streaming:
+            raise ValueError("Bootstrapping requires the individual ranks, which are not stored in streaming mode.")
         result: DefaultDict[str, List[float]] = defaultdict(list)
 
         for i in range(n_boot):
@@ -644,7 +749,12 @@ class MacroRankBasedEvaluator(RankBasedEvaluator):
 
         :param kwargs:
             additional keyword-based parameters passed to :meth:`RankBasedEvaluator.__init__`.
+
+        :raises ValueError:
+            if streaming is requested, since the macro weights depend on the frequencies over all evaluation triples
         """
+        if kwargs.get("streaming"):
+            raise ValueError(f"{self.__class__.__name__} does not support streaming.")
         super().__init__(**kwargs)
         self.keys = defaultdict(list)
 
@@ -691,6 +801,16 @@ class MacroRankBasedEvaluator(RankBasedEvaluator):
         super().clear()
         self.keys.clear()
 
+    # docstr-coverage: inherited
+    def get_state(self) -> Mapping[str, Any]:  # noqa: D102
+        return dict(super().get_state(), keys={target: list(keys) for target, keys in self.keys.items()})
+
+    # docstr-coverage: inherited
+    def merge_state_(self, state: Mapping[str, Any]) -> None:  # noqa: D102
+        super().merge_state_(state=state)
+        for target, keys in state["keys"].items():
+            self.keys[target].extend(keys)
+
     # docstr-coverage: inherited
     def finalize(self) -> RankBasedMetricResults:  # noqa: D102
         if self.num_entities is None:
@@ -86,9 +86,10 @@ density function of the standard Gaussian distribution to retrieve a *p*-value.
 """
 import math
 from abc import ABC, abstractmethod
-from typing import Callable, ClassVar, Collection, Iterable, NamedTuple, Optional, Tuple, Type, Union
+from typing import Callable, ClassVar, Collection, Dict, Iterable, Mapping, NamedTuple, Optional, Tuple, Type, Union
 
 import numpy as np
+import torch
 from class_resolver import ClassResolver, HintOrType
 from docdata import parse_docdata
 from scipy import stats
@@ -147,12 +148,82 @@ __all__ = [
     "generalized_harmonic_numbers",
     "AffineTransformationParameters",
     "harmonic_variances",
+    "rank_histogram",
+    "rank_histogram_median",
     #
     "HITS_METRICS",
 ]
 
 EPSILON = 1.0e-12
 
+#: ranks up to this value have their own bucket in the rank histogram, i.e., are represented exactly
+RANK_HISTOGRAM_EXACT_UPPER = 1024
+#: the relative accuracy of the rank histogram for ranks larger than :data:`RANK_HISTOGRAM_EXACT_UPPER`
+RANK_HISTOGRAM_RELATIVE_ACCURACY = 0.01
+#: the largest rank which can be represented by the rank histogram
+RANK_HISTOGRAM_MAX_RANK = 2**40
+
+_RANK_HISTOGRAM_GAMMA = (1 + RANK_HISTOGRAM_RELATIVE_ACCURACY) / (1 - RANK_HISTOGRAM_RELATIVE_ACCURACY)
+_RANK_HISTOGRAM_NUM_BUCKETS = (
+    2 * RANK_HISTOGRAM_EXACT_UPPER
+    + math.ceil(math.log(RANK_HISTOGRAM_MAX_RANK / RANK_HISTOGRAM_EXACT_UPPER) / math.log(_RANK_HISTOGRAM_GAMMA))
+    + 1
+)
+
+
+def rank_histogram(ranks: torch.Tensor) -> torch.LongTensor:
+    """
+    Compute a mergeable histogram of ranks, which allows to approximate quantiles with constant memory.
+
+    Since realistic ranks are multiples of 0.5, each such value up to :data:`RANK_HISTOGRAM_EXACT_UPPER` has its own
+    bucket. Larger ranks are assigned to logarithmically spaced buckets with bounded relative error, similar to
+    `DDSketch <https://arxiv.org/abs/1908.10693>`_. Since all histograms have the same buckets, they can be merged by
+    summation.
+
+    :param ranks: shape: s
+        the individual ranks
+
+    :return: shape: (num_buckets,)
+        the number of ranks in each bucket
+    """
+    upper = 2 * RANK_HISTOGRAM_EXACT_UPPER
+    doubled = torch.round(2 * ranks.double())
+    log_index = upper + torch.ceil(torch.log(doubled / upper) / math.log(_RANK_HISTOGRAM_GAMMA))
+    index = torch.where(doubled < upper, doubled, log_index).long().clamp(min=0, max=_RANK_HISTOGRAM_NUM_BUCKETS - 1)
+    return torch.bincount(index.view(-1), minlength=_RANK_HISTOGRAM_NUM_BUCKETS)
+
+
+def rank_histogram_median(histogram: np.ndarray) -> float:
+    """
+    Calculate the median from a rank histogram.
+
+    :param histogram: shape: (num_buckets,)
+        the rank histogram, cf. :func:`rank_histogram`
+
+    :return:
+        the median, which is exact if the middle ranks are at most :data:`RANK_HISTOGRAM_EXACT_UPPER`
+    """
+    upper = 2 * RANK_HISTOGRAM_EXACT_UPPER
+    # representative value for each bucket
+    values = np.concatenate(
+        [
+            np.arange(upper) / 2,
+            upper
+            * np.power(_RANK_HISTOGRAM_GAMMA, np.arange(_RANK_HISTOGRAM_NUM_BUCKETS - upper))
+            / (1 + _RANK_HISTOGRAM_GAMMA),
+        ]
+    )
+    cdf = np.cumsum(histogram)
+    n = cdf[-1]
+    # the (0-based) middle position(s) of the sorted ranks
+    lower, upper = values[np.searchsorted(cdf, [(n - 1) // 2, n // 2], side="right")]
+    return 0.5 * (lower + upper)
+
+
+def _as_statistic(x: Union[int, float, torch.Tensor], like: torch.Tensor) -> torch.Tensor:
+    """Convert a summed value to a statistic tensor, on the device of the ranks."""
+    return torch.as_tensor(x, dtype=torch.float64, device=like.device)
+
 
 def generate_ranks(
     num_candidates: np.ndarray,
@@ -221,6 +292,9 @@ class RankBasedMetric(Metric):
     #: whether the metric requires the number of candidates for each ranking task
     needs_candidates: ClassVar[bool] = False
 
+    #: whether the metric can be computed from additive sufficient statistics, cf. :meth:`get_sufficient_statistics`
+    supports_streaming: ClassVar[bool] = False
+
     @abstractmethod
     def __call__(
         self, ranks: np.ndarray, num_candidates: Optional[np.ndarray] = None, weights: Optional[np.ndarray] = None
@@ -237,6 +311,72 @@ class RankBasedMetric(Metric):
         """
         raise NotImplementedError
 
+    def get_sufficient_statistics(self, ranks: torch.Tensor, num_candidates: torch.Tensor) -> Dict[str, torch.Tensor]:
+        """
+        Compute sufficient statistics for a batch of ranks.
+
+        The statistics are additive, i.e., the statistics of multiple batches (or workers) are combined by summation,
+        and are computed on the device of the ranks. Statistics of the same name have the same meaning across all
+        metrics, and thus only need to be accumulated once.
+
+        :param ranks: shape: s
+            the individual ranks
+        :param num_candidates: shape: s
+            the number of candidates for each individual ranking task
+
+        :return:
+            a mapping from statistic names to (summed) values
+
+        :raises NotImplementedError:
+            if the metric does not support streaming computation
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support streaming computation.")
+
+    def from_sufficient_statistics(self, statistics: Mapping[str, np.ndarray]) -> float:
+        """
+        Evaluate the metric from accumulated sufficient statistics.
+
+        :param statistics:
+            the accumulated statistics, cf. :meth:`get_sufficient_statistics`
+
+        :return:
+            the metric value
+
+        :raises NotImplementedError:
+            if the metric does not support streaming computation
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support streaming computation.")
+
+    def expected_value_from_sufficient_statistics(self, statistics: Mapping[str, np.ndarray]) -> float:
+        """
+        Compute the expected value from accumulated sufficient statistics, cf. :meth:`expected_value`.
+
+        :param statistics:
+            the accumulated statistics, cf. :meth:`get_sufficient_statistics`
+
+        :return:
+            the expected value of this metric
+
+        :raises NoClosedFormError:
+            if the expected value cannot be computed from sufficient statistics
+        """
+        raise NoClosedFormError(f"{self.__class__.__name__} has no expected value from sufficient statistics.")
+
+    def variance_from_sufficient_statistics(self, statistics: Mapping[str, np.ndarray]) -> float:
+        """
+        Compute the variance from accumulated sufficient statistics, cf. :meth:`variance`.
+
+        :param statistics:
+            the accumulated statistics, cf. :meth:`get_sufficient_statistics`
+
+        :return:
+            the variance of this metric
+
+        :raises NoClosedFormError:
+            if the variance cannot be computed from sufficient statistics
+        """
+        raise NoClosedFormError(f"{self.__class__.__name__} has no variance from sufficient statistics.")
+
     def get_sampled_values(
         self,
         num_candidates: np.ndarray,
@@ -573,6 +713,30 @@ class DerivedRankBasedMetric(RankBasedMetric, ABC):
         parameters = self.get_coefficients(num_candidates=num_candidates, weights=weights)
         return parameters.scale * base_metric_result + parameters.offset
 
+    # docstr-coverage: inherited
+    def get_sufficient_statistics(
+        self, ranks: torch.Tensor, num_candidates: torch.Tensor
+    ) -> Dict[str, torch.Tensor]:  # noqa: D102
+        return self.base.get_sufficient_statistics(ranks=ranks, num_candidates=num_candidates)
+
+    # docstr-coverage: inherited
+    def from_sufficient_statistics(self, statistics: Mapping[str, np.ndarray]) -> float:  # noqa: D102
+        parameters = self.get_coefficients_from_sufficient_statistics(statistics=statistics)
+        return parameters.scale * self.base.from_sufficient_statistics(statistics=statistics) + parameters.offset
+
+    # docstr-coverage: inherited
+    def expected_value_from_sufficient_statistics(self, statistics: Mapping[str, np.ndarray]) -> float:  # noqa: D102
+        parameters = self.get_coefficients_from_sufficient_statistics(statistics=statistics)
+        return (
+            parameters.scale * self.base.expected_value_from_sufficient_statistics(statistics=statistics)
+            + parameters.offset
+        )
+
+    # docstr-coverage: inherited
+    def variance_from_sufficient_statistics(self, statistics: Mapping[str, np.ndarray]) -> float:  # noqa: D102
+        parameters = self.get_coefficients_from_sufficient_statistics(statistics=statistics)
+        return parameters.scale**2.0 * self.base.variance_from_sufficient_statistics(statistics=statistics)
+
     # docstr-coverage: inherited
     def expected_value(
         self,
@@ -624,6 +788,21 @@ class DerivedRankBasedMetric(RankBasedMetric, ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def get_coefficients_from_sufficient_statistics(
+        self, statistics: Mapping[str, np.ndarray]
+    ) -> AffineTransformationParameters:
+        """
+        Compute the scaling coefficients from accumulated sufficient statistics, cf. :meth:`get_coefficients`.
+
+        :param statistics:
+            the accumulated statistics, cf. :meth:`get_sufficient_statistics`
+
+        :return:
+            a tuple (scale, offset)
+        """
+        raise NotImplementedError
+
 
 class ZMetric(DerivedRankBasedMetric):
     r"""
@@ -661,8 +840,22 @@ class ZMetric(DerivedRankBasedMetric):
     def get_coefficients(
         self, num_candidates: np.ndarray, weights: Optional[np.ndarray] = None
     ) -> AffineTransformationParameters:  # noqa: D102
-        mean = self.base.expected_value(num_candidates=num_candidates, weights=weights)
-        std = self.base.std(num_candidates=num_candidates, weights=weights)
+        return self._get_coefficients(
+            mean=self.base.expected_value(num_candidates=num_candidates, weights=weights),
+            std=self.base.std(num_candidates=num_candidates, weights=weights),
+        )
+
+    # docstr-coverage: inherited
+    def get_coefficients_from_sufficient_statistics(
+        self, statistics: Mapping[str, np.ndarray]
+    ) -> AffineTransformationParameters:  # noqa: D102
+        return self._get_coefficients(
+            mean=self.base.expected_value_from_sufficient_statistics(statistics=statistics),
+            std=math.sqrt(self.base.variance_from_sufficient_statistics(statistics=statistics)),
+        )
+
+    def _get_coefficients(self, mean: float, std: float) -> AffineTransformationParameters:
+        """Compute the scaling coefficients from the base metric's expected value and standard deviation."""
         scale = _safe_divide(1.0, std)
         if not self.base.increasing:
             scale = -scale
@@ -719,6 +912,14 @@ class ExpectationNormalizedMetric(DerivedRankBasedMetric):
             scale=_safe_divide(1, self.base.expected_value(num_candidates=num_candidates, weights=weights))
         )
 
+    # docstr-coverage: inherited
+    def get_coefficients_from_sufficient_statistics(
+        self, statistics: Mapping[str, np.ndarray]
+    ) -> AffineTransformationParameters:  # noqa: D102
+        return AffineTransformationParameters(
+            scale=_safe_divide(1, self.base.expected_value_from_sufficient_statistics(statistics=statistics))
+        )
+
     # docstr-coverage: inherited
     def expected_value(
         self,
@@ -757,7 +958,17 @@ class ReindexedMetric(DerivedRankBasedMetric):
     def get_coefficients(
         self, num_candidates: np.ndarray, weights: Optional[np.ndarray] = None
     ) -> AffineTransformationParameters:  # noqa: D102
-        mean = self.base.expected_value(num_candidates=num_candidates, weights=weights)
+        return self._get_coefficients(mean=self.base.expected_value(num_candidates=num_candidates, weights=weights))
+
+    # docstr-coverage: inherited
+    def get_coefficients_from_sufficient_statistics(
+        self, statistics: Mapping[str, np.ndarray]
+    ) -> AffineTransformationParameters:  # noqa: D102
+        return self._get_coefficients(mean=self.base.expected_value_from_sufficient_statistics(statistics=statistics))
+
+    @staticmethod
+    def _get_coefficients(mean: float) -> AffineTransformationParameters:
+        """Compute the scaling coefficients from the base metric's expected value."""
         scale = _safe_divide(1.0, 1.0 - mean)
         offset = -scale * mean
         return AffineTransformationParameters(scale=scale, offset=offset)
@@ -824,6 +1035,7 @@ class ArithmeticMeanRank(RankBasedMetric):
     supports_weights: ClassVar[bool] = True
     closed_expectation: ClassVar[bool] = True
     closed_variance: ClassVar[bool] = True
+    supports_streaming: ClassVar[bool] = True
 
     # docstr-coverage: inherited
     def __call__(
@@ -855,6 +1067,31 @@ class ArithmeticMeanRank(RankBasedMetric):
         individual_variance = (num_candidates**2 - 1) / 12.0
         return weighted_mean_variance(individual=individual_variance, weights=weights)
 
+    # docstr-coverage: inherited
+    def get_sufficient_statistics(
+        self, ranks: torch.Tensor, num_candidates: torch.Tensor
+    ) -> Dict[str, torch.Tensor]:  # noqa: D102
+        num_candidates = num_candidates.double()
+        return dict(
+            count=_as_statistic(ranks.numel(), like=ranks),
+            rank_sum=ranks.double().sum(),
+            candidate_sum=num_candidates.sum(),
+            candidate_square_sum=num_candidates.square().sum(),
+        )
+
+    # docstr-coverage: inherited
+    def from_sufficient_statistics(self, statistics: Mapping[str, np.ndarray]) -> float:  # noqa: D102
+        return float(statistics["rank_sum"] / statistics["count"])
+
+    # docstr-coverage: inherited
+    def expected_value_from_sufficient_statistics(self, statistics: Mapping[str, np.ndarray]) -> float:  # noqa: D102
+        return float(0.5 * (statistics["candidate_sum"] / statistics["count"] + 1))
+
+    # docstr-coverage: inherited
+    def variance_from_sufficient_statistics(self, statistics: Mapping[str, np.ndarray]) -> float:  # noqa: D102
+        n = statistics["count"]
+        return float((statistics["candidate_square_sum"] - n) / (12.0 * n**2))
+
 
 @parse_docdata
 class ZArithmeticMeanRank(ZMetric):
@@ -869,6 +1106,7 @@ class ZArithmeticMeanRank(ZMetric):
     synonyms: ClassVar[Collection[str]] = ("zamr", "zmr")
     base_cls = ArithmeticMeanRank
     supports_weights: ClassVar[bool] = ArithmeticMeanRank.supports_weights
+    supports_streaming: ClassVar[bool] = ArithmeticMeanRank.supports_streaming
 
 
 @parse_docdata
@@ -885,6 +1123,7 @@ class InverseArithmeticMeanRank(RankBasedMetric):
     increasing = True
     synonyms: ClassVar[Collection[str]] = ("iamr",)
     supports_weights = True
+    supports_streaming = True
 
     # docstr-coverage: inherited
     def __call__(
@@ -892,6 +1131,16 @@ class InverseArithmeticMeanRank(RankBasedMetric):
     ) -> float:  # noqa: D102
         return np.reciprocal(np.average(np.asanyarray(ranks), weights=weights)).item()
 
+    # docstr-coverage: inherited
+    def get_sufficient_statistics(
+        self, ranks: torch.Tensor, num_candidates: torch.Tensor
+    ) -> Dict[str, torch.Tensor]:  # noqa: D102
+        return dict(count=_as_statistic(ranks.numel(), like=ranks), rank_sum=ranks.double().sum())
+
+    # docstr-coverage: inherited
+    def from_sufficient_statistics(self, statistics: Mapping[str, np.ndarray]) -> float:  # noqa: D102
+        return float(statistics["count"] / statistics["rank_sum"])
+
 
 @parse_docdata
 class GeometricMeanRank(RankBasedMetric):
@@ -953,6 +1202,7 @@ class GeometricMeanRank(RankBasedMetric):
     supports_weights = True
     closed_expectation: ClassVar[bool] = True
     closed_variance: ClassVar[bool] = True
+    supports_streaming = True
 
     # docstr-coverage: inherited
     def __call__(
@@ -960,6 +1210,16 @@ class GeometricMeanRank(RankBasedMetric):
     ) -> float:  # noqa: D102
         return stats.gmean(ranks, weights=weights).item()
 
+    # docstr-coverage: inherited
+    def get_sufficient_statistics(
+        self, ranks: torch.Tensor, num_candidates: torch.Tensor
+    ) -> Dict[str, torch.Tensor]:  # noqa: D102
+        return dict(count=_as_statistic(ranks.numel(), like=ranks), log_rank_sum=ranks.double().log().sum())
+
+    # docstr-coverage: inherited
+    def from_sufficient_statistics(self, statistics: Mapping[str, np.ndarray]) -> float:  # noqa: D102
+        return math.exp(statistics["log_rank_sum"] / statistics["count"])
+
     # docstr-coverage: inherited
     def expected_value(
         self,
@@ -1064,6 +1324,7 @@ class InverseGeometricMeanRank(RankBasedMetric):
     increasing = True
     synonyms: ClassVar[Collection[str]] = ("igmr",)
     supports_weights = True
+    supports_streaming = True
 
     # docstr-coverage: inherited
     def __call__(
@@ -1071,6 +1332,16 @@ class InverseGeometricMeanRank(RankBasedMetric):
     ) -> float:  # noqa: D102
         return np.reciprocal(stats.gmean(ranks, weights=weights)).item()
 
+    # docstr-coverage: inherited
+    def get_sufficient_statistics(
+        self, ranks: torch.Tensor, num_candidates: torch.Tensor
+    ) -> Dict[str, torch.Tensor]:  # noqa: D102
+        return dict(count=_as_statistic(ranks.numel(), like=ranks), log_rank_sum=ranks.double().log().sum())
+
+    # docstr-coverage: inherited
+    def from_sufficient_statistics(self, statistics: Mapping[str, np.ndarray]) -> float:  # noqa: D102
+        return math.exp(-statistics["log_rank_sum"] / statistics["count"])
+
 
 @parse_docdata
 class HarmonicMeanRank(RankBasedMetric):
@@ -1086,6 +1357,7 @@ class HarmonicMeanRank(RankBasedMetric):
     increasing = False
     synonyms: ClassVar[Collection[str]] = ("hmr",)
     supports_weights = True
+    supports_streaming = True
 
     # docstr-coverage: inherited
     def __call__(
@@ -1093,6 +1365,18 @@ class HarmonicMeanRank(RankBasedMetric):
     ) -> float:  # noqa: D102
         return weighted_harmonic_mean(a=ranks, weights=weights).item()
 
+    # docstr-coverage: inherited
+    def get_sufficient_statistics(
+        self, ranks: torch.Tensor, num_candidates: torch.Tensor
+    ) -> Dict[str, torch.Tensor]:  # noqa: D102
+        return dict(
+            count=_as_statistic(ranks.numel(), like=ranks), reciprocal_rank_sum=ranks.double().reciprocal().sum()
+        )
+
+    # docstr-coverage: inherited
+    def from_sufficient_statistics(self, statistics: Mapping[str, np.ndarray]) -> float:  # noqa: D102
+        return float(statistics["count"] / statistics["reciprocal_rank_sum"])
+
 
 def generalized_harmonic_numbers(n: int, p: float = -1.0) -> np.ndarray:
     r"""
@@ -1227,6 +1511,7 @@ class InverseHarmonicMeanRank(RankBasedMetric):
     supports_weights = True
     closed_expectation: ClassVar[bool] = True
     closed_variance: ClassVar[bool] = True
+    supports_streaming = True
 
     # docstr-coverage: inherited
     def __call__(
@@ -1261,6 +1546,34 @@ class InverseHarmonicMeanRank(RankBasedMetric):
         individual = harmonic_variances(n)[num_candidates - 1]
         return weighted_mean_variance(individual, weights)
 
+    # docstr-coverage: inherited
+    def get_sufficient_statistics(
+        self, ranks: torch.Tensor, num_candidates: torch.Tensor
+    ) -> Dict[str, torch.Tensor]:  # noqa: D102
+        # harmonic numbers H(n) and H_2(n) up to the largest number of candidates, cf. harmonic_variances
+        n = torch.arange(1, num_candidates.max().item() + 1, dtype=torch.float64, device=num_candidates.device)
+        h = n.reciprocal().cumsum(dim=0)
+        h2 = n.square().reciprocal().cumsum(dim=0)
+        index = num_candidates.long() - 1
+        return dict(
+            count=_as_statistic(ranks.numel(), like=ranks),
+            reciprocal_rank_sum=ranks.double().reciprocal().sum(),
+            mrr_expectation_sum=(h / n)[index].sum(),
+            mrr_variance_sum=((n * h2 - h.square()) / n.square()).clamp_min(0.0)[index].sum(),
+        )
+
+    # docstr-coverage: inherited
+    def from_sufficient_statistics(self, statistics: Mapping[str, np.ndarray]) -> float:  # noqa: D102
+        return float(statistics["reciprocal_rank_sum"] / statistics["count"])
+
+    # docstr-coverage: inherited
+    def expected_value_from_sufficient_statistics(self, statistics: Mapping[str, np.ndarray]) -> float:  # noqa: D102
+        return float(statistics["mrr_expectation_sum"] / statistics["count"])
+
+    # docstr-coverage: inherited
+    def variance_from_sufficient_statistics(self, statistics: Mapping[str, np.ndarray]) -> float:  # noqa: D102
+        return float(statistics["mrr_variance_sum"] / statistics["count"] ** 2)
+
 
 @parse_docdata
 class AdjustedInverseHarmonicMeanRank(ReindexedMetric):
@@ -1281,6 +1594,7 @@ class AdjustedInverseHarmonicMeanRank(ReindexedMetric):
     value_range = ValueRange(lower=None, lower_inclusive=False, upper=1, upper_inclusive=True)
     base_cls = InverseHarmonicMeanRank
     supports_weights: ClassVar[bool] = InverseHarmonicMeanRank.supports_weights
+    supports_streaming: ClassVar[bool] = InverseHarmonicMeanRank.supports_streaming
 
 
 @parse_docdata
@@ -1296,6 +1610,7 @@ class ZInverseHarmonicMeanRank(ZMetric):
     synonyms: ClassVar[Collection[str]] = ("zmrr", "zihmr")
     base_cls = InverseHarmonicMeanRank
     supports_weights: ClassVar[bool] = InverseHarmonicMeanRank.supports_weights
+    supports_streaming: ClassVar[bool] = InverseHarmonicMeanRank.supports_streaming
 
 
 @parse_docdata
@@ -1326,6 +1641,7 @@ class MedianRank(RankBasedMetric):
     value_range = ValueRange(lower=1, lower_inclusive=True, upper=math.inf)
     increasing = False
     supports_weights = True
+    supports_streaming = True
 
     # docstr-coverage: inherited
     def __call__(
@@ -1336,6 +1652,16 @@ class MedianRank(RankBasedMetric):
 
         return weighted_median(a=ranks, weights=weights).item()
 
+    # docstr-coverage: inherited
+    def get_sufficient_statistics(
+        self, ranks: torch.Tensor, num_candidates: torch.Tensor
+    ) -> Dict[str, torch.Tensor]:  # noqa: D102
+        return dict(rank_histogram=rank_histogram(ranks))
+
+    # docstr-coverage: inherited
+    def from_sufficient_statistics(self, statistics: Mapping[str, np.ndarray]) -> float:  # noqa: D102
+        return float(rank_histogram_median(statistics["rank_histogram"]))
+
 
 @parse_docdata
 class InverseMedianRank(RankBasedMetric):
@@ -1350,6 +1676,7 @@ class InverseMedianRank(RankBasedMetric):
     value_range = ValueRange(lower=0, lower_inclusive=False, upper=1, upper_inclusive=True)
     increasing = True
     supports_weights = True
+    supports_streaming = True
 
     # docstr-coverage: inherited
     def __call__(
@@ -1357,6 +1684,23 @@ class InverseMedianRank(RankBasedMetric):
     ) -> float:  # noqa: D102
         return np.reciprocal(weighted_median(a=ranks, weights=weights)).item()
 
+    # docstr-coverage: inherited
+    def get_sufficient_statistics(
+        self, ranks: torch.Tensor, num_candidates: torch.Tensor
+    ) -> Dict[str, torch.Tensor]:  # noqa: D102
+        return dict(rank_histogram=rank_histogram(ranks))
+
+    # docstr-coverage: inherited
+    def from_sufficient_statistics(self, statistics: Mapping[str, np.ndarray]) -> float:  # noqa: D102
+        return float(np.reciprocal(rank_histogram_median(statistics["rank_histogram"])))
+
+
+def _variance_from_sufficient_statistics(statistics: Mapping[str, np.ndarray]) -> float:
+    """Calculate the (population) variance of ranks from their count, sum and sum of squares."""
+    n = statistics["count"]
+    mean = statistics["rank_sum"] / n
+    return max(float(statistics["rank_square_sum"] / n - mean**2), 0.0)
+
 
 @parse_docdata
 class StandardDeviation(RankBasedMetric):
@@ -1370,6 +1714,7 @@ class StandardDeviation(RankBasedMetric):
     value_range = ValueRange(lower=0, lower_inclusive=True, upper=math.inf)
     increasing = False
     synonyms: ClassVar[Collection[str]] = ("rank_std", "std")
+    supports_streaming = True
 
     # docstr-coverage: inherited
     def __call__(
@@ -1377,6 +1722,21 @@ class StandardDeviation(RankBasedMetric):
     ) -> float:  # noqa: D102
         return np.asanyarray(ranks).std().item()
 
+    # docstr-coverage: inherited
+    def get_sufficient_statistics(
+        self, ranks: torch.Tensor, num_candidates: torch.Tensor
+    ) -> Dict[str, torch.Tensor]:  # noqa: D102
+        ranks = ranks.double()
+        return dict(
+            count=_as_statistic(ranks.numel(), like=ranks),
+            rank_sum=ranks.sum(),
+            rank_square_sum=ranks.square().sum(),
+        )
+
+    # docstr-coverage: inherited
+    def from_sufficient_statistics(self, statistics: Mapping[str, np.ndarray]) -> float:  # noqa: D102
+        return math.sqrt(_variance_from_sufficient_statistics(statistics=statistics))
+
 
 @parse_docdata
 class Variance(RankBasedMetric):
@@ -1390,6 +1750,7 @@ class Variance(RankBasedMetric):
     value_range = ValueRange(lower=0, lower_inclusive=True, upper=math.inf)
     increasing = False
     synonyms: ClassVar[Collection[str]] = ("rank_var", "var")
+    supports_streaming = True
 
     # docstr-coverage: inherited
     def __call__(
@@ -1397,6 +1758,21 @@ class Variance(RankBasedMetric):
     ) -> float:  # noqa: D102
         return np.asanyarray(ranks).var().item()
 
+    # docstr-coverage: inherited
+    def get_sufficient_statistics(
+        self, ranks: torch.Tensor, num_candidates: torch.Tensor
+    ) -> Dict[str, torch.Tensor]:  # noqa: D102
+        ranks = ranks.double()
+        return dict(
+            count=_as_statistic(ranks.numel(), like=ranks),
+            rank_sum=ranks.sum(),
+            rank_square_sum=ranks.square().sum(),
+        )
+
+    # docstr-coverage: inherited
+    def from_sufficient_statistics(self, statistics: Mapping[str, np.ndarray]) -> float:  # noqa: D102
+        return _variance_from_sufficient_statistics(statistics=statistics)
+
 
 @parse_docdata
 class MedianAbsoluteDeviation(RankBasedMetric):
@@ -1435,6 +1811,7 @@ class Count(RankBasedMetric):
     value_range = ValueRange(lower=0, lower_inclusive=True, upper=math.inf)
     increasing = False
     synonyms: ClassVar[Collection[str]] = ("rank_count",)
+    supports_streaming = True
 
     # docstr-coverage: inherited
     def __call__(
@@ -1443,6 +1820,16 @@ class Count(RankBasedMetric):
         # TODO: should we return the sum of weights?
         return float(np.asanyarray(ranks).size)
 
+    # docstr-coverage: inherited
+    def get_sufficient_statistics(
+        self, ranks: torch.Tensor, num_candidates: torch.Tensor
+    ) -> Dict[str, torch.Tensor]:  # noqa: D102
+        return dict(count=_as_statistic(ranks.numel(), like=ranks))
+
+    # docstr-coverage: inherited
+    def from_sufficient_statistics(self, statistics: Mapping[str, np.ndarray]) -> float:  # noqa: D102
+        return float(statistics["count"])
+
 
 @parse_docdata
 class HitsAtK(RankBasedMetric):
@@ -1510,6 +1897,7 @@ class HitsAtK(RankBasedMetric):
     supports_weights = True
     closed_expectation: ClassVar[bool] = True
     closed_variance: ClassVar[bool] = True
+    supports_streaming = True
 
     def __init__(self, k: int = 10) -> None:
         """
@@ -1564,6 +1952,30 @@ class HitsAtK(RankBasedMetric):
         individual_variance = p * (1 - p)
         return weighted_mean_variance(individual=individual_variance, weights=weights)
 
+    # docstr-coverage: inherited
+    def get_sufficient_statistics(
+        self, ranks: torch.Tensor, num_candidates: torch.Tensor
+    ) -> Dict[str, torch.Tensor]:  # noqa: D102
+        p = (self.k / num_candidates.double()).clamp_max(1.0)
+        return {
+            "count": _as_statistic(ranks.numel(), like=ranks),
+            f"hits_at_{self.k}": _as_statistic((ranks <= self.k).sum(), like=ranks),
+            f"hits_at_{self.k}_expectation_sum": p.sum(),
+            f"hits_at_{self.k}_variance_sum": (p * (1 - p)).sum(),
+        }
+
+    # docstr-coverage: inherited
+    def from_sufficient_statistics(self, statistics: Mapping[str, np.ndarray]) -> float:  # noqa: D102
+        return float(statistics[f"hits_at_{self.k}"] / statistics["count"])
+
+    # docstr-coverage: inherited
+    def expected_value_from_sufficient_statistics(self, statistics: Mapping[str, np.ndarray]) -> float:  # noqa: D102
+        return float(statistics[f"hits_at_{self.k}_expectation_sum"] / statistics["count"])
+
+    # docstr-coverage: inherited
+    def variance_from_sufficient_statistics(self, statistics: Mapping[str, np.ndarray]) -> float:  # noqa: D102
+        return float(statistics[f"hits_at_{self.k}_variance_sum"] / statistics["count"] ** 2)
+
 
 @parse_docdata
 class AdjustedHitsAtK(ReindexedMetric):
@@ -1592,6 +2004,7 @@ class AdjustedHitsAtK(ReindexedMetric):
     value_range = ValueRange(lower=None, lower_inclusive=False, upper=1, upper_inclusive=True)
     base_cls = HitsAtK
     supports_weights: ClassVar[bool] = HitsAtK.supports_weights
+    supports_streaming: ClassVar[bool] = HitsAtK.supports_streaming
 
 
 @parse_docdata
@@ -1610,6 +2023,7 @@ class ZHitsAtK(ZMetric):
     needs_candidates = True
     base_cls = HitsAtK
     supports_weights: ClassVar[bool] = HitsAtK.supports_weights
+    supports_streaming: ClassVar[bool] = HitsAtK.supports_streaming
 
 
 @parse_docdata
@@ -1632,6 +2046,7 @@ class AdjustedArithmeticMeanRank(ExpectationNormalizedMetric):
     increasing = False
     base_cls = ArithmeticMeanRank
     supports_weights: ClassVar[bool] = ArithmeticMeanRank.supports_weights
+    supports_streaming: ClassVar[bool] = ArithmeticMeanRank.supports_streaming
 
 
 @parse_docdata
@@ -1651,6 +2066,7 @@ class AdjustedArithmeticMeanRankIndex(ReindexedMetric):
     synonyms: ClassVar[Collection[str]] = ("adjusted_mean_rank_index", "amri", "aamri")
     base_cls = ArithmeticMeanRank
     supports_weights: ClassVar[bool] = ArithmeticMeanRank.supports_weights
+    supports_streaming: ClassVar[bool] = ArithmeticMeanRank.supports_streaming
 
 
 @parse_docdata
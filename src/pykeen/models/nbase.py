@@ -4,7 +4,9 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import pathlib
 from abc import ABC
 from collections import defaultdict
 from operator import itemgetter
@@ -32,11 +34,11 @@ from torch import nn
 from .base import Model
 from ..nn import representation_resolver
 from ..nn.modules import Interaction, interaction_resolver, parallel_unsqueeze
-from ..nn.representation import Representation
+from ..nn.representation import MemoryMappedRepresentation, Representation
 from ..regularizers import Regularizer, regularizer_resolver
 from ..triples import KGInfo
 from ..typing import HeadRepresentation, InductiveMode, RelationRepresentation, TailRepresentation
-from ..utils import check_shapes, get_batchnorm_modules
+from ..utils import NoRandomSeedNecessary, check_shapes, get_batchnorm_modules
 
 __all__ = [
     "_NewAbstractModel",
@@ -415,6 +417,99 @@ class ERModel(
             regularizer.add_parameter(parameter=param)
         self.weight_regularizers.append(regularizer)
 
+    def freeze(
+        self,
+        directory: Union[str, pathlib.Path],
+        dtype: torch.dtype = torch.float32,
+        batch_size: Optional[int] = None,
+    ) -> pathlib.Path:
+        """
+        Pre-compute all representations and store them together with the interaction into a directory.
+
+        The stored model can be loaded by :meth:`ERModel.from_frozen` for inference. Since the representations are
+        memory-mapped, loading is fast, and multiple processes loading the same directory share the same memory. This
+        is particularly useful for models whose representations are expensive to compute, e.g., message passing or
+        NodePiece representations.
+
+        .. warning ::
+            The interaction module is stored using :func:`torch.save`, i.e., via pickle. Only load frozen models from
+            trusted sources.
+
+        :param directory:
+            the output directory. Will be created if it does not exist.
+        :param dtype:
+            the (real) data type used to store the representations, e.g., `torch.float16` to halve the storage
+        :param batch_size:
+            the batch size to use for pre-computing representations, or None to compute all at once
+
+        :return:
+            the output directory
+        """
+        directory = pathlib.Path(directory).expanduser().resolve()
+        directory.mkdir(parents=True, exist_ok=True)
+        metadata: dict[str, Any] = dict(
+            num_entities=self.num_entities,
+            num_relations=self.num_real_relations,
+            create_inverse_triples=self.use_inverse_triples,
+            predict_with_sigmoid=self.predict_with_sigmoid,
+        )
+        for label, representations in (
+            ("entity", self.entity_representations),
+            ("relation", self.relation_representations),
+        ):
+            frozen = []
+            for i, representation in enumerate(representations):
+                path = directory.joinpath(f"{label}_representations_{i}.npy")
+                is_complex = MemoryMappedRepresentation.from_representation(
+                    representation, path=path, dtype=dtype, batch_size=batch_size
+                ).is_complex
+                frozen.append(dict(path=path.name, is_complex=is_complex))
+            metadata[f"{label}_representations"] = frozen
+        torch.save(self.interaction, directory.joinpath("interaction.pt"))
+        directory.joinpath("metadata.json").write_text(json.dumps(metadata, indent=2, sort_keys=True))
+        return directory
+
+    @staticmethod
+    def from_frozen(directory: Union[str, pathlib.Path], **kwargs) -> "ERModel":
+        """
+        Load a model stored by :meth:`ERModel.freeze`.
+
+        The returned model is a plain :class:`ERModel` with :class:`pykeen.nn.MemoryMappedRepresentation`
+        representations, i.e., it cannot be trained further, but produces the same scores as the original model.
+
+        :param directory:
+            the directory into which the model has been frozen
+        :param kwargs:
+            additional keyword-based parameters passed to :meth:`ERModel.__init__`
+
+        :return:
+            the frozen model, in evaluation mode
+        """
+        directory = pathlib.Path(directory).expanduser().resolve()
+        metadata = json.loads(directory.joinpath("metadata.json").read_text())
+        interaction = torch.load(directory.joinpath("interaction.pt"), weights_only=False)
+        # the model's constructor resets all parameters, including the interaction's
+        state = {key: value.clone() for key, value in interaction.state_dict().items()}
+        kwargs.setdefault("random_seed", NoRandomSeedNecessary)
+        for label in ("entity", "relation"):
+            stored = metadata[f"{label}_representations"]
+            kwargs[f"{label}_representations"] = [MemoryMappedRepresentation] * len(stored)
+            kwargs[f"{label}_representations_kwargs"] = [
+                dict(path=directory.joinpath(d["path"]), is_complex=d["is_complex"]) for d in stored
+            ]
+        model = ERModel(
+            triples_factory=KGInfo(
+                num_entities=metadata["num_entities"],
+                num_relations=metadata["num_relations"],
+                create_inverse_triples=metadata["create_inverse_triples"],
+            ),
+            interaction=interaction,
+            predict_with_sigmoid=metadata["predict_with_sigmoid"],
+            **kwargs,
+        )
+        model.interaction.load_state_dict(state)
+        return model.eval()
+
     def forward(
         self,
         h_indices: torch.LongTensor,
@@ -66,6 +66,7 @@ from .representation import (
     CombinedRepresentation,
     Embedding,
     LowRankRepresentation,
+    MemoryMappedRepresentation,
     PartitionRepresentation,
     Representation,
     SubsetRepresentation,
@@ -73,6 +74,7 @@ from .representation import (
     TextRepresentation,
     TransformedRepresentation,
     WikidataTextRepresentation,
+    cached_representations,
 )
 from .vision import VisualRepresentation, WikidataVisualRepresentation
 
@@ -84,6 +86,7 @@ __all__ = [
     "Embedding",
     "FeaturizedMessagePassingRepresentation",
     "LowRankRepresentation",
+    "MemoryMappedRepresentation",
     "NodePieceRepresentation",
     "PartitionRepresentation",
     "BackfillRepresentation",
@@ -103,6 +106,7 @@ __all__ = [
     "WikidataVisualRepresentation",
     "tokenizer_resolver",
     "representation_resolver",
+    "cached_representations",
     # INITIALIZER
     "init",
     # INTERACTIONS
@@ -5,7 +5,8 @@
 import functools
 import logging
 import math
-from typing import Any, Optional, Sequence
+import pathlib
+from typing import Any, Optional, Sequence, Union
 
 import numpy as np
 import torch
@@ -285,6 +286,7 @@ class LabelBasedInitializer(PretrainedInitializer):
         encoder: HintOrType[TextEncoder] = None,
         encoder_kwargs: OptionalKwargs = None,
         batch_size: Optional[int] = None,
+        cache_directory: Union[None, str, pathlib.Path] = None,
     ):
         """
         Initialize the initializer.
@@ -297,11 +299,14 @@ class LabelBasedInitializer(PretrainedInitializer):
             additional keyword-based parameters passed to the encoder
         :param batch_size: >0
             the (maximum) batch size to use while encoding. If None, use `len(labels)`, i.e., only a single batch.
+        :param cache_directory:
+            a directory for a persistent cache of label encodings, cf. :meth:`pykeen.nn.text.TextEncoder.encode_all`
         """
         super().__init__(
             tensor=text_encoder_resolver.make(encoder, encoder_kwargs).encode_all(
                 labels=labels,
                 batch_size=batch_size,
+                cache_directory=cache_directory,
             )
             # must be cloned if we want to do backprop
             .clone(),
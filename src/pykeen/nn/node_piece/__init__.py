@@ -32,6 +32,7 @@ Its usage is explained by passing the ``--help`` flag.
 
 from .anchor_search import (
     AnchorSearcher,
+    ChunkedBFSAnchorSearcher,
     CSGraphAnchorSearcher,
     PersonalizedPageRankAnchorSearcher,
     ScipySparseAnchorSearcher,
@@ -70,6 +71,7 @@ __all__ = [
     "ScipySparseAnchorSearcher",
     "SparseBFSSearcher",
     "CSGraphAnchorSearcher",
+    "ChunkedBFSAnchorSearcher",
     "PersonalizedPageRankAnchorSearcher",
     # Anchor Selection
     "anchor_selection_resolver",
@@ -2,9 +2,11 @@
 
 """Anchor search for NodePiece."""
 
+import functools
 import logging
+import multiprocessing
 from abc import ABC, abstractmethod
-from typing import Iterable, Optional
+from typing import Iterable, Optional, Tuple
 
 import numpy
 import scipy.sparse
@@ -27,6 +29,7 @@ __all__ = [
     "ScipySparseAnchorSearcher",
     "CSGraphAnchorSearcher",
     "SparseBFSSearcher",
+    "ChunkedBFSAnchorSearcher",
     "PersonalizedPageRankAnchorSearcher",
 ]
 
@@ -402,6 +405,170 @@ class SparseBFSSearcher(AnchorSearcher):
         return self.select(pool=pool, k=k)
 
 
+#: the adjacency matrix of a worker process in multi-process anchor search, cf. :func:`_init_anchor_search_worker`
+_ADJACENCY: Optional[scipy.sparse.spmatrix] = None
+
+
+def _init_anchor_search_worker(adjacency: scipy.sparse.spmatrix) -> None:
+    """Initialize a worker process for multi-process anchor search."""
+    global _ADJACENCY
+    _ADJACENCY = adjacency
+
+
+def _search_anchor_block(
+    block: Tuple[int, numpy.ndarray], max_iter: int, k: int
+) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """Search a block of anchors in a worker process."""
+    assert _ADJACENCY is not None
+    offset, anchors = block
+    return ChunkedBFSAnchorSearcher.bfs(anchors=anchors, adjacency=_ADJACENCY, max_iter=max_iter, k=k, offset=offset)
+
+
+class ChunkedBFSAnchorSearcher(AnchorSearcher):
+    r"""
+    Find closest anchors using breadth-first search over blocks of anchors.
+
+    In contrast to :class:`ScipySparseAnchorSearcher`, the anchors are processed in blocks of size `chunk_size`, and
+    only a running top-$k$ of the closest anchors and their distances are kept per entity. Thus, the memory
+    requirement is $\mathcal{O}(n \cdot (k + chunk\_size))$ rather than $\mathcal{O}(n \cdot a)$ for $n$ entities
+    and $a$ anchors. The blocks are independent, and can be searched by multiple worker processes.
+
+    Ties in the distance are broken by the anchor ID, such that the result does neither depend on the chunk size, nor
+    on the number of workers.
+    """
+
+    #: the distance marking unreachable anchors
+    unreachable: int = numpy.iinfo(numpy.uint8).max
+
+    def __init__(self, max_iter: int = 5, chunk_size: int = 32, num_workers: int = 0) -> None:
+        """
+        Initialize the searcher.
+
+        :param max_iter:
+            the maximum number of hops to consider
+        :param chunk_size:
+            the number of anchors to search at once
+        :param num_workers:
+            the number of worker processes. If 0, search in the main process.
+
+        :raises ValueError:
+            if `max_iter` exceeds the range of the distance data type
+        """
+        if max_iter >= self.unreachable:
+            raise ValueError(f"max_iter must be smaller than {self.unreachable}, but is {max_iter}")
+        self.max_iter = max_iter
+        self.chunk_size = chunk_size
+        self.num_workers = num_workers
+
+    # docstr-coverage: inherited
+    def iter_extra_repr(self) -> Iterable[str]:  # noqa: D102
+        yield from super().iter_extra_repr()
+        # note: the chunk size and the number of workers do not influence the result
+        yield f"max_iter={self.max_iter}"
+
+    @classmethod
+    def bfs(
+        cls,
+        anchors: numpy.ndarray,
+        adjacency: scipy.sparse.spmatrix,
+        max_iter: int,
+        k: int,
+        offset: int = 0,
+    ) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Determine the $k$ closest anchors from a block of anchors using breadth-first search.
+
+        :param anchors: shape: (b,)
+            the anchor node IDs of the block
+        :param adjacency: shape: (n, n)
+            the adjacency matrix, including self-loops, cf. :meth:`ScipySparseAnchorSearcher.create_adjacency`
+        :param max_iter:
+            the maximum number of hops to consider
+        :param k:
+            the number of closest anchors to keep
+        :param offset:
+            the ID of the first anchor in the block
+
+        :return: shape: (n, min(k, b)), each
+            the distances to the closest anchors, and their IDs
+        """
+        num_anchors = len(anchors)
+        # an array storing whether node i is reachable by anchor j
+        reachable = numpy.zeros(shape=(adjacency.shape[0], num_anchors), dtype=bool)
+        reachable[anchors, numpy.arange(num_anchors)] = True
+        distances = numpy.full(shape=reachable.shape, fill_value=cls.unreachable, dtype=numpy.uint8)
+        distances[reachable] = 0
+        for i in range(max_iter):
+            # propagate one hop; since the adjacency contains self-loops, reachable nodes stay reachable
+            new_reachable = adjacency.dot(reachable)
+            newly_reached = new_reachable & ~reachable
+            if not newly_reached.any():
+                break
+            distances[newly_reached] = i + 1
+            reachable = new_reachable
+            # all anchors which are not yet reachable are farther than the k closest ones
+            if (reachable.sum(axis=1) >= k).all():
+                break
+        ids = numpy.broadcast_to(numpy.arange(offset, offset + num_anchors), distances.shape)
+        return cls.select(distances=distances, ids=ids, k=k)
+
+    @staticmethod
+    def select(distances: numpy.ndarray, ids: numpy.ndarray, k: int) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Select the $k$ closest anchors.
+
+        :param distances: shape: (n, c)
+            the distances to the candidate anchors
+        :param ids: shape: (n, c)
+            the candidate anchor IDs, where, in case of ties, earlier candidates are preferred
+        :param k:
+            the number of anchors to select
+
+        :return: shape: (n, min(k, c)), each
+            the distances to the closest anchors, and their IDs
+        """
+        order = numpy.argsort(distances, axis=1, kind="stable")[:, :k]
+        return numpy.take_along_axis(distances, order, axis=1), numpy.take_along_axis(ids, order, axis=1)
+
+    # docstr-coverage: inherited
+    def __call__(
+        self, edge_index: numpy.ndarray, anchors: numpy.ndarray, k: int, num_entities: Optional[int] = None
+    ) -> numpy.ndarray:  # noqa: D102
+        adjacency = ScipySparseAnchorSearcher.create_adjacency(edge_index=edge_index, num_entities=num_entities)
+        # the running top-k
+        distances = numpy.full(shape=(adjacency.shape[0], k), fill_value=self.unreachable, dtype=numpy.uint8)
+        ids = numpy.full(shape=(adjacency.shape[0], k), fill_value=-1, dtype=int)
+        blocks = [
+            (start, anchors[start : start + self.chunk_size]) for start in range(0, len(anchors), self.chunk_size)
+        ]
+        progress = tqdm(blocks, desc="Anchor search", unit="block", unit_scale=True, leave=False)
+        if self.num_workers <= 0:
+            results: Iterable[Tuple[numpy.ndarray, numpy.ndarray]] = (
+                self.bfs(anchors=block, adjacency=adjacency, max_iter=self.max_iter, k=k, offset=offset)
+                for offset, block in progress
+            )
+            pool = None
+        else:
+            pool = multiprocessing.get_context("spawn").Pool(
+                processes=self.num_workers, initializer=_init_anchor_search_worker, initargs=(adjacency,)
+            )
+            # note: imap keeps the order of blocks, which is required for consistent tie-breaking
+            results = pool.imap(functools.partial(_search_anchor_block, max_iter=self.max_iter, k=k), progress)
+        try:
+            for block_distances, block_ids in results:
+                distances, ids = self.select(
+                    distances=numpy.concatenate([distances, block_distances], axis=1),
+                    ids=numpy.concatenate([ids, block_ids], axis=1),
+                    k=k,
+                )
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        ids[distances == self.unreachable] = -1
+        return ids
+
+
 class PersonalizedPageRankAnchorSearcher(AnchorSearcher):
     """
     Select closest anchors as the nodes with the largest personalized page rank.
@@ -2,11 +2,12 @@
 
 """Tokenization algorithms for NodePiece."""
 
+import hashlib
 import logging
 import pathlib
 from abc import abstractmethod
 from collections import defaultdict
-from typing import Collection, Mapping, Optional, Tuple
+from typing import Collection, Mapping, Optional, Tuple, Union
 
 import more_itertools
 import numpy
@@ -19,7 +20,7 @@ from .loader import PrecomputedTokenizerLoader, precomputed_tokenizer_loader_res
 from .utils import prepare_edges_for_metis, random_sample_no_replacement
 from ...constants import PYKEEN_MODULE
 from ...typing import DeviceHint, MappedTriples
-from ...utils import format_relative_comparison, get_edge_index, resolve_device
+from ...utils import format_relative_comparison, get_edge_index, resolve_device, write_atomically
 
 __all__ = [
     # Resolver
@@ -117,6 +118,7 @@ class AnchorTokenizer(Tokenizer):
         selection_kwargs: OptionalKwargs = None,
         searcher: HintOrType[AnchorSearcher] = None,
         searcher_kwargs: OptionalKwargs = None,
+        cache_directory: Union[None, str, pathlib.Path] = None,
     ) -> None:
         """
         Initialize the tokenizer.
@@ -129,9 +131,24 @@ class AnchorTokenizer(Tokenizer):
             the component for searching the closest anchors for each entity
         :param searcher_kwargs:
             additional keyword-based arguments passed to the searcher
+        :param cache_directory:
+            a directory to store the tokenization in, and to re-use it from, e.g., across multiple HPO trials. The
+            cached tokenization is identified by a hash of the edges, the number of tokens and entities, and the
+            configuration of the anchor selection and searcher. If None, do not cache.
+
+            .. warning ::
+                for randomized anchor selections, the cached tokenization is re-used irrespective of the random seed
         """
         self.anchor_selection = anchor_selection_resolver.make(selection, pos_kwargs=selection_kwargs)
         self.searcher = anchor_searcher_resolver.make(searcher, pos_kwargs=searcher_kwargs)
+        self.cache_directory = None if cache_directory is None else pathlib.Path(cache_directory)
+
+    def _get_cache_path(self, edge_index: numpy.ndarray, num_tokens: int, num_entities: int) -> pathlib.Path:
+        """Get the path of the cached tokenization."""
+        assert self.cache_directory is not None
+        digest = hashlib.sha512(numpy.ascontiguousarray(edge_index, dtype=numpy.int64).tobytes())
+        digest.update(f"{num_tokens}|{num_entities}|{self.anchor_selection!r}|{self.searcher!r}".encode("utf-8"))
+        return self.cache_directory.joinpath(f"{digest.hexdigest()[:32]}.pt")
 
     def _call(
         self,
@@ -140,6 +157,28 @@ class AnchorTokenizer(Tokenizer):
         num_entities: int,
     ) -> Tuple[int, torch.LongTensor]:
         edge_index = edge_index.numpy()
+        if self.cache_directory is None:
+            return self._tokenize(edge_index=edge_index, num_tokens=num_tokens, num_entities=num_entities)
+        path = self._get_cache_path(edge_index=edge_index, num_tokens=num_tokens, num_entities=num_entities)
+        if path.is_file():
+            logger.info(f"Loading cached anchor tokenization from {path}")
+            cached = torch.load(path)
+            return cached["vocabulary_size"], cached["tokens"]
+        vocabulary_size, tokens = self._tokenize(
+            edge_index=edge_index, num_tokens=num_tokens, num_entities=num_entities
+        )
+        # note: concurrent trials may use the same cache
+        write_atomically(path, lambda file: torch.save(dict(vocabulary_size=vocabulary_size, tokens=tokens), file))
+        logger.info(f"Cached anchor tokenization to {path}")
+        return vocabulary_size, tokens
+
+    def _tokenize(
+        self,
+        edge_index: numpy.ndarray,
+        num_tokens: int,
+        num_entities: int,
+    ) -> Tuple[int, torch.LongTensor]:
+        """Tokenize by selecting anchors, and searching the closest anchors for each entity."""
         # select anchors
         logger.info(f"Selecting anchors according to {self.anchor_selection}")
         anchors = self.anchor_selection(edge_index=edge_index)
@@ -4,13 +4,30 @@
 
 from __future__ import annotations
 
+import contextlib
 import itertools
 import logging
 import math
+import pathlib
 import string
 import warnings
 from abc import ABC, abstractmethod
-from typing import Any, ClassVar, Iterable, List, Literal, Mapping, Optional, Sequence, Tuple, Type, Union, cast
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 import more_itertools
 import numpy
@@ -40,6 +57,7 @@ from ..utils import (
     clamp_norm,
     complex_normalize,
     einsum,
+    get_available_memory,
     get_edge_index,
     get_preferred_device,
     upgrade_to_sequence,
@@ -49,6 +67,8 @@ __all__ = [
     "Representation",
     "Embedding",
     "LowRankRepresentation",
+    "MemoryMappedRepresentation",
+    "cached_representations",
     "CompGCNLayer",
     "CombinedCompGCNRepresentations",
     "PartitionRepresentation",
@@ -106,6 +126,14 @@ class Representation(nn.Module, ExtraReprMixin, ABC):
     #: dropout
     dropout: Optional[nn.Dropout]
 
+    # note: class-level defaults keep models pickled before the introduction of caching loadable
+    #: whether to serve representations from a cache of all representations in evaluation mode,
+    #: cf. :func:`cached_representations`
+    cache_enabled: bool = False
+
+    #: the cached representations for all indices, shape: (max_id, *shape)
+    _cache: Optional[torch.FloatTensor] = None
+
     def __init__(
         self,
         max_id: int,
@@ -176,13 +204,15 @@ class Representation(nn.Module, ExtraReprMixin, ABC):
         :return: shape: (``*s``, ``*self.shape``)
             The representations.
         """
+        if self.cache_enabled and not self.training:
+            # note: in evaluation mode, dropout is disabled, and regularizers are not updated
+            if self._cache is None:
+                self._cache = self._normalized_forward()
+            return self._cache if indices is None else self._cache[indices]
         inverse = None
         if indices is not None and self.unique:
             indices, inverse = indices.unique(return_inverse=True)
-        x = self._plain_forward(indices=indices)
-        # normalize *before* repeating
-        if self.normalizer is not None:
-            x = self.normalizer(x)
+        x = self._normalized_forward(indices=indices)
         # repeat if necessary
         if inverse is not None:
             x = x[inverse]
@@ -193,11 +223,33 @@ class Representation(nn.Module, ExtraReprMixin, ABC):
             x = self.dropout(x)
         return x
 
+    def _normalized_forward(self, indices: Optional[torch.LongTensor] = None) -> torch.FloatTensor:
+        """Get representations for indices, without applying regularization or output dropout."""
+        x = self._plain_forward(indices=indices)
+        # normalize *before* repeating
+        if self.normalizer is not None:
+            x = self.normalizer(x)
+        return x
+
+    def clear_cache(self) -> None:
+        """Invalidate the cached representations."""
+        self._cache = None
+
     def reset_parameters(self) -> None:
         """Reset the module's parameters."""
 
     def post_parameter_update(self):
         """Apply constraints which should not be included in gradients."""
+        # parameters have changed, and thus the cached representations are outdated
+        self.clear_cache()
+
+    # docstr-coverage: inherited
+    def train(self, mode: bool = True):  # noqa: D102
+        # the cache is only used in evaluation mode; hence, we invalidate it upon every mode switch
+        # note: e.g., Model.predict calls eval() for every batch, which should keep the cache
+        if mode != self.training:
+            self.clear_cache()
+        return super().train(mode=mode)
 
     def iter_extra_repr(self) -> Iterable[str]:
         """Iterate over components for :meth:`extra_repr`."""
@@ -404,6 +456,7 @@ class Embedding(Representation):
 
     # docstr-coverage: inherited
     def post_parameter_update(self):  # noqa: D102
+        super().post_parameter_update()
         # apply constraints in-place
         if self.constrainer is not None:
             x = self._plain_forward()
@@ -530,6 +583,196 @@ class LowRankRepresentation(Representation):
         return torch.tensordot(weight, bases, dims=([-1], [0]))
 
 
+class MemoryMappedRepresentation(Representation):
+    """
+    Fixed representations, which are memory-mapped from a ``.npy`` file.
+
+    The file is mapped copy-on-write, i.e., it is not modified, and multiple processes, e.g., serving workers, share
+    the same memory pages. Thus, loading is almost instantaneous, independent of the number of representations.
+    Representations may be stored in reduced precision, e.g., float16, and are converted to the default data type
+    upon lookup. Complex representations are stored as their real-valued view, i.e., with a trailing dimension of
+    size two.
+
+    .. seealso ::
+        :meth:`pykeen.models.ERModel.freeze`
+    """
+
+    #: the memory-mapped representations, shape: (max_id, *shape) or (max_id, *shape, 2) for complex representations
+    weight: torch.Tensor
+
+    def __init__(
+        self,
+        path: Union[str, pathlib.Path],
+        max_id: Optional[int] = None,
+        shape: Optional[OneOrSequence[int]] = None,
+        is_complex: bool = False,
+        **kwargs,
+    ):
+        """
+        Initialize the representations.
+
+        :param path:
+            the path to the ``.npy`` file
+        :param max_id:
+            the maximum ID (exclusively). If given, has to match the number of stored representations.
+        :param shape:
+            the shape of an individual representation. If given, has to match the shape of the stored representations.
+        :param is_complex:
+            whether the stored representations are the real-valued view of complex representations
+        :param kwargs:
+            additional keyword-based parameters passed to :meth:`Representation.__init__`
+
+        :raises ValueError:
+            if `max_id` does not match the number of stored representations
+        """
+        path = pathlib.Path(path)
+        weight = torch.from_numpy(numpy.load(path, mmap_mode="c"))
+        if max_id is not None and max_id != weight.shape[0]:
+            raise ValueError(f"{path} contains {weight.shape[0]} representations, but max_id={max_id}.")
+        actual_shape = weight.shape[1:-1] if is_complex else weight.shape[1:]
+        super().__init__(max_id=weight.shape[0], shape=ShapeError.verify(shape=actual_shape, reference=shape), **kwargs)
+        self.path = path
+        self.is_complex = is_complex
+        # note: the buffer is not persistent, to avoid copying it into state dicts
+        self.register_buffer(name="weight", tensor=weight, persistent=False)
+
+    @classmethod
+    def from_representation(
+        cls,
+        other: Representation,
+        path: Union[str, pathlib.Path],
+        dtype: torch.dtype = torch.float32,
+        batch_size: Optional[int] = None,
+        **kwargs,
+    ) -> "MemoryMappedRepresentation":
+        """
+        Pre-compute the representations of another representation module, and store them in a ``.npy`` file.
+
+        :param other:
+            the other representation. It is put into evaluation mode, e.g., to disable dropout.
+        :param path:
+            the path of the ``.npy`` file to write
+        :param dtype:
+            the (real) data type used for storage, e.g., `torch.float16` to halve the storage requirements
+        :param batch_size:
+            the number of representations to compute at once, or None to compute all at once
+        :param kwargs:
+            additional keyword-based parameters passed to :meth:`MemoryMappedRepresentation.__init__`
+
+        :return:
+            the memory-mapped representations
+        """
+        path = pathlib.Path(path)
+        batch_size = batch_size or other.max_id
+        other.eval()
+        is_complex = False
+        array = None
+        # note: we do not use inference mode, since some representations cache intermediate results
+        with torch.no_grad():
+            for start in range(0, other.max_id, batch_size):
+                indices = torch.arange(start, min(start + batch_size, other.max_id), device=other.device)
+                x = other(indices=indices)
+                is_complex = torch.is_complex(x)
+                if is_complex:
+                    x = torch.view_as_real(x)
+                x = x.to(dtype).cpu().numpy()
+                if array is None:
+                    # write directly into the file, without keeping all representations in memory
+                    array = numpy.lib.format.open_memmap(
+                        path, mode="w+", dtype=x.dtype, shape=(other.max_id,) + x.shape[1:]
+                    )
+                array[start : start + x.shape[0]] = x
+        if array is not None:
+            array.flush()
+        return cls(path=path, is_complex=is_complex, **kwargs)
+
+    def iter_extra_repr(self) -> Iterable[str]:  # noqa: D102
+        yield from super().iter_extra_repr()
+        yield f"path={self.path}"
+        yield f"is_complex={self.is_complex}"
+
+    # docstr-coverage: inherited
+    def _plain_forward(
+        self,
+        indices: Optional[torch.LongTensor] = None,
+    ) -> torch.FloatTensor:  # noqa: D102
+        x = self.weight if indices is None else self.weight[indices.to(self.weight.device)]
+        x = x.to(torch.get_default_dtype())
+        if self.is_complex:
+            x = torch.view_as_complex(x.contiguous())
+        return x
+
+
+def _estimate_cache_size(representation: Representation) -> int:
+    """Estimate the size of the cached representations in bytes."""
+    return representation.max_id * math.prod(representation.shape) * torch.finfo(torch.get_default_dtype()).bits // 8
+
+
+@contextlib.contextmanager
+def cached_representations(module: nn.Module, max_memory: Optional[int] = None) -> Iterator[List[Representation]]:
+    """
+    Compute the representations of expensive representation modules only once, and serve lookups from a cache.
+
+    Representations such as :class:`pykeen.nn.NodePieceRepresentation`, :class:`pykeen.nn.RGCNRepresentation`, or
+    :class:`pykeen.nn.TextRepresentation` compute the representations of all indices, e.g., by full-graph message
+    passing, on every call. While parameters do not change, e.g., during evaluation, we can instead compute all
+    representations once, and answer subsequent lookups by indexing.
+
+    The cache is only used in evaluation mode, and invalidated upon mode switches and
+    :meth:`Representation.post_parameter_update`. Plain :class:`Embedding` modules are not cached, since their lookup
+    is already cheap. Nested representations are only cached at the outermost level.
+
+    .. code-block:: python
+
+        from pykeen.nn import cached_representations
+
+        with cached_representations(model):
+            scores = model.predict_t(hr_batch)
+
+    :param module:
+        the module, e.g., a model, whose representation modules should be cached
+    :param max_memory:
+        the maximum memory in bytes to use for caching. If None, use the currently available memory on the respective
+        representation's device, if it can be determined. Representations whose cache would exceed the remaining
+        budget are not cached.
+
+    :yields: the representation modules for which caching has been enabled
+    """
+    candidates: Dict[str, Representation] = {}
+    for name, representation in module.named_modules():
+        if not isinstance(representation, Representation) or isinstance(representation, Embedding):
+            continue
+        # only cache the outermost representation
+        if any(prefix == "" or name.startswith(f"{prefix}.") for prefix in candidates):
+            continue
+        candidates[name] = representation
+    budgets: Dict[Optional[torch.device], Optional[int]] = {}
+    enabled: List[Representation] = []
+    for name, representation in candidates.items():
+        device = None if max_memory is not None else representation.device
+        if device not in budgets:
+            budgets[device] = max_memory if device is None else get_available_memory(device=device)
+        size = _estimate_cache_size(representation)
+        budget = budgets[device]
+        if budget is not None:
+            if size > budget:
+                logger.warning(
+                    f"Not caching {name or representation.__class__.__name__} since its {size:,} bytes would exceed "
+                    f"the remaining memory budget of {budget:,} bytes.",
+                )
+                continue
+            budgets[device] = budget - size
+        representation.clear_cache()
+        representation.cache_enabled = True
+        enabled.append(representation)
+    try:
+        yield enabled
+    finally:
+        for representation in enabled:
+            representation.cache_enabled = False
+            representation.clear_cache()
+
+
 def process_shape(
     dim: Optional[int],
     shape: Union[None, int, Sequence[int]],
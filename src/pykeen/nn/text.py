@@ -1,11 +1,15 @@
 """Modules for text encoding."""
 
 
+import hashlib
 import logging
+import pathlib
 import string
+import uuid
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Callable, Optional, Sequence, Union
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional, Sequence, Tuple, Union
 
+import numpy
 import torch
 from class_resolver import ClassResolver, Hint, HintOrType
 from class_resolver.contrib.torch import aggregation_resolver
@@ -14,7 +18,15 @@ from torch import nn
 from torch_max_mem import MemoryUtilizationMaximizer
 from tqdm.auto import tqdm
 
-from ..utils import get_preferred_device, resolve_device, upgrade_to_sequence
+from ..utils import (
+    get_preferred_device,
+    get_state_dict_hash,
+    normalize_path,
+    resolve_device,
+    upgrade_to_sequence,
+    write_atomically,
+)
+from ..version import VERSION
 
 if TYPE_CHECKING:
     from .representation import Representation
@@ -59,6 +71,127 @@ def _encode_all_memory_utilization_optimized(
     )
 
 
+def _encode_all_length_bucketed(
+    encoder: "TextEncoder",
+    labels: Sequence[str],
+    batch_size: Optional[int] = None,
+) -> torch.Tensor:
+    """
+    Encode labels in batches of similar length.
+
+    Since the labels are padded to the longest label in their batch, sorting them by length avoids to spend most
+    of the computation on padding for label sets with a long-tailed length distribution. The longest labels are
+    encoded first, such that an eventual batch size reduction happens early.
+
+    :param encoder:
+        the encoder
+    :param labels:
+        the labels to encode; should be unique
+    :param batch_size:
+        the batch size to use. If None, encode all labels in a single batch.
+
+    :return: shape: `(len(labels), dim)`
+        the encoded labels, in the order of the input
+    """
+    order = numpy.argsort(-encoder.get_lengths(labels), kind="stable")
+    x = _encode_all_memory_utilization_optimized(
+        encoder=encoder, labels=[labels[i] for i in order.tolist()], batch_size=batch_size or len(labels)
+    ).detach()
+    # scatter back to the original order
+    result = torch.empty_like(x)
+    result[torch.as_tensor(order, device=x.device)] = x
+    return result
+
+
+def _hash_texts(texts: Iterable[str]) -> numpy.ndarray:
+    """Hash texts to 64-bit keys."""
+    return numpy.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), byteorder="little")
+            for text in texts
+        ),
+        dtype=numpy.uint64,
+    )
+
+
+class _TextEncodingCache:
+    """
+    An on-disk cache of text encodings, addressed by the hash of the text.
+
+    The encodings are stored in chunks of ``<name>.npy`` files, which are memory-mapped when reading, and the keys,
+    i.e., the hashes of the texts, in ``<name>.keys.npy`` files. Since the keys are written last, a chunk without
+    keys file is incomplete, and ignored.
+    """
+
+    def __init__(self, directory: pathlib.Path) -> None:
+        """
+        Initialize the cache, and read all existing keys.
+
+        :param directory:
+            the directory of the cache; one directory should be used per encoder
+        """
+        self.directory = normalize_path(directory, mkdir=True)
+        self.chunks: List[numpy.ndarray] = []
+        keys, chunk_ids, rows = [], [], []
+        for path in sorted(self.directory.glob("*.keys.npy")):
+            chunk_keys = numpy.load(path)
+            keys.append(chunk_keys)
+            chunk_ids.append(numpy.full(chunk_keys.shape, fill_value=len(self.chunks)))
+            rows.append(numpy.arange(chunk_keys.shape[0]))
+            self.chunks.append(numpy.load(path.with_name(path.name[: -len(".keys.npy")] + ".npy"), mmap_mode="r"))
+        keys_ = numpy.concatenate(keys) if keys else numpy.empty(0, dtype=numpy.uint64)
+        order = numpy.argsort(keys_, kind="stable")
+        self.keys = keys_[order]
+        self.chunk_ids = numpy.concatenate(chunk_ids)[order] if keys else numpy.empty(0, dtype=int)
+        self.rows = numpy.concatenate(rows)[order] if keys else numpy.empty(0, dtype=int)
+
+    def lookup(self, keys: numpy.ndarray) -> numpy.ndarray:
+        """
+        Look up the position of keys in the cache.
+
+        :param keys: shape: (n,)
+            the keys
+
+        :return: shape: (n,)
+            the position of each key, or -1 if it is not contained
+        """
+        if self.keys.shape[0] == 0:
+            return numpy.full(keys.shape, fill_value=-1)
+        positions = numpy.searchsorted(self.keys, keys).clip(max=self.keys.shape[0] - 1)
+        return numpy.where(self.keys[positions] == keys, positions, -1)
+
+    def get(self, positions: numpy.ndarray) -> numpy.ndarray:
+        """
+        Read the encodings at the given positions.
+
+        :param positions: shape: (n,)
+            the positions, as returned by :meth:`lookup`
+
+        :return: shape: (n, dim)
+            the encodings
+        """
+        chunk_ids, rows = self.chunk_ids[positions], self.rows[positions]
+        result = numpy.empty((positions.shape[0],) + self.chunks[0].shape[1:], dtype=self.chunks[0].dtype)
+        for chunk_id in numpy.unique(chunk_ids).tolist():
+            mask = chunk_ids == chunk_id
+            result[mask] = self.chunks[chunk_id][rows[mask]]
+        return result
+
+    def add(self, keys: numpy.ndarray, encodings: numpy.ndarray) -> None:
+        """
+        Write a new chunk of encodings to the cache.
+
+        :param keys: shape: (n,)
+            the keys
+        :param encodings: shape: (n, dim)
+            the encodings
+        """
+        name = uuid.uuid4().hex
+        write_atomically(self.directory.joinpath(f"{name}.npy"), lambda file: numpy.save(file, encodings))
+        # the keys are written last, and thus mark the chunk as complete
+        write_atomically(self.directory.joinpath(f"{name}.keys.npy"), lambda file: numpy.save(file, keys))
+
+
 class TextEncoder(nn.Module):
     """An encoder for text."""
 
@@ -89,14 +222,51 @@ class TextEncoder(nn.Module):
         """
         raise NotImplementedError
 
+    def get_lengths(self, texts: Sequence[str]) -> numpy.ndarray:
+        """
+        Get the lengths of texts, which determine the amount of padding when encoding them together in a batch.
+
+        :param texts:
+            the texts
+
+        :return: shape: (len(texts),)
+            the lengths, by default the number of characters
+        """
+        return numpy.fromiter(map(len, texts), dtype=numpy.int64, count=len(texts))
+
+    def iter_cache_key_parts(self) -> Iterable[str]:
+        """
+        Iterate over all parts which determine the encodings, and thus identify the encoder in an encoding cache.
+
+        Subclasses should extend this with their configuration, which is not part of the state dict.
+
+        :yields: the parts, by default the PyKEEN version, the class name, and a hash of all parameters and buffers
+        """
+        yield VERSION
+        yield f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+        yield get_state_dict_hash(self)
+
+    def get_cache_key(self) -> str:
+        """Get a key identifying the encoder in an encoding cache, cf. :meth:`iter_cache_key_parts`."""
+        digest = hashlib.sha512()
+        for part in self.iter_cache_key_parts():
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()[:32]
+
     @torch.inference_mode()
     def encode_all(
         self,
         labels: Sequence[str],
         batch_size: Optional[int] = None,
+        cache_directory: Union[None, str, pathlib.Path] = None,
+        chunk_size: int = 65_536,
     ) -> torch.FloatTensor:
         """Encode all labels (inference mode & batched).
 
+        Identical labels are only encoded once, and the unique labels are batched by their length, cf.
+        :meth:`get_lengths`, to reduce the amount of padding.
+
         :param labels:
             a sequence of strings to encode
         :param batch_size:
@@ -106,13 +276,61 @@ class TextEncoder(nn.Module):
             Larger batch sizes increase memory requirements, but may be computationally
             more efficient. `batch_size` can also be set to `None` to enable automatic batch
             size maximization for the employed hardware.
+        :param cache_directory:
+            if given, a directory for a persistent, content-addressed cache of encodings. The encodings are stored in
+            a sub-directory identifying the encoder, cf. :meth:`get_cache_key`, and looked up by the hash of the
+            label, such that different label sets, e.g., across datasets, share the cache. New encodings are written
+            chunk by chunk. The cache may be shared by concurrent processes, e.g., multiple trials of a
+            hyper-parameter optimization.
+        :param chunk_size:
+            the number of new encodings per chunk written to the cache. Only used with a cache.
 
         :returns: shape: (len(labels), dim)
-            a tensor representing the encodings for all labels
+            a tensor representing the encodings for all labels. With a cache, the tensor is on the CPU.
         """
-        return _encode_all_memory_utilization_optimized(
-            encoder=self, labels=labels, batch_size=batch_size or len(labels)
-        ).detach()
+        # de-duplicate labels
+        labels = list(map(str, labels))
+        label_to_index = {label: i for i, label in enumerate(dict.fromkeys(labels))}
+        unique_labels = list(label_to_index)
+        inverse = torch.as_tensor([label_to_index[label] for label in labels], dtype=torch.long)
+
+        if cache_directory is None:
+            x = _encode_all_length_bucketed(encoder=self, labels=unique_labels, batch_size=batch_size)
+            return x[inverse.to(x.device)]
+
+        keys = _hash_texts(unique_labels)
+
+        cache = _TextEncodingCache(directory=normalize_path(cache_directory, self.get_cache_key()))
+        positions = cache.lookup(keys)
+        found = (positions >= 0).nonzero()[0]
+        missing = (positions < 0).nonzero()[0]
+        logger.info(
+            f"Found {found.shape[0]:,} of {len(unique_labels):,} unique labels ({len(labels):,} total) in the "
+            f"encoding cache at {cache.directory.as_uri()}",
+        )
+        parts: List[Tuple[numpy.ndarray, numpy.ndarray]] = []
+        if found.shape[0]:
+            parts.append((found, cache.get(positions[found])))
+        for chunk in chunked(missing, chunk_size):
+            chunk_indices = numpy.asarray(chunk)
+            chunk_encodings = (
+                _encode_all_length_bucketed(
+                    encoder=self,
+                    labels=[unique_labels[i] for i in chunk_indices.tolist()],
+                    batch_size=batch_size,
+                )
+                .cpu()
+                .numpy()
+            )
+            cache.add(keys=keys[chunk_indices], encodings=chunk_encodings)
+            parts.append((chunk_indices, chunk_encodings))
+
+        # assemble in the order of the unique labels, and expand to all labels
+        shape, dtype = parts[0][1].shape[1:], parts[0][1].dtype
+        result = numpy.empty((len(unique_labels),) + shape, dtype=dtype)
+        for part_indices, part_encodings in parts:
+            result[part_indices] = part_encodings
+        return torch.from_numpy(result)[inverse]
 
 
 class CharacterEmbeddingTextEncoder(TextEncoder):
@@ -178,6 +396,12 @@ class CharacterEmbeddingTextEncoder(TextEncoder):
             x = x.values
         return x
 
+    # docstr-coverage: inherited
+    def iter_cache_key_parts(self) -> Iterable[str]:  # noqa: D102
+        yield from super().iter_cache_key_parts()
+        yield self.vocabulary
+        yield repr(self.aggregation)
+
 
 class TransformerTextEncoder(TextEncoder):
     """A combination of a tokenizer and a model."""
@@ -217,6 +441,21 @@ class TransformerTextEncoder(TextEncoder):
         )
         self.max_length = max_length or 512
 
+    # docstr-coverage: inherited
+    def iter_cache_key_parts(self) -> Iterable[str]:  # noqa: D102
+        from transformers import __version__
+
+        yield from super().iter_cache_key_parts()
+        yield __version__
+        yield self.tokenizer.name_or_path
+        yield str(self.max_length)
+
+    # docstr-coverage: inherited
+    def get_lengths(self, texts: Sequence[str]) -> numpy.ndarray:  # noqa: D102
+        # note: (fast) tokenization is cheap compared to the forward pass through the model
+        input_ids = self.tokenizer(list(texts), truncation=True, max_length=self.max_length)["input_ids"]
+        return numpy.fromiter(map(len, input_ids), dtype=numpy.int64, count=len(texts))
+
     # docstr-coverage: inherited
     def forward_normalized(self, texts: Sequence[str]) -> torch.FloatTensor:  # noqa: D102
         return self.model(
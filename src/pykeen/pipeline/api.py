@@ -1291,6 +1291,15 @@ def _handle_evaluation(
         evaluation_fallback=evaluation_fallback,
     )
     evaluate_end_time = time.time() - evaluate_start_time
+    if evaluator_instance.predicted_peak_memory is not None:
+        _result_tracker.log_params(
+            params=dict(
+                batch_size=evaluator_instance.batch_size,
+                slice_size=evaluator_instance.slice_size,
+                predicted_peak_memory=evaluator_instance.predicted_peak_memory,
+            ),
+            prefix="evaluation_memory",
+        )
     step = training_kwargs.get("num_epochs")
     _result_tracker.log_metrics(metrics=dict(final_evaluation=evaluate_end_time), step=step, prefix="times")
     _result_tracker.log_metrics(
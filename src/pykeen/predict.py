@@ -110,6 +110,28 @@ the triples with the top $k$ scores. This can be done through the optional param
 
 >>> pack = predict_all(model=result.model, k=10)
 
+For models whose scores can be expressed as similarity between a query vector and the entity representations, e.g.,
+DistMult, ComplEx, TransE, or RotatE, the top $k$ triples can also be retrieved *without* scoring all triples by using a
+:class:`pykeen.predict.SimilarityIndex`. For other models, like the PairRE model above, we fall back to exhaustive
+scoring.
+
+>>> pack = predict_all(model=result.model, k=10, index=True)
+
+To re-use the index across multiple calls, it can be created explicitly with
+:meth:`pykeen.predict.SimilarityIndex.from_model`. Its parameter `num_probes` trades recall for speed; by default, an
+exact search is performed.
+
+For very large knowledge graphs, :func:`pykeen.predict.predict_all_sharded` partitions the prediction tasks into
+shards, and writes each shard's top $k$ (or all) triples and scores to a file in a directory as soon as it is completed.
+Thus, the results do not need to fit into memory, an interrupted run can be resumed by calling the function again with
+the same directory, and disjoint sets of shards can be calculated by separate processes, e.g., on different machines
+with a shared file system. Afterwards, the shards can be loaded and merged with
+:func:`pykeen.predict.load_sharded_predictions`
+
+>>> from pykeen.predict import load_sharded_predictions, predict_all_sharded
+>>> directory = predict_all_sharded(model=result.model, directory="predictions", k=10, num_shards=4)
+>>> pack = load_sharded_predictions(directory)
+
 We can again convert the score pack to a predictions object for further filtering, e.g., adding a column indicating
 whether the triple has been seen during training
 
@@ -138,6 +160,11 @@ prediction tasks are built lazily, i.e., only instantiating the prediction tasks
 accessed. Moreover, the :mod:`torch_max_mem` package is used to automatically tune the
 batch size to maximize the memory utilization of the hardware at hand.
 
+The prediction tasks of a batch are created at once by :meth:`pykeen.predict.PredictionDataset.get_batch`,
+optionally in background worker processes (``num_workers``) which prefetch upcoming batches. Moreover,
+with ``pipelined=True``, the consumers process the scores of one batch in background threads, while the scores
+of the next batch are calculated.
+
 For each batch, the scores of the prediction task are calculated once. Afterwards, multiple
 *consumers* can process these scores. A consumer extends :class:`pykeen.predict.ScoreConsumer`
 and receives the batch, i.e., input to the predict method, as well as the tensor of predicted scores.
@@ -151,6 +178,9 @@ Examples include
 - :class:`pykeen.predict.TopKScoreConsumer`: keeps only the top $k$ scores as well as the inputs
   leading to them. This is a memory-efficient variant of first accumulating all scores, then sorting by
   score and keeping only the top entries.
+- :class:`pykeen.predict.ThresholdScoreConsumer`: keeps only the triples whose score exceeds a threshold,
+  optionally only the top $k$ per prediction task, i.e., a sparse subset of all scores. To bound the memory
+  requirements during scoring, the collected triples can be spilled to disk.
 
 Potential Caveats
 =================
@@ -267,11 +297,17 @@ can be replaced by
 
 import collections
 import dataclasses
+import json
 import logging
 import math
+import pathlib
+import tempfile
+import time
+import uuid
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from operator import itemgetter
-from typing import Collection, Iterable, List, Mapping, Optional, Sequence, Tuple, Union, cast
+from typing import Collection, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union, cast
 
 import numpy
 import pandas
@@ -283,6 +319,8 @@ from typing_extensions import TypeAlias  # Python <=3.9
 
 from .constants import COLUMN_LABELS, TARGET_TO_INDEX
 from .models.base import Model
+from .models.nbase import ERModel
+from .nn.modules import ComplExInteraction, DistMultInteraction, RotatEInteraction, TransEInteraction
 from .triples import AnyTriples, CoreTriplesFactory, TriplesFactory, get_mapped_triples
 from .triples.utils import tensor_to_df
 from .typing import (
@@ -295,11 +333,22 @@ from .typing import (
     MappedTriples,
     Target,
 )
-from .utils import invert_mapping, isin_many_dim, resolve_device
+from .utils import (
+    ensure_complex,
+    get_state_dict_hash,
+    invert_mapping,
+    isin_many_dim,
+    negative_norm,
+    normalize_path,
+    resolve_device,
+    write_atomically,
+)
 
 __all__ = [
     # high-level
     "predict_all",
+    "predict_all_sharded",
+    "load_sharded_predictions",
     "predict_triples",
     "predict_target",
     # Low-Level
@@ -308,6 +357,7 @@ __all__ = [
     "CountScoreConsumer",
     "TopKScoreConsumer",
     "AllScoreConsumer",
+    "ThresholdScoreConsumer",
     "CountScoreConsumer",
     "ScorePack",
     "Predictions",
@@ -316,6 +366,7 @@ __all__ = [
     "PredictionDataset",
     "AllPredictionDataset",
     "PartiallyRestrictedPredictionDataset",
+    "SimilarityIndex",
 ]
 
 logger = logging.getLogger(__name__)
@@ -454,6 +505,22 @@ class ScorePack:
     #: the scores
     scores: torch.FloatTensor
 
+    def to_sparse(self, num_entities: int, num_relations: int) -> torch.Tensor:
+        """
+        Convert to a sparse COO tensor of all triples' scores, where all triples not in the pack are missing.
+
+        :param num_entities:
+            the number of entities
+        :param num_relations:
+            the number of relations
+
+        :return: shape: (num_entities, num_relations, num_entities)
+            a sparse tensor with the scores of the triples in the pack
+        """
+        return torch.sparse_coo_tensor(
+            indices=self.result.t(), values=self.scores, size=(num_entities, num_relations, num_entities)
+        ).coalesce()
+
     def process(self, factory: Optional[CoreTriplesFactory] = None, **kwargs) -> "TriplePredictions":
         """Start post-processing scores."""
         if factory is None:
@@ -593,6 +660,31 @@ def _get_input_batch(
 PredictionBatch: TypeAlias = torch.LongTensor
 
 
+def _combine_triples(batch: PredictionBatch, target: Target, ids: torch.LongTensor) -> MappedTriples:
+    """Combine the (fixed) columns of the input batch with the predicted IDs to triples.
+
+    :param batch: shape: (n, 2)
+        the input batch, i.e., the non-target columns
+    :param target:
+        the prediction target
+    :param ids: shape: (n,)
+        the predicted IDs for the target column
+
+    :return: shape: (n, 3)
+        the ID-based triples
+    """
+    j = 0
+    triples = []
+    for col in COLUMN_LABELS:
+        if col == target:
+            index = ids
+        else:
+            index = batch[:, j]
+            j += 1
+        triples.append(index)
+    return torch.stack(triples, dim=-1)
+
+
 class ScoreConsumer:
     """A consumer of scores for visitor pattern."""
 
@@ -685,20 +777,20 @@ class TopKScoreConsumer(ScoreConsumer):
             score_id = torch.arange(num_scores, device=batch.device).view(1, -1).repeat(batch_size, 1).view(-1)
 
         # combine to top triples
-        j = 0
-        triples = []
-        for col in COLUMN_LABELS:
-            if col == target:
-                index = score_id
-            else:
-                index = key_indices[:, j]
-                j += 1
-            triples.append(index)
-        top_triples = torch.stack(triples, dim=-1)
+        self.add(triples=_combine_triples(batch=key_indices, target=target, ids=score_id), scores=top_scores)
 
+    def add(self, triples: MappedTriples, scores: torch.FloatTensor) -> None:
+        """
+        Add scored triples, and keep only the top-k triples.
+
+        :param triples: shape: (n, 3)
+            the ID-based triples
+        :param scores: shape: (n,)
+            the triples' scores
+        """
         # append to global top scores
-        self.scores = torch.cat([self.scores, top_scores])
-        self.result = torch.cat([self.result, top_triples])
+        self.scores = torch.cat([self.scores, scores.to(self.scores.device)])
+        self.result = torch.cat([self.result, triples.to(self.result.device)])
 
         # reduce size if necessary
         if self.result.shape[0] > self.k:
@@ -754,6 +846,103 @@ class AllScoreConsumer(ScoreConsumer):
         self.scores[selectors[0], selectors[1], selectors[2]] = scores.to(self.scores.device)
 
 
+class ThresholdScoreConsumer(ScoreConsumer):
+    """Collect all triples with a score of at least a given threshold, optionally only the top k per task."""
+
+    flatten = False
+
+    def __init__(
+        self,
+        threshold: float,
+        k: Optional[int] = None,
+        max_in_memory: Optional[int] = None,
+        spill_directory: Union[None, str, pathlib.Path] = None,
+    ) -> None:
+        """
+        Initialize the consumer.
+
+        :param threshold:
+            the minimum score of triples to keep
+        :param k:
+            if given, keep only the top $k$ triples of each prediction task, e.g., each $(h, r)$ pair for tail
+            prediction, which exceed the threshold
+        :param max_in_memory:
+            the maximum number of triples to keep in memory. If more triples have been collected, they are spilled
+            to disk. None means no limit.
+        :param spill_directory:
+            the directory to spill to. If None, a temporary directory is created on first use, which is removed
+            after :meth:`finalize`. The spilled files are removed by :meth:`finalize`, too.
+        """
+        self.threshold = threshold
+        self.k = k
+        self.max_in_memory = max_in_memory
+        self.spill_directory = None if spill_directory is None else normalize_path(spill_directory, mkdir=True)
+        self._temporary_directory: Optional[tempfile.TemporaryDirectory] = None
+        self._results: List[torch.LongTensor] = []
+        self._scores: List[torch.FloatTensor] = []
+        self._num_in_memory = 0
+        self._spilled: List[pathlib.Path] = []
+
+    # docstr-coverage: inherited
+    def __call__(
+        self,
+        batch: PredictionBatch,
+        target: Target,
+        scores: torch.FloatTensor,
+    ) -> None:  # noqa: D102
+        if self.k is not None and self.k < scores.shape[1]:
+            scores, ids = scores.topk(k=self.k, dim=1, largest=True, sorted=False)
+            batch_id, column_id = (scores >= self.threshold).nonzero(as_tuple=True)
+            score_id = ids[batch_id, column_id]
+        else:
+            batch_id, column_id = (scores >= self.threshold).nonzero(as_tuple=True)
+            score_id = column_id
+        self._results.append(_combine_triples(batch=batch[batch_id], target=target, ids=score_id).cpu())
+        self._scores.append(scores[batch_id, column_id].cpu())
+        self._num_in_memory += batch_id.shape[0]
+        if self.max_in_memory is not None and self._num_in_memory > self.max_in_memory:
+            self._spill()
+
+    def _spill(self) -> None:
+        """Write the triples in memory to disk."""
+        if self.spill_directory is None:
+            self._temporary_directory = tempfile.TemporaryDirectory(prefix="pykeen-scores-")
+            self.spill_directory = pathlib.Path(self._temporary_directory.name)
+        # note: unique names, such that multiple consumers can share a spill directory
+        path = self.spill_directory.joinpath(f"spill-{uuid.uuid4().hex}.npz")
+        numpy.savez(path, result=torch.cat(self._results).numpy(), scores=torch.cat(self._scores).numpy())
+        self._spilled.append(path)
+        self._results.clear()
+        self._scores.clear()
+        self._num_in_memory = 0
+
+    def iter_chunks(self) -> Iterable[ScorePack]:
+        """
+        Iterate over the collected triples in chunks, without loading all of them into memory at once.
+
+        :yields: score packs of (unsorted) triples and scores; one per spilled file, and one for the triples in memory
+        """
+        for path in self._spilled:
+            with numpy.load(path) as arrays:
+                yield ScorePack(result=torch.from_numpy(arrays["result"]), scores=torch.from_numpy(arrays["scores"]))
+        if self._results:
+            yield ScorePack(result=torch.cat(self._results), scores=torch.cat(self._scores))
+
+    # docstr-coverage: inherited
+    def finalize(self) -> ScorePack:  # noqa: D102
+        chunks = list(self.iter_chunks())
+        self.result = torch.cat([chunk.result for chunk in chunks]) if chunks else torch.empty(0, 3, dtype=torch.long)
+        self.scores = torch.cat([chunk.scores for chunk in chunks]) if chunks else torch.empty(0)
+        # remove the spilled files, since their triples are now in memory
+        for path in self._spilled:
+            path.unlink()
+        self._spilled.clear()
+        if self._temporary_directory is not None:
+            self._temporary_directory.cleanup()
+            self._temporary_directory = self.spill_directory = None
+        return super().finalize()
+
+
 class PredictionDataset(torch.utils.data.Dataset):
     """A base class for prediction datasets."""
 
@@ -778,6 +967,20 @@ class PredictionDataset(torch.utils.data.Dataset):
     def __len__(self) -> int:  # noqa: D105
         raise NotImplementedError
 
+    def get_batch(self, indices: torch.LongTensor) -> PredictionBatch:
+        """
+        Get a batch of prediction tasks.
+
+        Subclasses are encouraged to override this method with a vectorized version.
+
+        :param indices: shape: (batch_size,)
+            the indices of the prediction tasks
+
+        :return: shape: (batch_size, 2)
+            the batch, i.e., the stacked results of :meth:`__getitem__`
+        """
+        return torch.stack([self[i] for i in indices.tolist()])
+
 
 class AllPredictionDataset(PredictionDataset):
     """A dataset for predicting all possible triples."""
@@ -811,6 +1014,10 @@ class AllPredictionDataset(PredictionDataset):
         quotient, remainder = divmod(item, self.divisor)
         return torch.as_tensor([quotient, remainder])
 
+    # docstr-coverage: inherited
+    def get_batch(self, indices: torch.LongTensor) -> PredictionBatch:  # noqa: D102
+        return torch.stack([torch.div(indices, self.divisor, rounding_mode="floor"), indices % self.divisor], dim=-1)
+
 
 Restriction = Union[torch.LongTensor, Collection[int], int]
 
@@ -903,6 +1110,92 @@ class PartiallyRestrictedPredictionDataset(PredictionDataset):
         remainder, quotient = divmod(item, len(self.parts[0]))
         return torch.as_tensor([self.parts[0][quotient], self.parts[1][remainder]])
 
+    # docstr-coverage: inherited
+    def get_batch(self, indices: torch.LongTensor) -> PredictionBatch:  # noqa: D102
+        n = len(self.parts[0])
+        return torch.stack(
+            [self.parts[0][indices % n], self.parts[1][torch.div(indices, n, rounding_mode="floor")]], dim=-1
+        )
+
+
+class _SubsetPredictionDataset(PredictionDataset):
+    """A contiguous range of the prediction tasks of another dataset."""
+
+    def __init__(self, base: PredictionDataset, start: int, stop: int) -> None:
+        """
+        Initialize the dataset.
+
+        :param base:
+            the base prediction dataset
+        :param start:
+            the index of the first prediction task
+        :param stop:
+            the index of the last prediction task (exclusive)
+        """
+        super().__init__(target=base.target)
+        self.base = base
+        self.start = start
+        self.stop = stop
+
+    # docstr-coverage: inherited
+    def __len__(self) -> int:  # noqa: D105
+        return self.stop - self.start
+
+    # docstr-coverage: inherited
+    def __getitem__(self, item: int) -> PredictionBatch:  # noqa: D105
+        return self.base[self.start + item]
+
+    # docstr-coverage: inherited
+    def get_batch(self, indices: torch.LongTensor) -> PredictionBatch:  # noqa: D102
+        return self.base.get_batch(indices + self.start)
+
+
+class _PredictionBatchDataset(torch.utils.data.Dataset):
+    """A dataset of consecutive batches of prediction tasks, such that each batch is created at once."""
+
+    def __init__(self, dataset: PredictionDataset, batch_size: int) -> None:
+        """
+        Initialize the dataset.
+
+        :param dataset:
+            the prediction dataset
+        :param batch_size:
+            the batch size
+        """
+        super().__init__()
+        self.dataset = dataset
+        self.batch_size = batch_size
+
+    def __len__(self) -> int:  # noqa: D105
+        return math.ceil(len(self.dataset) / self.batch_size)
+
+    def __getitem__(self, item: int) -> PredictionBatch:  # noqa: D105
+        start = item * self.batch_size
+        stop = min(start + self.batch_size, len(self.dataset))
+        return self.dataset.get_batch(torch.arange(start, stop))
+
+
+def _get_prediction_data_loader(
+    dataset: PredictionDataset,
+    batch_size: int,
+    num_workers: int = 0,
+    device: Optional[torch.device] = None,
+) -> torch.utils.data.DataLoader:
+    """Create a data loader of batches of prediction tasks, optionally prefetched by background workers."""
+    return torch.utils.data.DataLoader(
+        _PredictionBatchDataset(dataset=dataset, batch_size=batch_size),
+        # note: the batches are already created by the dataset
+        batch_size=None,
+        num_workers=num_workers,
+        pin_memory=num_workers > 0 and device is not None and device.type == "cuda",
+    )
+
+
+@torch.inference_mode()
+def _consume_batch(consumer: ScoreConsumer, batch: PredictionBatch, target: Target, scores: torch.FloatTensor) -> None:
+    """Consume scores in a background thread; inference mode is thread-local and thus has to be re-entered."""
+    consumer(batch, target=target, scores=scores)
+
 
 @torch.inference_mode()
 @maximize_memory_utilization(parameter_name="batch_size", keys=["model", "dataset", "consumers", "mode"])
@@ -912,6 +1205,8 @@ def consume_scores(
     *consumers: ScoreConsumer,
     batch_size: int = 1,
     mode: Optional[InductiveMode] = None,
+    num_workers: int = 0,
+    pipelined: bool = False,
 ) -> None:
     """
     Batch-wise calculation of all triple scores and consumption.
@@ -927,6 +1222,12 @@ def consume_scores(
 
     By bringing custom prediction datasets and/or score consumers, this method is highly configurable.
 
+    With ``num_workers > 0`` and ``pipelined=True``, the three stages run overlapped: the worker processes
+    create and prefetch the next batches, the main thread calculates scores, and each consumer processes the
+    previous batch's scores in its own background thread. Each consumer still receives the batches in order, and
+    at most one batch per consumer is processed at a time, such that the memory requirements increase by only
+    one batch of scores.
+
     :param model:
         the model used to calculate scores
     :param dataset:
@@ -938,6 +1239,11 @@ def consume_scores(
     :param mode:
         The pass mode, which is None in the transductive setting and one of "training",
         "validation", or "testing" in the inductive setting.
+    :param num_workers:
+        the number of worker processes which create and prefetch batches of prediction tasks. 0 creates them in the
+        main process.
+    :param pipelined:
+        whether to run the consumers in background threads, overlapping with the score calculation of the next batch
 
     :raises ValueError:
         if no score consumers are given
@@ -945,14 +1251,43 @@ def consume_scores(
     if not consumers:
         raise ValueError("Did not receive any consumer")
 
-    data_loader = torch.utils.data.DataLoader(dataset, batch_size=batch_size)
-    for batch in tqdm(data_loader, desc="scoring", unit="batch", unit_scale=True, leave=False):
-        batch = batch.to(model.device)
-        # calculate batch scores onces
-        scores = model.predict(batch, target=dataset.target, full_batch=False, mode=mode)
-        # consume by all consumers
-        for consumer in consumers:
-            consumer(batch, target=dataset.target, scores=scores)
+    data_loader = _get_prediction_data_loader(
+        dataset=dataset, batch_size=batch_size, num_workers=num_workers, device=model.device
+    )
+    executor = ThreadPoolExecutor(max_workers=len(consumers), thread_name_prefix="consume") if pipelined else None
+    # the pending consumption of the previous batch for each consumer
+    pending: Dict[int, Future] = {}
+    num_scores = 0
+    start = time.perf_counter()
+    progress = tqdm(data_loader, desc="scoring", unit="batch", unit_scale=True, leave=False)
+    try:
+        for batch in progress:
+            batch = batch.to(model.device, non_blocking=True)
+            # calculate batch scores onces
+            scores = model.predict(batch, target=dataset.target, full_batch=False, mode=mode)
+            num_scores += scores.numel()
+            # consume by all consumers
+            for i, consumer in enumerate(consumers):
+                if executor is None:
+                    consumer(batch, target=dataset.target, scores=scores)
+                    continue
+                # ensure that the batches are consumed in order, and propagate errors
+                if i in pending:
+                    pending[i].result()
+                pending[i] = executor.submit(_consume_batch, consumer, batch, dataset.target, scores)
+            progress.set_postfix(scores_per_second=f"{num_scores / (time.perf_counter() - start):.3g}")
+        for future in pending.values():
+            future.result()
+    finally:
+        if executor is not None:
+            # note: shutdown's cancel_futures requires Python 3.9+
+            for future in pending.values():
+                future.cancel()
+            executor.shutdown(wait=True)
+    elapsed = time.perf_counter() - start
+    logger.info(
+        f"Consumed {num_scores:,} scores in {elapsed:.2f} seconds ({num_scores / max(elapsed, 1.0e-08):,.0f} scores/s)."
+    )
 
 
 def _build_pack(result: torch.LongTensor, scores: torch.FloatTensor, flatten: bool = False) -> ScorePack:
@@ -962,6 +1297,350 @@ def _build_pack(result: torch.LongTensor, scores: torch.FloatTensor, flatten: bo
     return ScorePack(result=result, scores=scores)
 
 
+def _get_similarity_search_queries(
+    model: ERModel,
+    batch: PredictionBatch,
+    target: Target,
+    mode: Optional[InductiveMode],
+) -> torch.FloatTensor:
+    """
+    Calculate query vectors, such that the scores of all entities are a similarity to the entity representations.
+
+    .. note ::
+        The model has to be supported, cf. :meth:`SimilarityIndex.supports`.
+
+    :param model:
+        the model
+    :param batch: shape: (n, 2)
+        the prepared input batch, i.e., with internal relation IDs, cf. :meth:`Model._prepare_batch`
+    :param target:
+        the prediction target, either head or tail. Head predictions of models trained with inverse triples are
+        calculated via the tail predictions for the inverse triples, as in :meth:`Model.predict_h`.
+    :param mode:
+        the inductive mode, or None for transductive prediction
+
+    :return: shape: (n, d)
+        the real-valued query vectors
+    """
+    if target == LABEL_HEAD and model.use_inverse_triples:
+        batch, target = model._prepare_inverse_batch(batch=batch, index_relation=0), LABEL_TAIL
+    entity_representation = model._get_entity_representations_from_inductive_mode(mode=mode)[0]
+    if target == LABEL_TAIL:
+        e, r = entity_representation(indices=batch[:, 0]), model.relation_representations[0](indices=batch[:, 1])
+    else:
+        r, e = model.relation_representations[0](indices=batch[:, 0]), entity_representation(indices=batch[:, 1])
+    interaction = model.interaction
+    if isinstance(interaction, DistMultInteraction):
+        # <h, r, t> = <h * r, t> = <h, r * t>
+        return e * r
+    if isinstance(interaction, TransEInteraction):
+        # -|h + r - t| = -|(h + r) - t| = -|h - (t - r)|
+        return e + r if target == LABEL_TAIL else e - r
+    e, r = ensure_complex(e, r)
+    if isinstance(interaction, ComplExInteraction):
+        # Re(<h, r, conj(t)>) = <real(h * r), real(t)>, and Re(<h, r, conj(t)>) = <real(conj(r * conj(t)), real(h)>,
+        # where real(.) denotes the real-valued view of the complex vector
+        q = e * r if target == LABEL_TAIL else torch.conj(r * torch.conj(e))
+    else:
+        # RotatE: -|h * r - t| = -|h - conj(r) * t| for |r| = 1
+        q = e * r if target == LABEL_TAIL else e * torch.conj(r)
+    return torch.view_as_real(q.resolve_conj()).flatten(start_dim=-2)
+
+
+class SimilarityIndex:
+    """
+    An inverted file index for top-k search of entities via their representations.
+
+    For some interaction functions, e.g., DistMult, ComplEx, TransE, or RotatE, the scores of all entities for a given
+    query can be expressed as a similarity, i.e., inner product or negative distance, between a query vector and the
+    entity representations. Thus, the top-k entities can be found by (maximum inner product / nearest neighbor)
+    similarity search.
+
+    The entity representations are partitioned by $k$-means clustering into `num_lists` lists. For each query, only the
+    entities in the `num_probes` lists with the most similar centroids are scored. `num_probes` thus trades recall for
+    speed; probing all lists corresponds to an exact search.
+
+    .. code-block:: python
+
+        from pykeen.pipeline import pipeline
+        from pykeen.predict import SimilarityIndex, predict_all
+
+        result = pipeline(dataset="nations", model="distmult", training_kwargs=dict(num_epochs=0))
+        index = SimilarityIndex.from_model(model=result.model, num_probes=4)
+        pack = predict_all(model=result.model, k=10, index=index)
+    """
+
+    #: the entity representations, shape: (num_entities, dim)
+    keys: torch.FloatTensor
+
+    #: the cluster centroids, shape: (num_lists, dim)
+    centroids: torch.FloatTensor
+
+    #: the entity IDs sorted by list, shape: (num_entities,)
+    order: torch.LongTensor
+
+    #: the offsets of the lists in :attr:`order`, shape: (num_lists + 1,)
+    offsets: torch.LongTensor
+
+    def __init__(
+        self,
+        keys: torch.FloatTensor,
+        p: Union[None, int, float] = None,
+        power_norm: bool = False,
+        num_lists: Optional[int] = None,
+        num_probes: Optional[int] = None,
+        num_iterations: int = 10,
+        random_seed: Optional[int] = 42,
+    ) -> None:
+        """
+        Initialize the index.
+
+        :param keys: shape: (num_entities, dim)
+            the entity representations
+        :param p:
+            the p of the $p$-norm for distance-based similarity, or None for inner product similarity
+        :param power_norm:
+            whether to use the $p$-th power of the $p$-norm, cf. :func:`pykeen.utils.negative_norm`
+        :param num_lists:
+            the number of lists. Defaults to the square root of the number of entities.
+        :param num_probes:
+            the default number of lists to probe per query. Defaults to all lists, i.e., exact search.
+        :param num_iterations:
+            the number of $k$-means iterations
+        :param random_seed:
+            the random seed used for the initialization of the centroids
+        """
+        self.keys = keys
+        self.p = p
+        self.power_norm = power_norm
+        num_entities = keys.shape[0]
+        if num_lists is None:
+            num_lists = max(1, round(math.sqrt(num_entities)))
+        num_lists = min(num_lists, num_entities)
+        self.num_probes = num_lists if num_probes is None else num_probes
+
+        # k-means clustering, initialized with a random sample of the keys
+        generator = torch.Generator(device="cpu")
+        if random_seed is not None:
+            generator.manual_seed(random_seed)
+        centroids = keys[torch.randperm(num_entities, generator=generator)[:num_lists].to(keys.device)]
+        for _ in range(num_iterations):
+            assignment = self.similarity(keys, centroids).argmax(dim=1)
+            counts = torch.bincount(assignment, minlength=num_lists)
+            sums = torch.zeros_like(centroids).index_add_(0, assignment, keys)
+            # empty lists keep their previous centroid
+            non_empty = counts > 0
+            centroids[non_empty] = sums[non_empty] / counts[non_empty].unsqueeze(dim=-1).to(sums.dtype)
+        self.centroids = centroids
+        assignment = self.similarity(keys, centroids).argmax(dim=1)
+
+        # store lists in CSR format
+        self.order = torch.argsort(assignment)
+        self.offsets = torch.zeros(num_lists + 1, dtype=torch.long, device=keys.device)
+        self.offsets[1:] = torch.bincount(assignment, minlength=num_lists).cumsum(dim=0)
+
+    @property
+    def num_lists(self) -> int:
+        """Return the number of lists."""
+        return self.centroids.shape[0]
+
+    @staticmethod
+    def supports(model: Model) -> bool:
+        """Return whether the model's scores can be expressed as similarity to the entity representations."""
+        return (
+            isinstance(model, ERModel)
+            and len(model.entity_representations) == 1
+            and len(model.relation_representations) == 1
+            and isinstance(
+                model.interaction, (ComplExInteraction, DistMultInteraction, RotatEInteraction, TransEInteraction)
+            )
+        )
+
+    @classmethod
+    def from_model(cls, model: Model, mode: Optional[InductiveMode] = None, **kwargs) -> "SimilarityIndex":
+        """
+        Create an index over the entity representations of a model.
+
+        :param model:
+            the model, cf. :meth:`supports`
+        :param mode:
+            the inductive mode, or None for transductive prediction
+        :param kwargs:
+            additional keyword-based parameters passed to :meth:`SimilarityIndex.__init__`
+
+        :raises ValueError:
+            if the model's scores cannot be expressed as similarity
+
+        :return:
+            the index
+        """
+        if not cls.supports(model):
+            raise ValueError(f"{model} does not support similarity search.")
+        model = cast(ERModel, model)
+        interaction = model.interaction
+        if isinstance(interaction, TransEInteraction):
+            kwargs.update(p=interaction.p, power_norm=interaction.power_norm)
+        elif isinstance(interaction, RotatEInteraction):
+            kwargs.update(p=2, power_norm=False)
+        else:
+            kwargs.update(p=None, power_norm=False)
+        with torch.inference_mode():
+            keys = model._get_entity_representations_from_inductive_mode(mode=mode)[0](indices=None)
+            if isinstance(interaction, (ComplExInteraction, RotatEInteraction)):
+                keys = torch.view_as_real(next(ensure_complex(keys))).flatten(start_dim=-2)
+            return cls(keys=keys, **kwargs)
+
+    def similarity(self, queries: torch.FloatTensor, keys: torch.FloatTensor) -> torch.FloatTensor:
+        """
+        Calculate the similarity between all pairs of queries and keys.
+
+        :param queries: shape: (n, dim)
+            the query vectors
+        :param keys: shape: (m, dim)
+            the key vectors
+
+        :return: shape: (n, m)
+            the similarities
+        """
+        if self.p is None:
+            return queries @ keys.t()
+        distances = torch.cdist(queries, keys, p=self.p, compute_mode="donot_use_mm_for_euclid_dist")
+        return -(distances**self.p) if self.power_norm else -distances
+
+    def _paired_similarity(self, queries: torch.FloatTensor, keys: torch.FloatTensor) -> torch.FloatTensor:
+        """Calculate the similarity between aligned queries and keys."""
+        if self.p is None:
+            return (queries * keys).sum(dim=-1)
+        return negative_norm(queries - keys, p=self.p, power_norm=self.power_norm)
+
+    def search(
+        self, queries: torch.FloatTensor, k: int, num_probes: Optional[int] = None
+    ) -> Tuple[torch.FloatTensor, torch.LongTensor]:
+        """
+        Search the top-k entities for each query.
+
+        :param queries: shape: (n, dim)
+            the query vectors
+        :param k:
+            the number of entities to retrieve per query
+        :param num_probes:
+            the number of lists to probe, or None to use the index's default. If it is at least the number of
+            lists, an exact search is performed.
+
+        :return: shape: (n, k')
+            the scores and IDs of the top-k' entities, where k' = min(k, num_candidates). If less than k' candidates
+            are found for a query, the remaining entries are padded with a score of -inf and an ID of -1.
+        """
+        num_probes = self.num_probes if num_probes is None else num_probes
+        if num_probes >= self.num_lists:
+            scores = self.similarity(queries, self.keys)
+            return scores.topk(k=min(k, scores.shape[1]), dim=1)
+
+        # select the lists with the most similar centroids, shape: (n, num_probes)
+        probes = self.similarity(queries, self.centroids).topk(k=num_probes, dim=1).indices.view(-1)
+        lengths = self.offsets[probes + 1] - self.offsets[probes]
+
+        # enumerate the candidates of all probed lists, in order of queries
+        segment = torch.repeat_interleave(lengths)
+        within = torch.arange(segment.shape[0], device=segment.device) - (lengths.cumsum(dim=0) - lengths)[segment]
+        candidates = self.order[self.offsets[probes][segment] + within]
+        query_ids = torch.div(segment, num_probes, rounding_mode="floor")
+        candidate_scores = self._paired_similarity(queries[query_ids], self.keys[candidates])
+
+        # scatter into a padded matrix, shape: (n, max_num_candidates)
+        num_candidates = lengths.view(-1, num_probes).sum(dim=1)
+        column = torch.arange(segment.shape[0], device=segment.device)
+        column -= (num_candidates.cumsum(dim=0) - num_candidates)[query_ids]
+        width = max(1, num_candidates.max().item()) if num_candidates.numel() else 1
+        scores = queries.new_full((queries.shape[0], width), fill_value=float("-inf"))
+        scores[query_ids, column] = candidate_scores
+        ids = torch.full_like(scores, fill_value=-1, dtype=torch.long)
+        ids[query_ids, column] = candidates
+        scores, indices = scores.topk(k=min(k, width), dim=1)
+        return scores, ids.gather(dim=1, index=indices)
+
+    def predict(
+        self,
+        model: Model,
+        batch: PredictionBatch,
+        target: Target,
+        k: int,
+        num_probes: Optional[int] = None,
+        mode: Optional[InductiveMode] = None,
+    ) -> Tuple[torch.FloatTensor, torch.LongTensor]:
+        """
+        Predict the top-k entities for a batch, without scoring all entities.
+
+        :param model:
+            the model, which was used to create the index, cf. :meth:`from_model`
+        :param batch: shape: (n, 2)
+            the input batch, i.e., the non-target columns
+        :param target:
+            the prediction target, either head or tail
+        :param k:
+            the number of entities to retrieve per query
+        :param num_probes:
+            the number of lists to probe, or None to use the index's default
+        :param mode:
+            the inductive mode, or None for transductive prediction
+
+        :return: shape: (n, k')
+            the scores and IDs of the top-k' entities, cf. :meth:`search`
+        """
+        model.eval()
+        batch = model._prepare_batch(batch=batch, index_relation=0 if target == LABEL_HEAD else 1)
+        queries = _get_similarity_search_queries(model=cast(ERModel, model), batch=batch, target=target, mode=mode)
+        scores, ids = self.search(queries=queries, k=k, num_probes=num_probes)
+        if model.predict_with_sigmoid:
+            scores = torch.sigmoid(scores)
+        return scores, ids
+
+
+def _resolve_index(
+    index: Union[None, bool, SimilarityIndex],
+    model: Model,
+    target: Target,
+    k: Optional[int],
+    mode: Optional[InductiveMode],
+) -> Optional[SimilarityIndex]:
+    """Resolve the similarity index, and fall back to exhaustive scoring if it is not applicable."""
+    if index is None or index is False:
+        return None
+    if k is None or target == LABEL_RELATION or not SimilarityIndex.supports(model):
+        logger.warning(
+            f"Similarity search requires k, an entity prediction target, and a supported model, but got k={k}, "
+            f"target={target}, and {model.__class__.__name__}. Falling back to exhaustive scoring."
+        )
+        return None
+    if isinstance(index, SimilarityIndex):
+        return index
+    return SimilarityIndex.from_model(model=model, mode=mode)
+
+
+@torch.inference_mode()
+@maximize_memory_utilization(parameter_name="batch_size", keys=["model", "dataset", "consumer", "index", "mode"])
+def _consume_index(
+    model: Model,
+    dataset: PredictionDataset,
+    consumer: TopKScoreConsumer,
+    index: SimilarityIndex,
+    batch_size: int = 1,
+    num_probes: Optional[int] = None,
+    mode: Optional[InductiveMode] = None,
+) -> None:
+    """Batch-wise retrieval of the top-k targets with a similarity index, cf. :func:`consume_scores`."""
+    data_loader = _get_prediction_data_loader(dataset=dataset, batch_size=batch_size)
+    for batch in tqdm(data_loader, desc="searching", unit="batch", unit_scale=True, leave=False):
+        batch = batch.to(model.device)
+        scores, ids = index.predict(
+            model=model, batch=batch, target=dataset.target, k=consumer.k, num_probes=num_probes, mode=mode
+        )
+        # drop padding
+        mask = ids >= 0
+        batch = batch.unsqueeze(dim=1).expand(-1, ids.shape[1], -1)[mask]
+        consumer.add(triples=_combine_triples(batch=batch, target=dataset.target, ids=ids[mask]), scores=scores[mask])
+
+
 @maximize_memory_utilization(keys=["model"])
 def _predict_triples_batched(
     model: Model,
@@ -989,6 +1668,12 @@ def predict_all(
     batch_size: Optional[int] = 1,
     mode: Optional[InductiveMode] = None,
     target: Target = LABEL_TAIL,
+    index: Union[None, bool, SimilarityIndex] = None,
+    num_probes: Optional[int] = None,
+    num_workers: int = 0,
+    pipelined: bool = False,
+    threshold: Optional[float] = None,
+    k_per_task: Optional[int] = None,
 ) -> ScorePack:
     """Calculate scores for all triples, and either keep all of them or only the top k triples.
 
@@ -1004,29 +1689,271 @@ def predict_all(
     :param target:
         the prediction target to use. Prefer targets which are efficient to predict with the given model,
         e.g., tails for ConvE.
+    :param index:
+        a similarity index to retrieve the top k triples without scoring all triples, cf. :class:`SimilarityIndex`.
+        If True, a new index is created from the model. Falls back to exhaustive scoring, if k is None, the target
+        is the relation, or the model does not support similarity search.
+    :param num_probes:
+        the number of lists the index probes per query, or None to use the index's default. Smaller values are
+        faster, but may have lower recall.
+    :param num_workers:
+        the number of worker processes which create and prefetch batches, cf. :func:`consume_scores`
+    :param pipelined:
+        whether to overlap the score calculation with the consumption of the previous batch's scores,
+        cf. :func:`consume_scores`
+    :param threshold:
+        if given, only keep triples with a score of at least this value. Without $k$, the triples are collected
+        sparsely by a :class:`ThresholdScoreConsumer`, instead of scoring all triples into a dense tensor. To bound
+        the memory while collecting, use :func:`consume_scores` with a :class:`ThresholdScoreConsumer` and its
+        ``max_in_memory`` directly, and stream the results via :meth:`ThresholdScoreConsumer.iter_chunks`.
+    :param k_per_task:
+        if given, only keep the top $k$ triples of each prediction task, e.g., each $(h, r)$ pair for tail
+        prediction, which exceed the threshold (if any). If $k$ is given, too, the $k$ highest scoring of these
+        triples are returned.
 
     :return:
         A score pack of parallel triples and scores
     """
     # note: the models' predict method takes care of setting the model to evaluation mode
+    dataset = AllPredictionDataset(
+        num_entities=model.num_entities, num_relations=model.num_real_relations, target=target
+    )
+    # note: the index only supports the global top k
+    resolved_index = (
+        None if k_per_task is not None else _resolve_index(index=index, model=model, target=target, k=k, mode=mode)
+    )
+    if resolved_index is not None:
+        assert k is not None
+        consumer = TopKScoreConsumer(k=k, device=model.device)
+        _consume_index(
+            model=model,
+            dataset=dataset,
+            consumer=consumer,
+            index=resolved_index,
+            batch_size=batch_size or len(dataset),
+            num_probes=num_probes,
+            mode=mode,
+        )
+        return _filter_pack(pack=consumer.finalize(), threshold=threshold)
+
     logger.warning(
         f"predict is an expensive operation, involving {model.num_entities ** 2 * model.num_real_relations:,} "
         f"score evaluations.",
     )
 
     consumer: ScoreConsumer
-    if k is None:
+    if k_per_task is not None:
+        consumer = ThresholdScoreConsumer(threshold=float("-inf") if threshold is None else threshold, k=k_per_task)
+    elif k is None and threshold is not None:
+        consumer = ThresholdScoreConsumer(threshold=threshold)
+    elif k is None:
         logger.warning(
             "Not providing k to `predict_all` entails huge memory requirements for reasonably-sized knowledge graphs.",
         )
         consumer = AllScoreConsumer(num_entities=model.num_entities, num_relations=model.num_relations)
     else:
         consumer = TopKScoreConsumer(k=k, device=model.device)
+    consume_scores(
+        model,
+        dataset,
+        consumer,
+        batch_size=batch_size or len(dataset),
+        mode=mode,
+        num_workers=num_workers,
+        pipelined=pipelined,
+    )
+    pack = _filter_pack(pack=consumer.finalize(), threshold=threshold)
+    if k_per_task is not None and k is not None:
+        # note: the pack is sorted by decreasing score
+        pack = ScorePack(result=pack.result[:k], scores=pack.scores[:k])
+    return pack
+
+
+def _filter_pack(pack: ScorePack, threshold: Optional[float]) -> ScorePack:
+    """Keep only the triples with a score of at least the threshold."""
+    if threshold is None:
+        return pack
+    mask = pack.scores >= threshold
+    return ScorePack(result=pack.result[mask], scores=pack.scores[mask])
+
+
+#: the name of the file storing the configuration of sharded predictions
+SHARD_METADATA_FILE_NAME = "metadata.json"
+
+
+def _get_shard_path(directory: pathlib.Path, shard: int) -> pathlib.Path:
+    """Get the path of a shard's result file."""
+    return directory.joinpath(f"shard-{shard:06d}.npz")
+
+
+def _get_shard_bounds(num_tasks: int, num_shards: int) -> List[int]:
+    """Split the prediction tasks into (almost) equally sized contiguous shards."""
+    return numpy.linspace(0, num_tasks, num_shards + 1).round().astype(int).tolist()
+
+
+def predict_all_sharded(
+    model: Model,
+    directory: Union[str, pathlib.Path],
+    *,
+    k: Optional[int] = None,
+    threshold: Optional[float] = None,
+    num_shards: int = 16,
+    shards: Optional[Collection[int]] = None,
+    batch_size: Optional[int] = 1,
+    mode: Optional[InductiveMode] = None,
+    target: Target = LABEL_TAIL,
+    num_workers: int = 0,
+    pipelined: bool = False,
+) -> pathlib.Path:
+    """Calculate scores for all triples shard by shard, and write each shard's results to disk.
+
+    The prediction tasks, e.g., all $(h, r)$ pairs for tail prediction, are partitioned into ``num_shards``
+    contiguous shards. For each shard, either the top $k$ triples, all triples with a score of at least
+    ``threshold``, or all triples, are stored in a separate ``.npz`` file with the columns ``head``, ``relation``,
+    ``tail``, and ``score``. Since each file is written atomically once its shard is completed, it also serves as
+    progress record: calling the function again with the same directory skips all completed shards, e.g., to resume
+    after a crash. The directory's ``metadata.json`` records the configuration and a hash of the model's parameters,
+    and resuming with a different configuration or model raises an error.
+
+    Moreover, disjoint sets of shards can be calculated by separate processes via ``shards``, e.g., in process
+    ``rank`` out of ``world_size``
+
+    .. code-block:: python
+
+        predict_all_sharded(model, directory, k=100, num_shards=64, shards=range(rank, 64, world_size))
+
+    Afterwards, the results can be merged with :func:`load_sharded_predictions`.
+
+    :param model:
+        A PyKEEN model
+    :param directory:
+        the directory to write the shards to
+    :param k:
+        The number of triples to keep per shard. Set to ``None`` to keep all (exceeding the threshold). Since each shard
+        keeps its top $k$ triples, the union of all shards contains the global top $k$ triples.
+    :param threshold:
+        if given, only keep triples with at least this score
+    :param num_shards:
+        the number of shards to partition the prediction tasks into
+    :param shards:
+        the shards to calculate, defaults to all. Shards which are already completed are skipped.
+    :param batch_size:
+        The batch size to use for calculating scores; set to `None` to determine largest possible batch size
+    :param mode:
+        The pass mode, which is None in the transductive setting and one of "training",
+        "validation", or "testing" in the inductive setting.
+    :param target:
+        the prediction target to use. Prefer targets which are efficient to predict with the given model,
+        e.g., tails for ConvE.
+    :param num_workers:
+        the number of worker processes which create and prefetch batches, cf. :func:`consume_scores`
+    :param pipelined:
+        whether to overlap the score calculation with the consumption of the previous batch's scores,
+        cf. :func:`consume_scores`
+
+    :return:
+        the directory
+
+    :raises ValueError:
+        if the directory already contains shards for a different configuration, or if invalid shards are requested
+    """
+    directory = normalize_path(directory, mkdir=True)
     dataset = AllPredictionDataset(
         num_entities=model.num_entities, num_relations=model.num_real_relations, target=target
     )
-    consume_scores(model, dataset, consumer, batch_size=batch_size or len(dataset), mode=mode)
-    return consumer.finalize()
+    num_tasks = len(dataset)
+    num_shards = min(num_shards, num_tasks)
+    metadata = dict(
+        num_entities=model.num_entities,
+        num_relations=model.num_real_relations,
+        target=target,
+        k=k,
+        threshold=threshold,
+        num_shards=num_shards,
+        # note: the model's state is included, such that shards of different (re-trained) models are not mixed
+        model=f"{model.__class__.__module__}.{model.__class__.__qualname__}",
+        model_hash=get_state_dict_hash(model),
+    )
+    metadata_path = directory.joinpath(SHARD_METADATA_FILE_NAME)
+    if metadata_path.is_file():
+        existing = json.loads(metadata_path.read_text())
+        if existing != metadata:
+            raise ValueError(
+                f"{directory.as_uri()} contains sharded predictions for a different configuration: {existing}"
+            )
+    else:
+        write_atomically(metadata_path, lambda file: file.write(json.dumps(metadata, indent=2).encode("utf-8")))
+
+    if shards is None:
+        shards = range(num_shards)
+    invalid = sorted(set(shards).difference(range(num_shards)))
+    if invalid:
+        raise ValueError(f"Invalid shards: {invalid}. There are only {num_shards} shards.")
+    bounds = _get_shard_bounds(num_tasks=num_tasks, num_shards=num_shards)
+    todo = [shard for shard in sorted(set(shards)) if not _get_shard_path(directory, shard).is_file()]
+    if len(todo) < len(shards):
+        logger.info(f"Skipping {len(shards) - len(todo)} shards which are already completed.")
+    for shard in tqdm(todo, desc="shards", unit="shard", leave=False):
+        consumer: ScoreConsumer
+        if k is None:
+            consumer = ThresholdScoreConsumer(threshold=-math.inf if threshold is None else threshold)
+        else:
+            consumer = TopKScoreConsumer(k=k, device=model.device)
+        shard_dataset = _SubsetPredictionDataset(base=dataset, start=bounds[shard], stop=bounds[shard + 1])
+        consume_scores(
+            model,
+            shard_dataset,
+            consumer,
+            batch_size=batch_size or len(shard_dataset),
+            mode=mode,
+            num_workers=num_workers,
+            pipelined=pipelined,
+        )
+        pack = _filter_pack(pack=consumer.finalize(), threshold=threshold)
+        result, scores = pack.result.cpu().numpy(), pack.scores.cpu().numpy()
+        columns = {column: result[:, i] for i, column in enumerate(COLUMN_LABELS)}
+        write_atomically(_get_shard_path(directory, shard), lambda file: numpy.savez(file, score=scores, **columns))
+        logger.info(f"Completed shard {shard} with {scores.shape[0]:,} triples.")
+    return directory
+
+
+def load_sharded_predictions(directory: Union[str, pathlib.Path], k: Optional[int] = None) -> ScorePack:
+    """
+    Load and merge predictions written by :func:`predict_all_sharded`.
+
+    :param directory:
+        the directory containing the shards
+    :param k:
+        the number of triples to keep. Defaults to the ``k`` used for the calculation, i.e., the global top $k$.
+
+    :return:
+        a score pack of all triples in the shards, sorted by decreasing score
+
+    :raises FileNotFoundError:
+        if the directory does not contain sharded predictions, or not all shards are completed
+    """
+    directory = normalize_path(directory)
+    metadata_path = directory.joinpath(SHARD_METADATA_FILE_NAME)
+    if not metadata_path.is_file():
+        raise FileNotFoundError(f"{directory.as_uri()} does not contain sharded predictions.")
+    metadata = json.loads(metadata_path.read_text())
+    missing = [shard for shard in range(metadata["num_shards"]) if not _get_shard_path(directory, shard).is_file()]
+    if missing:
+        raise FileNotFoundError(f"The following shards are not yet completed: {missing}")
+    results, scores = [], []
+    for shard in range(metadata["num_shards"]):
+        with numpy.load(_get_shard_path(directory, shard)) as arrays:
+            results.append(numpy.stack([arrays[column] for column in COLUMN_LABELS], axis=-1))
+            scores.append(arrays["score"])
+    pack = _build_pack(
+        result=torch.as_tensor(numpy.concatenate(results), dtype=torch.long),
+        scores=torch.as_tensor(numpy.concatenate(scores)),
+    )
+    if k is None:
+        k = metadata["k"]
+    if k is not None:
+        pack = ScorePack(result=pack.result[:k], scores=pack.scores[:k])
+    return pack
 
 
 @torch.inference_mode()
@@ -1041,6 +1968,10 @@ def predict_target(
     triples_factory: Optional[TriplesFactory] = None,
     targets: Union[None, torch.LongTensor, Sequence[Union[int, str]]] = None,
     mode: Optional[InductiveMode] = None,
+    k: Optional[int] = None,
+    index: Union[None, bool, SimilarityIndex] = None,
+    num_probes: Optional[int] = None,
+    threshold: Optional[float] = None,
 ) -> Predictions:
     """Get predictions for the head, relation, and/or tail combination.
 
@@ -1068,6 +1999,20 @@ def predict_target(
         The pass mode, which is None in the transductive setting and one of "training",
         "validation", or "testing" in the inductive setting.
 
+    :param k:
+        the number of highest scoring targets to keep, or None to keep all. Since there is a single prediction task,
+        this is the number of targets per task; together with `threshold`, it keeps the top $k$ targets exceeding
+        the threshold. Use :func:`predict_all` with `k_per_task` for the top $k$ targets of each task.
+    :param index:
+        a similarity index to retrieve the top k targets without scoring all entities, cf. :class:`SimilarityIndex`.
+        If True, a new index is created from the model. Falls back to exhaustive scoring, if k is None, the
+        relation is predicted, the targets are restricted, or the model does not support similarity search.
+    :param num_probes:
+        the number of lists the index probes, or None to use the index's default. Smaller values are faster, but may
+        have lower recall.
+    :param threshold:
+        if given, only keep targets with a score of at least this value
+
     :return:
         The predictions, containing either the $k$ highest scoring targets, or all targets if $k$ is `None`.
     """
@@ -1082,7 +2027,19 @@ def predict_target(
     )
 
     # get scores
-    scores = model.predict(batch, full_batch=False, mode=mode, ids=targets, target=target).squeeze(dim=0).tolist()
+    resolved_index = None if targets is not None else _resolve_index(index, model=model, target=target, k=k, mode=mode)
+    if resolved_index is not None:
+        assert k is not None
+        score_tensor, id_tensor = resolved_index.predict(
+            model=model, batch=batch, target=target, k=k, num_probes=num_probes, mode=mode
+        )
+        mask = id_tensor >= 0
+        scores, ids = score_tensor[mask].tolist(), id_tensor[mask].tolist()
+        if labels is not None:
+            labels = list(labels)
+            labels = [labels[i] for i in ids]
+    else:
+        scores = model.predict(batch, full_batch=False, mode=mode, ids=targets, target=target).squeeze(dim=0).tolist()
     if ids is None:
         ids = range(len(scores))
 
@@ -1091,6 +2048,10 @@ def predict_target(
     if labels is not None:
         data[f"{target}_label"] = labels
     df = pandas.DataFrame(data=data).sort_values("score", ascending=False)
+    if threshold is not None:
+        df = df[df["score"] >= threshold]
+    if k is not None:
+        df = df.head(k)
     return TargetPredictions(df=df, factory=triples_factory, target=target, other_columns_fixed_ids=other_col_ids)
 
 
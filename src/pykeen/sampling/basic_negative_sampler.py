@@ -17,7 +17,14 @@ __all__ = [
 ]
 
 
-def random_replacement_(batch: torch.LongTensor, index: int, selection: slice, size: int, max_index: int) -> None:
+def random_replacement_(
+    batch: torch.LongTensor,
+    index: int,
+    selection: slice,
+    size: int,
+    max_index: int,
+    generator: Optional[torch.Generator] = None,
+) -> None:
     """
     Replace a column of a batch of indices by random indices.
 
@@ -31,6 +38,8 @@ def random_replacement_(batch: torch.LongTensor, index: int, selection: slice, s
         the size of the selection
     :param max_index:
         the maximum index value at the chosen position
+    :param generator:
+        the random number generator, which has to reside on the batch's device. If None, use the default generator.
     """
     # At least make sure to not replace the triples by the original value
     # To make sure we don't replace the {head, relation, tail} by the
@@ -40,6 +49,7 @@ def random_replacement_(batch: torch.LongTensor, index: int, selection: slice, s
         high=max_index - 1,
         size=(size,),
         device=batch.device,
+        generator=generator,
     )
     replacement += (replacement >= batch[selection, index]).long()
     batch[selection, index] = replacement
@@ -105,6 +115,7 @@ class BasicNegativeSampler(NegativeSampler):
                 selection=slice(start, stop),
                 size=stop - start,
                 max_index=self.num_relations if index == 1 else self.num_entities,
+                generator=self.generator,
             )
 
         return negative_batch.view(*batch_shape, self.num_negs_per_pos, 3)
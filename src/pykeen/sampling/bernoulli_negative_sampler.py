@@ -50,25 +50,26 @@ class BernoulliNegativeSampler(NegativeSampler):
         """
         super().__init__(mapped_triples=mapped_triples, **kwargs)
         # Preprocessing: Compute corruption probabilities
-        head_rel_uniq, tail_count = torch.unique(mapped_triples[:, :2], return_counts=True, dim=0)
-        rel_tail_uniq, head_count = torch.unique(mapped_triples[:, 1:], return_counts=True, dim=0)
-
-        self.corrupt_head_probability = torch.empty(
-            self.num_relations,
-            device=mapped_triples.device,
-        )
-
-        for r in range(self.num_relations):
-            # compute tph, i.e. the average number of tail entities per head
-            mask = head_rel_uniq[:, 1] == r
-            tph = tail_count[mask].float().mean()
-
-            # compute hpt, i.e. the average number of head entities per tail
-            mask = rel_tail_uniq[:, 0] == r
-            hpt = head_count[mask].float().mean()
-
-            # Set parameter for Bernoulli distribution
-            self.corrupt_head_probability[r] = tph / (tph + hpt)
+        heads, relations, tails = mapped_triples.t()
+        # the number of triples per relation
+        num_triples = torch.bincount(relations, minlength=self.num_relations).float()
+        # the number of unique (h, r) and (r, t) pairs per relation, using packed keys for a fast 1-dimensional unique
+        num_unique_heads = torch.bincount(
+            (heads * self.num_relations + relations).unique() % self.num_relations, minlength=self.num_relations
+        ).float()
+        num_unique_tails = torch.bincount(
+            (relations * self.num_entities + tails).unique() // self.num_entities, minlength=self.num_relations
+        ).float()
+
+        # compute tph, i.e. the average number of tail entities per head
+        tph = num_triples / num_unique_heads
+        # compute hpt, i.e. the average number of head entities per tail
+        hpt = num_triples / num_unique_tails
+        # Set parameter for Bernoulli distribution
+        corrupt_head_probability = tph / (tph + hpt)
+
+        # note: we use a buffer, such that the probabilities are moved along with the sampler, cf. nn.Module.to
+        self.register_buffer(name="corrupt_head_probability", tensor=corrupt_head_probability)
 
     # docstr-coverage: inherited
     def corrupt_batch(self, positive_batch: torch.LongTensor) -> torch.LongTensor:  # noqa: D102
@@ -77,7 +78,7 @@ class BernoulliNegativeSampler(NegativeSampler):
         # Decide whether to corrupt head or tail
         head_corruption_probability = self.corrupt_head_probability[positive_batch[..., 1]].unsqueeze(dim=-1)
         head_mask = torch.rand(
-            *batch_shape, self.num_negs_per_pos, device=positive_batch.device
+            *batch_shape, self.num_negs_per_pos, device=positive_batch.device, generator=self.generator
         ) < head_corruption_probability.to(device=positive_batch.device)
 
         # clone positive batch for corruption (.repeat_interleave creates a copy)
@@ -96,6 +97,7 @@ class BernoulliNegativeSampler(NegativeSampler):
                 selection=mask,
                 size=mask.sum(),
                 max_index=self.num_entities,
+                generator=self.generator,
             )
 
         return negative_batch.view(*batch_shape, self.num_negs_per_pos, 3)
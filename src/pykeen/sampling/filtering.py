@@ -91,6 +91,10 @@ on Python's built-in sets, the :class:`pykeen.sampling.filtering.PythonSetFilter
             filterer='python-set',    
         ),
     )
+
+For large datasets, the exact :class:`pykeen.sampling.filtering.SortedFilterer` is a faster alternative. It packs each
+triple into a single integer, and answers membership queries by binary search on a sorted tensor, which can reside on the
+GPU. It can be activated with ``filterer='sorted'``.
     
 Identifying False Negatives During Evaluation
 ---------------------------------------------
@@ -125,7 +129,7 @@ as solid evaluation results as possible.
 
 import math
 from abc import abstractmethod
-from typing import Iterable
+from typing import Iterable, Optional
 
 import torch
 from class_resolver import ClassResolver
@@ -139,6 +143,7 @@ __all__ = [
     "Filterer",
     "BloomFilterer",
     "PythonSetFilterer",
+    "SortedFilterer",
 ]
 
 
@@ -351,6 +356,98 @@ class BloomFilterer(Filterer):
         return result
 
 
+class SortedFilterer(Filterer):
+    r"""
+    An exact filterer for negative triples based on a sorted tensor of packed triples.
+
+    Each triple :math:`(h, r, t)` is packed into a single integer key
+    :math:`(h \cdot |\mathcal{R}| + r) \cdot |\mathcal{E}| + t`.
+    The keys of the indexed triples are kept in a sorted tensor, such that membership queries can be answered by binary
+    search via :func:`torch.searchsorted`. Like :class:`BloomFilterer`, it is a proper module which can be moved to GPU,
+    and supports batch-wise computation, but it does not suffer from false positives.
+    """
+
+    #: the sorted, unique keys of the indexed triples
+    keys: torch.LongTensor
+
+    def __init__(
+        self,
+        mapped_triples: MappedTriples,
+        num_entities: Optional[int] = None,
+        num_relations: Optional[int] = None,
+    ):
+        """
+        Initialize the filterer.
+
+        :param mapped_triples:
+            The ID-based triples.
+        :param num_entities:
+            The number of entities. If None, will be inferred from the triples.
+        :param num_relations:
+            The number of relations. If None, will be inferred from the triples.
+        """
+        super().__init__()
+        self.num_entities = num_entities or 0
+        self.num_relations = num_relations or 0
+        self.register_buffer(name="keys", tensor=torch.empty(0, dtype=torch.long, device=mapped_triples.device))
+        self.add(triples=mapped_triples)
+
+    def __repr__(self):  # noqa:D105
+        return (
+            f"{self.__class__.__name__}("
+            f"num_entities={self.num_entities}, "
+            f"num_relations={self.num_relations}, "
+            f"num_triples={self.keys.shape[0]}, "
+            f")"
+        )
+
+    def _pack(self, triples: MappedTriples) -> torch.LongTensor:
+        """Pack triples into integer keys."""
+        h, r, t = triples.unbind(dim=-1)
+        return (h * self.num_relations + r) * self.num_entities + t
+
+    def _unpack(self, keys: torch.LongTensor) -> MappedTriples:
+        """Unpack integer keys into triples."""
+        hr, t = keys.div(self.num_entities, rounding_mode="floor"), keys % self.num_entities
+        return torch.stack([hr.div(self.num_relations, rounding_mode="floor"), hr % self.num_relations, t], dim=-1)
+
+    def add(self, triples: MappedTriples) -> None:
+        """
+        Add triples to the index.
+
+        :param triples: shape: (n, 3)
+            The ID-based triples.
+
+        :raises ValueError:
+            if the packed keys would not fit into a 64-bit integer
+        """
+        triples = triples.view(-1, 3).to(self.keys.device)
+        if triples.shape[0] == 0:
+            return
+        num_entities = max(self.num_entities, triples[:, 0::2].max().item() + 1)
+        num_relations = max(self.num_relations, triples[:, 1].max().item() + 1)
+        if num_entities**2 * num_relations > torch.iinfo(torch.long).max:
+            raise ValueError(
+                f"Cannot pack triples with num_entities={num_entities} and num_relations={num_relations} into 64 bit."
+            )
+        # the existing keys have to be re-packed, if the ranges are enlarged
+        existing = self._unpack(self.keys)
+        self.num_entities, self.num_relations = num_entities, num_relations
+        # note: torch.unique sorts its output
+        self.keys = torch.unique(torch.cat([self._pack(existing), self._pack(triples)]))
+
+    # docstr-coverage: inherited
+    def contains(self, batch: MappedTriples) -> torch.BoolTensor:  # noqa: D102
+        if self.keys.numel() == 0:
+            return batch.new_zeros(batch.shape[:-1], dtype=torch.bool)
+        # IDs outside the indexed ranges cannot be contained, and would otherwise collide with other keys
+        valid = (batch >= 0).all(dim=-1) & (batch[..., 1] < self.num_relations)
+        valid &= (batch[..., 0] < self.num_entities) & (batch[..., 2] < self.num_entities)
+        keys = self._pack(batch)
+        index = torch.searchsorted(self.keys, keys.view(-1)).clamp_max_(self.keys.shape[0] - 1).view(keys.shape)
+        return valid & (self.keys[index] == keys)
+
+
 filterer_resolver: ClassResolver[Filterer] = ClassResolver.from_subclasses(
     base=Filterer,
     default=BloomFilterer,
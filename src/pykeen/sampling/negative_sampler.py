@@ -32,6 +32,10 @@ class NegativeSampler(nn.Module):
     num_relations: int
     num_negs_per_pos: int
 
+    #: an optional random number generator used for corruption, e.g., residing on the training device.
+    #: If None, the default generator is used.
+    generator: Optional[torch.Generator] = None
+
     def __init__(
         self,
         *,
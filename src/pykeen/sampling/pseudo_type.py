@@ -2,7 +2,6 @@
 
 """Pseudo-Typed negative sampling."""
 
-import itertools
 import logging
 from typing import Tuple
 
@@ -10,7 +9,6 @@ import torch
 
 from .negative_sampler import NegativeSampler
 from ..typing import MappedTriples
-from ..utils import create_relation_to_entity_set_mapping
 
 __all__ = [
     "PseudoTypedNegativeSampler",
@@ -43,22 +41,26 @@ def create_index(
     :return:
         A pair (data, offsets) containing the compressed triples.
     """
-    heads, tails = create_relation_to_entity_set_mapping(triples=mapped_triples.tolist())
-    relations = set(heads.keys()).union(tails.keys())
+    mapped_triples = mapped_triples.cpu()
+    num_entities = mapped_triples[:, [0, 2]].max().item() + 1 if mapped_triples.numel() else 1
+    # pack (relation, side, entity) into a single key, where side=0 denotes heads and side=1 tails; the sorted unique
+    # keys are thus grouped by relation, then by side, and sorted by entity within each group
+    relations = mapped_triples[:, 1].repeat(2)
+    sides = torch.arange(2).repeat_interleave(mapped_triples.shape[0])
+    entities = torch.cat([mapped_triples[:, 0], mapped_triples[:, 2]])
+    keys = ((2 * relations + sides) * num_entities + entities).unique()
+
+    # create index structure
+    data = keys % num_entities
+    group_sizes = torch.bincount(keys // num_entities, minlength=2 * num_relations)
+    offsets = torch.zeros(2 * num_relations + 1, dtype=torch.long)
+    offsets[1:] = torch.cumsum(group_sizes, dim=0)
 
     # TODO: move this warning to PseudoTypeNegativeSampler's constructor?
-    for r in relations:
-        if len(heads[r]) < 2 and len(tails[r]) < 2:
-            logger.warning(f"Relation {r} does not have a sufficient number of distinct heads and tails.")
+    num_heads, num_tails = group_sizes.view(num_relations, 2).t()
+    for r in ((num_heads + num_tails > 0) & (num_heads < 2) & (num_tails < 2)).nonzero().view(-1).tolist():
+        logger.warning(f"Relation {r} does not have a sufficient number of distinct heads and tails.")
 
-    # create index structure
-    data = []
-    offsets = torch.empty(2 * num_relations + 1, dtype=torch.long)
-    offsets[0] = 0
-    for i, (r, m) in enumerate(itertools.product(range(num_relations), (heads, tails)), start=1):
-        data.extend(sorted(m[r]))
-        offsets[i] = len(data)
-    data = torch.as_tensor(data=data, dtype=torch.long)
     return data, offsets
 
 
@@ -92,7 +94,10 @@ class PseudoTypedNegativeSampler(NegativeSampler):
             Additional keyword based arguments passed to :class:`pykeen.sampling.NegativeSampler`.
         """
         super().__init__(mapped_triples=mapped_triples, **kwargs)
-        self.data, self.offsets = create_index(mapped_triples=mapped_triples, num_relations=self.num_relations)
+        data, offsets = create_index(mapped_triples=mapped_triples, num_relations=self.num_relations)
+        # note: we use buffers, such that the index is moved along with the sampler, cf. nn.Module.to
+        self.register_buffer(name="data", tensor=data)
+        self.register_buffer(name="offsets", tensor=offsets)
 
     # docstr-coverage: inherited
     def corrupt_batch(self, positive_batch: torch.LongTensor):  # noqa: D102
@@ -107,7 +112,10 @@ class PseudoTypedNegativeSampler(NegativeSampler):
         start_tails = self.offsets[2 * r + 1].unsqueeze(dim=-1)
         end = self.offsets[2 * r + 2].unsqueeze(dim=-1)
         num_choices = end - start_heads
-        negative_ids = start_heads + (torch.rand(size=(batch_size, self.num_negs_per_pos)) * num_choices).long()
+        uniform = torch.rand(
+            size=(batch_size, self.num_negs_per_pos), device=positive_batch.device, generator=self.generator
+        )
+        negative_ids = start_heads + (uniform * num_choices).long()
 
         # get corresponding entity
         entity_id = self.data[negative_ids]
@@ -16,6 +16,7 @@ from ..models import Model
 from ..triples import CoreTriplesFactory
 from ..triples.instances import LCWABatchType, LCWASampleType
 from ..typing import InductiveMode, MappedTriples
+from ..utils import LinearMemoryEstimate
 
 __all__ = [
     "LCWATrainingLoop",
@@ -84,16 +85,26 @@ class LCWATrainingLoop(TrainingLoop[LCWASampleType, LCWABatchType]):
 
     # docstr-coverage: inherited
     def _create_training_data_loader(
-        self, triples_factory: CoreTriplesFactory, sampler: Optional[str], **kwargs
+        self, triples_factory: CoreTriplesFactory, sampler: Optional[str], batch_size: int, drop_last: bool, **kwargs
     ) -> DataLoader[LCWABatchType]:  # noqa: D102
         if sampler:
             raise NotImplementedError(
                 f"LCWA training does not support non-default batch sampling. Expected sampler=None, but got "
                 f"sampler='{sampler}'.",
             )
-
-        dataset = triples_factory.create_lcwa_instances(target=self.target)
-        return DataLoader(dataset=dataset, collate_fn=dataset.get_collator(), **kwargs)
+        assert "batch_sampler" not in kwargs
+        return DataLoader(
+            dataset=triples_factory.create_lcwa_instances(
+                target=self.target,
+                batch_size=batch_size,
+                drop_last=drop_last,
+                shuffle=kwargs.pop("shuffle", True),
+            ),
+            # disable automatic batching
+            batch_size=None,
+            batch_sampler=None,
+            **kwargs,
+        )
 
     @staticmethod
     # docstr-coverage: inherited
@@ -118,7 +129,15 @@ class LCWATrainingLoop(TrainingLoop[LCWASampleType, LCWABatchType]):
 
         # Send batch to device
         batch_pairs = batch_pairs[start:stop].to(device=model.device)
-        batch_labels_full = batch_labels_full[start:stop].to(device=model.device)
+        if batch_labels_full.is_sparse:
+            # pre-batched instances provide sparse labels, which are only densified on the training device
+            if start is not None or stop is not None:
+                batch_labels_full = batch_labels_full.index_select(
+                    dim=0, index=torch.arange(batch_labels_full.shape[0])[start:stop]
+                )
+            batch_labels_full = batch_labels_full.to(device=model.device).to_dense()
+        else:
+            batch_labels_full = batch_labels_full[start:stop].to(device=model.device)
 
         predictions = score_method(batch_pairs, slice_size=slice_size, mode=mode)
 
@@ -209,6 +228,32 @@ class LCWATrainingLoop(TrainingLoop[LCWASampleType, LCWABatchType]):
 
         return slice_size
 
+    # docstr-coverage: inherited
+    def _estimate_slice_size(
+        self,
+        *,
+        triples_factory: CoreTriplesFactory,
+        memory_budget: int,
+        batch_size: int,
+        sampler: Optional[str],
+        supports_sub_batching: bool,
+    ) -> Tuple[int, LinearMemoryEstimate]:  # noqa: D102
+        self._check_slicing_availability(supports_sub_batching)
+        logger.info("Trying slicing now.")
+        estimate = self._fit_memory_estimate(
+            probe=lambda size: (
+                size,
+                self._probe_peak_memory(
+                    triples_factory=triples_factory, batch_size=batch_size, sampler=sampler, slice_size=size
+                )[1],
+            ),
+            maximum=self.model.num_entities,
+        )
+        slice_size = estimate.get_max_size(budget=memory_budget, maximum=self.model.num_entities)
+        if slice_size == 0:
+            raise MemoryError("Even slice_size=1 doesn't fit into the memory budget with these parameters.")
+        return slice_size, estimate
+
     def _check_slicing_availability(self, supports_sub_batching: bool):
         if self.target == 0 and self.model.can_slice_h:
             return
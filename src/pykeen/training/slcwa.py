@@ -34,6 +34,7 @@ class SLCWATrainingLoop(TrainingLoop[SLCWASampleType, SLCWABatch]):
         self,
         negative_sampler: HintOrType[NegativeSampler] = None,
         negative_sampler_kwargs: OptionalKwargs = None,
+        sample_on_device: bool = False,
         **kwargs,
     ):
         """Initialize the training loop.
@@ -41,18 +42,33 @@ class SLCWATrainingLoop(TrainingLoop[SLCWASampleType, SLCWABatch]):
         :param negative_sampler: The class, instance, or name of the negative sampler
         :param negative_sampler_kwargs: Keyword arguments to pass to the negative sampler class on instantiation
             for every positive one
+        :param sample_on_device:
+            Whether to move the positive triples to the model's device once, and perform batching, negative sampling
+            and filtering there, cf. :class:`pykeen.triples.instances.DeviceBatchedSLCWAInstances`. This avoids
+            host-to-device copies and data loader worker processes, and is recommended if the training triples fit
+            into the device's memory. Not supported in combination with a non-default batch sampler.
         :param kwargs:
             Additional keyword-based parameters passed to TrainingLoop.__init__
         """
         super().__init__(**kwargs)
         self.negative_sampler = negative_sampler
         self.negative_sampler_kwargs = negative_sampler_kwargs
+        self.sample_on_device = sample_on_device
 
     # docstr-coverage: inherited
     def _create_training_data_loader(
         self, triples_factory: CoreTriplesFactory, sampler: Optional[str], batch_size: int, drop_last: bool, **kwargs
     ) -> DataLoader[SLCWABatch]:  # noqa: D102
         assert "batch_sampler" not in kwargs
+        instances_kwargs = {}
+        if self.sample_on_device:
+            if kwargs.get("num_workers"):
+                logger.warning(
+                    "Ignoring num_workers=%d, since negative samples are created on the device.", kwargs["num_workers"]
+                )
+            # all tensors are already on the device
+            kwargs.update(num_workers=0, pin_memory=False)
+            instances_kwargs.update(on_device=True, device=self.device)
         return DataLoader(
             dataset=triples_factory.create_slcwa_instances(
                 batch_size=batch_size,
@@ -61,6 +77,7 @@ class SLCWATrainingLoop(TrainingLoop[SLCWASampleType, SLCWABatch]):
                 negative_sampler=self.negative_sampler,
                 negative_sampler_kwargs=self.negative_sampler_kwargs,
                 sampler=sampler,
+                **instances_kwargs,
             ),
             # disable automatic batching
             batch_size=None,
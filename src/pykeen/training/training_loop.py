@@ -13,7 +13,7 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from hashlib import md5
 from tempfile import NamedTemporaryFile
-from typing import IO, Any, Generic, List, Mapping, Optional, Tuple, TypeVar, Union
+from typing import IO, Any, Callable, Generic, List, Mapping, Optional, Tuple, TypeVar, Union
 
 import numpy as np
 import torch
@@ -40,6 +40,8 @@ from ..trackers import ResultTracker, tracker_resolver
 from ..triples import CoreTriplesFactory, TriplesFactory
 from ..typing import InductiveMode
 from ..utils import (
+    LinearMemoryEstimate,
+    estimate_peak_memory,
     format_relative_comparison,
     get_batchnorm_modules,
     get_preferred_device,
@@ -146,6 +148,7 @@ class TrainingLoop(Generic[SampleType, BatchType], ABC):
         mode: Optional[InductiveMode] = None,
         result_tracker: HintOrType[ResultTracker] = None,
         result_tracker_kwargs: OptionalKwargs = None,
+        memory_budget: Optional[int] = None,
     ) -> None:
         """Initialize the training loop.
 
@@ -167,6 +170,11 @@ class TrainingLoop(Generic[SampleType, BatchType], ABC):
             the result tracker
         :param result_tracker_kwargs:
             additional keyword-based parameters to instantiate the result tracker
+        :param memory_budget:
+            the memory budget in bytes for automatic memory optimization. If given, the batch, sub-batch, and slice
+            size are selected by extrapolating the peak memory of small probe batches, cf.
+            :meth:`memory_budget_search`, instead of trying increasing sizes until an out-of-memory error occurs.
+            This also works on CPU, where out-of-memory errors cannot be caught.
         """
         self.model = model
         self.optimizer = optimizer_resolver.make(optimizer, pos_kwargs=optimizer_kwargs, params=model.get_grad_params())
@@ -178,6 +186,7 @@ class TrainingLoop(Generic[SampleType, BatchType], ABC):
         self.automatic_memory_optimization = automatic_memory_optimization
         self.mode = mode
         self.result_tracker = tracker_resolver.make(query=result_tracker, pos_kwargs=result_tracker_kwargs)
+        self.memory_budget = memory_budget
 
         logger.debug("we don't really need the triples factory: %s", triples_factory)
 
@@ -256,8 +265,9 @@ class TrainingLoop(Generic[SampleType, BatchType], ABC):
             general and only for models that have the slicing capability implemented.
         :param label_smoothing: (0 <= label_smoothing < 1)
             If larger than zero, use label smoothing.
-        :param sampler: (None or 'schlichtkrull')
-            The type of sampler to use. At the moment sLCWA in R-GCN is the only user of schlichtkrull sampling.
+        :param sampler: (None, 'schlichtkrull', or 'frontier')
+            The type of sampler to use. At the moment sLCWA in R-GCN is the only user of subgraph sampling, where
+            'frontier' is a vectorized, and thus faster, variant of 'schlichtkrull' with similar subgraph statistics.
         :param continue_training:
             If set to False, (re-)initialize the model's weights. Otherwise continue training.
         :param only_size_probing:
@@ -460,7 +470,7 @@ class TrainingLoop(Generic[SampleType, BatchType], ABC):
             best_epoch_model_file_path = pathlib.Path(NamedTemporaryFile().name)
         best_epoch_model_checkpoint_file_path: Optional[pathlib.Path] = None
 
-        if isinstance(self.model, RGCN) and sampler != "schlichtkrull":
+        if isinstance(self.model, RGCN) and sampler not in {"schlichtkrull", "frontier"}:
             logger.warning(
                 'Using RGCN without graph-based sampling! Please select sampler="schlichtkrull" instead of %s.',
                 sampler,
@@ -496,7 +506,20 @@ class TrainingLoop(Generic[SampleType, BatchType], ABC):
 
         # Take the biggest possible training batch_size, if batch_size not set
         batch_size_sufficient = False
-        if batch_size is None:
+        if (
+            self.automatic_memory_optimization
+            and self.memory_budget is not None
+            and not only_size_probing
+            and (batch_size is None or not continue_training)
+        ):
+            batch_size, sub_batch_size, slice_size = self.memory_budget_search(
+                triples_factory=triples_factory,
+                memory_budget=self.memory_budget,
+                batch_size=batch_size,
+                sampler=sampler,
+            )
+            batch_size_sufficient = True
+        elif batch_size is None:
             if self.automatic_memory_optimization:
                 # Using automatic memory optimization on CPU may result in undocumented crashes due to OS' OOM killer.
                 if self.model.device.type == "cpu":
@@ -788,7 +811,7 @@ class TrainingLoop(Generic[SampleType, BatchType], ABC):
         :param drop_last:
             whether to drop the last (incomplete) batch, cf. torch.utils.data.DataLoader
         :param sampler:
-            the batch sampler to use. Either None, or "schlichtkrull".
+            the batch sampler to use. Either None, "schlichtkrull", or "frontier".
         :param kwargs:
             additional keyword-based parameters passed to :meth:`torch.utils.data.DataLoader.__init__`
 
@@ -1072,6 +1095,166 @@ class TrainingLoop(Generic[SampleType, BatchType], ABC):
 
         return sub_batch_size, finished_search, supports_sub_batching
 
+    def _probe_peak_memory(
+        self,
+        *,
+        triples_factory: CoreTriplesFactory,
+        batch_size: int,
+        sampler: Optional[str],
+        slice_size: Optional[int] = None,
+    ) -> Tuple[int, int]:
+        """
+        Estimate the peak memory of a single training step on a probe batch.
+
+        :param triples_factory:
+            the training triples factory
+        :param batch_size:
+            the probe batch size
+        :param sampler:
+            the sampler (None or schlichtkrull)
+        :param slice_size:
+            the slice size, if any
+
+        :return:
+            a pair (size, peak) of the actual size of the probe batch, and its estimated peak memory in bytes,
+            including the gradients of all trainable parameters
+        """
+        data_loader = self._create_training_data_loader(
+            triples_factory,
+            batch_size=batch_size,
+            drop_last=False,
+            num_workers=0,
+            pin_memory=False,
+            shuffle=True,
+            sampler=sampler,
+        )
+        batch = next(iter(data_loader))
+        current_batch_size = self._get_batch_size(batch)
+        self.model.train()
+        parameters = list(self.model.parameters())
+        peak = estimate_peak_memory(
+            closure=lambda: self._process_batch(
+                batch=batch, start=0, stop=current_batch_size, label_smoothing=0.0, slice_size=slice_size
+            ),
+            exclude=parameters,
+        )
+        peak += sum(p.numel() * p.element_size() for p in parameters if p.requires_grad)
+        self._free_graph_and_cache()
+        return current_batch_size, peak
+
+    def _fit_memory_estimate(self, probe: Callable[[int], Tuple[int, int]], maximum: int) -> LinearMemoryEstimate:
+        """Fit a linear memory estimate from a few small probes of the given function."""
+        sizes, peaks = [], []
+        for size in sorted({min(size, maximum) for size in (4, 8, 16)}):
+            size, peak = probe(size)
+            sizes.append(size)
+            peaks.append(peak)
+        return LinearMemoryEstimate.from_probes(sizes=sizes, peaks=peaks)
+
+    def memory_budget_search(
+        self,
+        *,
+        triples_factory: CoreTriplesFactory,
+        memory_budget: int,
+        batch_size: Optional[int] = None,
+        sampler: Optional[str] = None,
+    ) -> Tuple[int, int, Optional[int]]:
+        """Select the batch size, sub-batch size and slice size for a memory budget.
+
+        In contrast to :meth:`batch_size_search` and :meth:`sub_batch_and_slice`, this method does not rely on
+        catching out-of-memory errors, and thus also works on CPU. Instead, the peak memory of a training step is
+        estimated for a few small probe batches, cf. :func:`pykeen.utils.estimate_peak_memory`, and extrapolated
+        linearly to larger batches, cf. :class:`pykeen.utils.LinearMemoryEstimate`. The selected values and the
+        predicted peak memory are logged to the result tracker.
+
+        :param triples_factory:
+            The triples factory over which search is run
+        :param memory_budget:
+            The memory budget, in bytes
+        :param batch_size:
+            The batch size. If None, select the largest batch size which fits into the budget, but at most the number
+            of triples.
+        :param sampler:
+            The sampler (None or schlichtkrull)
+
+        :return:
+            A triple of batch size, sub-batch size, and slice size, where the latter is None if no slicing is required.
+        """
+        logger.info(f"Starting estimation-based memory optimization for training with budget={memory_budget:_} B.")
+        maximum = batch_size or triples_factory.num_triples
+        estimate = self._fit_memory_estimate(
+            probe=lambda size: self._probe_peak_memory(
+                triples_factory=triples_factory, batch_size=size, sampler=sampler
+            ),
+            maximum=maximum,
+        )
+        if batch_size is None:
+            batch_size = max(1, estimate.get_max_size(budget=memory_budget, maximum=maximum))
+        sub_batch_size = batch_size
+        slice_size = None
+        if estimate(batch_size) > memory_budget:
+            supports_sub_batching = not get_batchnorm_modules(self.model)
+            if supports_sub_batching:
+                sub_batch_size = estimate.get_max_size(budget=memory_budget, maximum=batch_size)
+            if not supports_sub_batching or sub_batch_size == 0:
+                sub_batch_size = batch_size if not supports_sub_batching else 1
+                slice_size, estimate = self._estimate_slice_size(
+                    triples_factory=triples_factory,
+                    memory_budget=memory_budget,
+                    batch_size=sub_batch_size,
+                    sampler=sampler,
+                    supports_sub_batching=supports_sub_batching,
+                )
+        predicted_peak_memory = estimate(slice_size or sub_batch_size)
+        logger.info(
+            f"Concluded memory optimization with batch_size={batch_size}, sub_batch_size={sub_batch_size}, "
+            f"slice_size={slice_size}, and a predicted peak memory of {predicted_peak_memory:_} B.",
+        )
+        if self.result_tracker is not None:
+            self.result_tracker.log_params(
+                params=dict(
+                    memory_budget=memory_budget,
+                    batch_size=batch_size,
+                    sub_batch_size=sub_batch_size,
+                    slice_size=slice_size,
+                    predicted_peak_memory=predicted_peak_memory,
+                ),
+                prefix="training_memory",
+            )
+        return batch_size, sub_batch_size, slice_size
+
+    def _estimate_slice_size(
+        self,
+        *,
+        triples_factory: CoreTriplesFactory,
+        memory_budget: int,
+        batch_size: int,
+        sampler: Optional[str],
+        supports_sub_batching: bool,
+    ) -> Tuple[int, LinearMemoryEstimate]:
+        """
+        Select the slice size for a memory budget.
+
+        :param triples_factory:
+            A triples factory
+        :param memory_budget:
+            The memory budget, in bytes
+        :param batch_size:
+            The (sub-)batch size to use.
+        :param sampler:
+            The sampler (None or schlichtkrull)
+        :param supports_sub_batching:
+            Indicator if the model supports sub-batching. This is used to create appropriate error messages, if needed.
+
+        :return:
+            A pair of the slice size and the memory estimate as a function of the slice size.
+
+        :raises MemoryError:
+            If it is not possible to train the model within the budget, which is the case by default, since slicing is
+            not supported.
+        """
+        raise MemoryError("The current model can't be trained within the memory budget with these parameters.")
+
     def _free_graph_and_cache(self):
         self.model._free_graph_and_cache()
         # The cache of the previous run has to be freed to allow accurate memory availability estimates
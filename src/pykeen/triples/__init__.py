@@ -2,17 +2,26 @@
 
 """Classes for creating and storing training data from triples."""
 
-from .instances import Instances, LCWAInstances, SLCWAInstances
-from .triples_factory import AnyTriples, CoreTriplesFactory, KGInfo, TriplesFactory, get_mapped_triples
+from .instances import BatchedLCWAInstances, Instances, LCWAInstances, SLCWAInstances
+from .triples_factory import (
+    AnyTriples,
+    ArrayLabeling,
+    CoreTriplesFactory,
+    KGInfo,
+    TriplesFactory,
+    get_mapped_triples,
+)
 from .triples_numeric_literals_factory import TriplesNumericLiteralsFactory
 
 __all__ = [
     "Instances",
     "LCWAInstances",
+    "BatchedLCWAInstances",
     "SLCWAInstances",
     "KGInfo",
     "CoreTriplesFactory",
     "TriplesFactory",
+    "ArrayLabeling",
     "TriplesNumericLiteralsFactory",
     "get_mapped_triples",
     "AnyTriples",
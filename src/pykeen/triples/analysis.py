@@ -5,11 +5,25 @@
 import hashlib
 import itertools as itt
 import logging
+import multiprocessing
 from collections import defaultdict
-from typing import Collection, DefaultDict, Iterable, Mapping, NamedTuple, Optional, Sequence, Set, Tuple, Union
+from typing import (
+    Collection,
+    DefaultDict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import numpy
 import pandas as pd
+import scipy.sparse
 from tqdm.auto import tqdm
 
 from . import TriplesFactory
@@ -305,21 +319,206 @@ def iter_ternary_patterns(
             yield PatternMatch(r, PATTERN_TYPE_COMPOSITION, support, confidence)
 
 
+class _RelationPatternIndex:
+    r"""A sparse index over the unique (head, relation, tail) triples for vectorized relation pattern mining.
+
+    Entity pairs $(h, t)$ are packed into integer keys $h \cdot E + t$. The index comprises
+
+    - the sorted unique keys, which allow computing intersections via sorted-key lookups,
+    - a binary relation-key incidence matrix, whose product with its transpose counts the shared pairs for all relation
+      pairs at once, and
+    - the unique triples sorted by (relation, head, tail), where the pairs of each relation form a contiguous segment.
+    """
+
+    def __init__(self, mapped_triples: Union[MappedTriples, numpy.ndarray, Collection[Tuple[int, int, int]]]):
+        """
+        Initialize the index.
+
+        :param mapped_triples: shape: (n, 3)
+            the ID-based triples
+        """
+        triples = numpy.asarray(mapped_triples, dtype=numpy.int64).reshape(-1, 3)
+        # relations in order of first occurrence, in accordance with the iteration order of :func:`index_pairs`
+        unique_relations, first_occurrence = numpy.unique(triples[:, COLUMN_RELATION], return_index=True)
+        self.relations: List[int] = unique_relations[numpy.argsort(first_occurrence)].tolist()
+        self.num_entities = int(triples[:, [COLUMN_HEAD, COLUMN_TAIL]].max()) + 1 if triples.size else 1
+        self.num_relations = int(unique_relations.max()) + 1 if unique_relations.size else 0
+        # unique triples, sorted by (relation, head, tail)
+        unique_triples = numpy.unique(triples[:, [COLUMN_RELATION, COLUMN_HEAD, COLUMN_TAIL]], axis=0)
+        self.r, self.h, self.t = unique_triples.T
+        self.offsets = numpy.zeros(self.num_relations + 1, dtype=numpy.int64)
+        self.offsets[1:] = numpy.cumsum(numpy.bincount(self.r, minlength=self.num_relations))
+        # sorted unique pair keys, and the relation-key incidence matrix
+        self.keys, columns = numpy.unique(self._pack(self.h, self.t), return_inverse=True)
+        self.incidence = scipy.sparse.csr_matrix(
+            (numpy.ones_like(columns), (self.r, columns.reshape(-1))),
+            shape=(self.num_relations, len(self.keys)),
+        )
+        self.support = self.incidence.getnnz(axis=1)
+
+    def _pack(self, heads: numpy.ndarray, tails: numpy.ndarray) -> numpy.ndarray:
+        """Pack entity pairs into integer keys."""
+        return heads * self.num_entities + tails
+
+    def pairs(self, relation: int) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """Return the unique (head, tail) pairs of a relation, sorted by head."""
+        segment = slice(self.offsets[relation], self.offsets[relation + 1])
+        return self.h[segment], self.t[segment]
+
+    def count_symmetric(self) -> numpy.ndarray:
+        """Count the pairs $(h, t)$ of each relation for which also $(t, h)$ exists for the same relation."""
+        codes = self.incidence.tocoo()
+        existing = numpy.sort(codes.row.astype(numpy.int64) * len(self.keys) + codes.col)
+        reverse_keys = self._pack(self.t, self.h)
+        reverse_columns = numpy.searchsorted(self.keys, reverse_keys).clip(max=len(self.keys) - 1)
+        found = self.keys[reverse_columns] == reverse_keys
+        reverse_codes = self.r[found] * len(self.keys) + reverse_columns[found]
+        positions = numpy.searchsorted(existing, reverse_codes).clip(max=len(existing) - 1)
+        is_symmetric = existing[positions] == reverse_codes
+        return numpy.bincount(self.r[found][is_symmetric], minlength=self.num_relations)
+
+    def count_shared(self) -> scipy.sparse.csr_matrix:
+        """Count the shared pairs for all pairs of relations, shape: (num_relations, num_relations)."""
+        return (self.incidence @ self.incidence.T).tocsr()
+
+    def iter_composition_matches(self, r1: int) -> Iterable[PatternMatch]:
+        r"""Yield the composition pattern matches for the first body relation $r_1$ and all second body relations.
+
+        For all $r_2$ at once, the pairs $(x, z)$ with $r_1(x, y) \land r_2(y, z)$ are obtained from a single sparse
+        product of the adjacency of $r_1$ with the adjacency of all relations, where the columns enumerate
+        (relation, tail) combinations. To keep the sparse matrices small, they use local indices for the entities.
+        """
+        x, y = self.pairs(r1)
+        x_unique, x_local = numpy.unique(x, return_inverse=True)
+        y_unique, y_local = numpy.unique(y, return_inverse=True)
+        left = scipy.sparse.csr_matrix(
+            (numpy.ones_like(x_local), (x_local.reshape(-1), y_local.reshape(-1))),
+            shape=(len(x_unique), len(y_unique)),
+        )
+        # all triples (y, r_2, z) whose head is a tail of r_1
+        mask = numpy.isin(self.h, y_unique)
+        combinations, column = numpy.unique(self.r[mask] * self.num_entities + self.t[mask], return_inverse=True)
+        right = scipy.sparse.csr_matrix(
+            (numpy.ones_like(column), (numpy.searchsorted(y_unique, self.h[mask]), column.reshape(-1))),
+            shape=(len(y_unique), len(combinations)),
+        )
+        # each (x, (r_2, z)) entry of the product is unique
+        product = (left @ right).tocoo()
+        r2, z = numpy.divmod(combinations[product.col], self.num_entities)
+        keys = self._pack(x_unique[product.row], z)
+        support = numpy.bincount(r2, minlength=self.num_relations)
+        # count the matching pairs for all (r_2, r) combinations at once
+        columns = numpy.searchsorted(self.keys, keys).clip(max=len(self.keys) - 1)
+        found = self.keys[columns] == keys
+        lhs = scipy.sparse.csr_matrix(
+            (numpy.ones(found.sum(), dtype=numpy.int64), (r2[found], columns[found])),
+            shape=(self.num_relations, len(self.keys)),
+        )
+        counts = (lhs @ self.incidence.T).toarray()
+        # skip empty support
+        for r2 in numpy.flatnonzero(support).tolist():
+            for r in self.relations:
+                yield PatternMatch(r, PATTERN_TYPE_COMPOSITION, int(support[r2]), counts[r2, r] / support[r2])
+
+
+def _iter_unary_patterns_sparse(index: _RelationPatternIndex) -> Iterable[PatternMatch]:
+    """
+    Yield unary patterns from a sparse index, cf. :func:`iter_unary_patterns`.
+
+    :param index:
+        The sparse index of the triples.
+
+    :yields: A pattern match tuple of relation_id, pattern_type, support, and confidence.
+    """
+    logger.debug("Evaluating unary patterns: {symmetry, anti-symmetry}")
+    num_symmetric = index.count_symmetric()
+    for r in index.relations:
+        support = int(index.support[r])
+        confidence = num_symmetric[r] / support
+        yield PatternMatch(r, PATTERN_TYPE_SYMMETRY, support, confidence)
+        yield PatternMatch(r, PATTERN_TYPE_ANTI_SYMMETRY, support, 1 - confidence)
+
+
+def _iter_binary_patterns_sparse(index: _RelationPatternIndex) -> Iterable[PatternMatch]:
+    """
+    Yield binary patterns from a sparse index, cf. :func:`iter_binary_patterns`.
+
+    :param index:
+        The sparse index of the triples.
+
+    :yields: A pattern match tuple of relation_id, pattern_type, support, and confidence.
+    """
+    logger.debug("Evaluating binary patterns: {inversion}")
+    shared = index.count_shared()
+    for i, r1 in enumerate(index.relations):
+        support = int(index.support[r1])
+        counts = shared.getrow(r1).toarray().reshape(-1)
+        for r in index.relations[i + 1 :]:
+            yield PatternMatch(r, PATTERN_TYPE_INVERSION, support, counts[r] / support)
+
+
+#: the index of a worker process in multi-process pattern mining, cf. :func:`_init_pattern_worker`
+_PATTERN_INDEX: Optional[_RelationPatternIndex] = None
+
+
+def _init_pattern_worker(index: _RelationPatternIndex) -> None:
+    """Initialize a worker process for multi-process pattern mining."""
+    global _PATTERN_INDEX
+    _PATTERN_INDEX = index
+
+
+def _evaluate_composition(r1: int) -> List[PatternMatch]:
+    """Evaluate the composition patterns for a first body relation in a worker process."""
+    assert _PATTERN_INDEX is not None
+    return list(_PATTERN_INDEX.iter_composition_matches(r1=r1))
+
+
+def _iter_ternary_patterns_sparse(index: _RelationPatternIndex, num_workers: int = 0) -> Iterable[PatternMatch]:
+    """
+    Yield ternary patterns from a sparse index, cf. :func:`iter_ternary_patterns`.
+
+    :param index:
+        The sparse index of the triples.
+    :param num_workers:
+        The number of worker processes, each evaluating the compositions for one first body relation at a time.
+        If 0, evaluate them in the main process.
+
+    :yields: A pattern match tuple of relation_id, pattern_type, support, and confidence.
+    """
+    logger.debug("Evaluating ternary patterns: {composition}")
+    progress = tqdm(index.relations, desc="Checking ternary patterns", unit="relation", unit_scale=True)
+    if num_workers <= 0:
+        for r1 in progress:
+            yield from index.iter_composition_matches(r1=r1)
+        return
+    with multiprocessing.get_context("spawn").Pool(
+        processes=num_workers, initializer=_init_pattern_worker, initargs=(index,)
+    ) as pool:
+        for matches in pool.imap_unordered(_evaluate_composition, progress):
+            yield from matches
+
+
 def iter_patterns(
-    mapped_triples: Collection[Tuple[int, int, int]],
+    mapped_triples: Union[MappedTriples, Collection[Tuple[int, int, int]]],
+    num_workers: int = 0,
 ) -> Iterable[PatternMatch]:
     """Iterate over unary, binary, and ternary patterns.
 
+    The patterns are computed with sparse matrix products on an index of the unique triples, and match those of
+    the set-based implementations.
+
     :param mapped_triples:
         A collection of ID-based triples.
+    :param num_workers:
+        The number of worker processes for evaluating the ternary patterns.
 
     :yields: Patterns from :func:`iter_unary_patterns`, func:`iter_binary_patterns`, and :func:`iter_ternary_patterns`.
     """
-    pairs = index_pairs(mapped_triples)
+    index = _RelationPatternIndex(mapped_triples=mapped_triples)
 
-    yield from iter_unary_patterns(pairs=pairs)
-    yield from iter_binary_patterns(pairs=pairs)
-    yield from iter_ternary_patterns(mapped_triples, pairs=pairs)
+    yield from _iter_unary_patterns_sparse(index=index)
+    yield from _iter_binary_patterns_sparse(index=index)
+    yield from _iter_ternary_patterns_sparse(index=index, num_workers=num_workers)
 
 
 def triple_set_hash(
@@ -507,7 +706,8 @@ def get_relation_counts(
 
 
 def relation_pattern_types(
-    mapped_triples: Collection[Tuple[int, int, int]],
+    mapped_triples: Union[MappedTriples, Collection[Tuple[int, int, int]]],
+    num_workers: int = 0,
 ) -> pd.DataFrame:
     r"""
     Categorize relations based on patterns from RotatE [sun2019]_.
@@ -534,11 +734,13 @@ def relation_pattern_types(
 
     :param mapped_triples:
         A collection of ID-based triples.
+    :param num_workers:
+        The number of worker processes for evaluating the ternary patterns, cf. :func:`iter_patterns`.
     :returns:
         A dataframe of relation categorization
     """
     # determine patterns from triples
-    base = iter_patterns(mapped_triples=mapped_triples)
+    base = iter_patterns(mapped_triples=mapped_triples, num_workers=num_workers)
 
     # drop zero-confidence
     base = (pattern for pattern in base if pattern.confidence > 0)
@@ -4,7 +4,7 @@
 
 import math
 from abc import ABC, abstractmethod
-from typing import Callable, Generic, Iterable, Iterator, List, NamedTuple, Optional, Tuple, TypeVar
+from typing import Callable, Generic, Iterable, Iterator, List, NamedTuple, Optional, Tuple, TypeVar, Union
 
 import numpy as np
 import scipy.sparse
@@ -14,12 +14,14 @@ from torch.utils import data
 
 from .utils import compute_compressed_adjacency_list
 from ..sampling import NegativeSampler, negative_sampler_resolver
-from ..typing import MappedTriples
+from ..typing import DeviceHint, MappedTriples
+from ..utils import resolve_device
 
 __all__ = [
     "Instances",
     "SLCWAInstances",
     "LCWAInstances",
+    "BatchedLCWAInstances",
 ]
 
 # TODO: the same
@@ -43,6 +45,19 @@ class SLCWABatch(NamedTuple):
     masks: Optional[torch.BoolTensor]
 
 
+def _split_workload(n: int) -> range:
+    """Split workload for multi-processing."""
+    # cf. https://pytorch.org/docs/stable/data.html#torch.utils.data.IterableDataset
+    worker_info = torch.utils.data.get_worker_info()
+    if worker_info is None:  # single-process data loading, return the full iterator
+        return range(n)
+    num_workers = worker_info.num_workers
+    worker_id = worker_info.id  # 1-based
+    start = math.ceil(n / num_workers * worker_id)
+    stop = math.ceil(n / num_workers * (worker_id + 1))
+    return range(start, stop)
+
+
 class Instances(data.Dataset[BatchType], Generic[SampleType, BatchType], ABC):
     """Base class for training instances."""
 
@@ -206,7 +221,7 @@ class BaseBatchedSLCWAInstances(data.IterableDataset[SLCWABatch]):
             num_relations=num_relations,
         )
 
-    def __getitem__(self, item: List[int]) -> SLCWABatch:
+    def __getitem__(self, item: Union[List[int], torch.LongTensor]) -> SLCWABatch:
         """Get a batch from the given list of positive triple IDs."""
         positive_batch = self.mapped_triples[item]
         negative_batch, masks = self.negative_sampler.sample(positive_batch=positive_batch)
@@ -214,20 +229,10 @@ class BaseBatchedSLCWAInstances(data.IterableDataset[SLCWABatch]):
 
     def split_workload(self, n: int) -> range:
         """Split workload for multi-processing."""
-        # cf. https://pytorch.org/docs/stable/data.html#torch.utils.data.IterableDataset
-        worker_info = torch.utils.data.get_worker_info()
-        if worker_info is None:  # single-process data loading, return the full iterator
-            workload = range(n)
-        else:
-            num_workers = worker_info.num_workers
-            worker_id = worker_info.id  # 1-based
-            start = math.ceil(n / num_workers * worker_id)
-            stop = math.ceil(n / num_workers * (worker_id + 1))
-            workload = range(start, stop)
-        return workload
+        return _split_workload(n=n)
 
     @abstractmethod
-    def iter_triple_ids(self) -> Iterable[List[int]]:
+    def iter_triple_ids(self) -> Iterable[Union[List[int], torch.LongTensor]]:
         """Iterate over batches of IDs of positive triples."""
         raise NotImplementedError
 
@@ -256,6 +261,50 @@ class BatchedSLCWAInstances(BaseBatchedSLCWAInstances):
         )
 
 
+class DeviceBatchedSLCWAInstances(BaseBatchedSLCWAInstances):
+    """
+    Random pre-batched training instances for the sLCWA training loop, which are created on a device.
+
+    The positive triples and the negative sampler, including its filterer, are moved to the device once. Batching,
+    corruption and filtering then happen on the device using a device-side random number generator. Thereby, neither
+    host-to-device copies nor data loader worker processes are required, which is beneficial if all triples fit into
+    the device's memory.
+
+    .. note ::
+        since all tensors reside on the device, this dataset must be used without worker processes and without
+        memory pinning.
+    """
+
+    def __init__(self, *, device: DeviceHint = None, seed: Optional[int] = None, **kwargs):
+        """
+        Initialize the instances.
+
+        :param device:
+            the device, or None to use the default device, cf. :func:`pykeen.utils.resolve_device`
+        :param seed:
+            the random seed for the device-side generator. If None, it is drawn from the global torch random state,
+            i.e., it is reproducible via :func:`pykeen.utils.set_random_seed`.
+        :param kwargs:
+            keyword-based parameters passed to :meth:`BaseBatchedSLCWAInstances.__init__`
+        """
+        super().__init__(**kwargs)
+        self.device = resolve_device(device)
+        self.mapped_triples = self.mapped_triples.to(device=self.device)
+        self.negative_sampler = self.negative_sampler.to(device=self.device)
+        if seed is None:
+            seed = int(torch.randint(2**31, size=tuple()))
+        self.generator = torch.Generator(device=self.device).manual_seed(seed)
+        self.negative_sampler.generator = self.generator
+
+    # docstr-coverage: inherited
+    def iter_triple_ids(self) -> Iterable[torch.LongTensor]:  # noqa: D102
+        if torch.utils.data.get_worker_info() is not None:
+            raise RuntimeError(f"{self.__class__.__name__} does not support data loader worker processes.")
+        triple_ids = torch.randperm(self.mapped_triples.shape[0], device=self.device, generator=self.generator)
+        batches = triple_ids.split(self.batch_size)
+        yield from batches[: len(self)]
+
+
 class SubGraphSLCWAInstances(BaseBatchedSLCWAInstances):
     """Pre-batched training instances for SLCWA of coherent subgraphs."""
 
@@ -272,8 +321,8 @@ class SubGraphSLCWAInstances(BaseBatchedSLCWAInstances):
             mapped_triples=self.mapped_triples
         )
 
-    def subgraph_sample(self) -> List[int]:
-        """Sample one subgraph."""
+    def subgraph_sample(self) -> Union[List[int], torch.LongTensor]:
+        """Sample one subgraph, and return the IDs of its triples."""
         # initialize
         node_weights = self.degrees.detach().clone()
         edge_picked = torch.zeros(self.mapped_triples.shape[0], dtype=torch.bool)
@@ -325,10 +374,64 @@ class SubGraphSLCWAInstances(BaseBatchedSLCWAInstances):
         return result
 
     # docstr-coverage: inherited
-    def iter_triple_ids(self) -> Iterable[List[int]]:  # noqa: D102
+    def iter_triple_ids(self) -> Iterable[Union[List[int], torch.LongTensor]]:  # noqa: D102
         yield from (self.subgraph_sample() for _ in self.split_workload(n=len(self)))
 
 
+class FrontierSubGraphSLCWAInstances(SubGraphSLCWAInstances):
+    r"""Pre-batched training instances for SLCWA of coherent subgraphs, sampled by vectorized frontier expansion.
+
+    Like :class:`SubGraphSLCWAInstances`, each subgraph is grown from a random start, where new edges are drawn from the
+    not yet chosen edges incident to the already chosen nodes, i.e., each node is weighted by its number of remaining
+    incident edges. However, instead of adding a single edge at a time, each step adds as many edges as have already
+    been chosen, such that a subgraph with $b$ edges requires only $\mathcal{O}(\log b)$ vectorized steps. If no
+    incident edges are left, sampling restarts from a random edge, which has not been chosen yet.
+    """
+
+    def _get_incident_triple_ids(self, nodes: torch.LongTensor) -> torch.LongTensor:
+        """Get the IDs of all triples incident to the given nodes, with repetition for triples incident to both."""
+        degrees = self.degrees[nodes]
+        # position within the respective adjacency list
+        local = torch.arange(degrees.sum()) - (torch.cumsum(degrees, dim=0) - degrees).repeat_interleave(degrees)
+        return self.neighbors[self.offset[nodes].repeat_interleave(degrees) + local, 0]
+
+    # docstr-coverage: inherited
+    def subgraph_sample(self) -> torch.LongTensor:  # noqa: D102
+        num_triples = self.mapped_triples.shape[0]
+        batch_size = min(self.batch_size, num_triples)
+        edge_picked = torch.zeros(num_triples, dtype=torch.bool)
+        node_picked = torch.zeros(self.degrees.shape[0], dtype=torch.bool)
+        # the candidate edges, with one entry per chosen endpoint
+        pool = torch.empty(0, dtype=torch.long)
+        result: List[torch.LongTensor] = []
+        num_chosen = 0
+        while num_chosen < batch_size:
+            pool = pool[~edge_picked[pool]]
+            if pool.numel() == 0:
+                # randomly choose an edge which has not been chosen yet
+                remaining = (~edge_picked).nonzero().view(-1)
+                chosen = remaining[torch.randint(remaining.numel(), size=(1,))]
+            else:
+                # choose edges uniformly from the pool without replacement; for edges with multiple entries, the first
+                # occurrence after shuffling counts, such that edges incident to two chosen nodes are more likely
+                pool = pool[torch.randperm(pool.numel())]
+                unique_edges, inverse = pool.unique(return_inverse=True)
+                first_occurrence = torch.full_like(unique_edges, fill_value=pool.numel()).scatter_reduce_(
+                    0, inverse, torch.arange(pool.numel()), reduce="amin"
+                )
+                num = min(batch_size - num_chosen, max(num_chosen, 1))
+                chosen = unique_edges[first_occurrence.argsort()[:num]]
+            edge_picked[chosen] = True
+            result.append(chosen)
+            num_chosen += chosen.numel()
+            # visit the new nodes, and add their incident edges to the pool
+            nodes = self.mapped_triples[chosen][:, [0, 2]].unique()
+            nodes = nodes[~node_picked[nodes]]
+            node_picked[nodes] = True
+            pool = torch.cat([pool, self._get_incident_triple_ids(nodes=nodes)])
+        return torch.cat(result)
+
+
 class LCWAInstances(Instances[LCWASampleType, LCWABatchType]):
     """Triples and mappings to their indices for LCWA."""
 
@@ -389,3 +492,124 @@ class LCWAInstances(Instances[LCWASampleType, LCWABatchType]):
 
     def __getitem__(self, item: int) -> LCWABatchType:  # noqa: D105
         return self.pairs[item], np.asarray(self.compressed[item, :].todense())[0, :]
+
+
+class BatchedLCWAInstances(data.IterableDataset[LCWABatchType]):
+    """
+    Pre-batched training instances for the LCWA training loop.
+
+    In contrast to :class:`LCWAInstances`, which slices and densifies one row of a sparse matrix per pair, whole
+    batches are gathered from the compressed sparse row representation using vectorized tensor operations. The labels
+    are returned as a sparse COO tensor of shape `(batch_size, num_targets)`, which is only densified on the training
+    device, cf. :meth:`pykeen.training.LCWATrainingLoop._process_batch_static`.
+
+    .. note ::
+        this class is intended to be used with automatic batching disabled, i.e., both parameters `batch_size` and
+        `batch_sampler` of torch.utils.data.DataLoader` are set to `None`.
+    """
+
+    def __init__(
+        self,
+        *,
+        pairs: np.ndarray,
+        compressed: scipy.sparse.csr_matrix,
+        batch_size: int = 1,
+        drop_last: bool = False,
+        shuffle: bool = True,
+    ):
+        """
+        Initialize the dataset.
+
+        :param pairs: shape: (num_pairs, 2)
+            the unique pairs
+        :param compressed: shape: (num_pairs, num_targets)
+            the compressed triples in CSR format
+        :param batch_size:
+            the batch size
+        :param drop_last:
+            whether to drop the last (incomplete) batch
+        :param shuffle:
+            whether to shuffle the pairs
+        """
+        self.pairs = torch.as_tensor(pairs, dtype=torch.long)
+        self.num_targets = compressed.shape[1]
+        # CSR representation; shape: (num_pairs + 1,), (nnz,), (nnz,)
+        self.offsets = torch.as_tensor(compressed.indptr, dtype=torch.long)
+        self.targets = torch.as_tensor(compressed.indices, dtype=torch.long)
+        self.values = torch.as_tensor(compressed.data, dtype=torch.get_default_dtype())
+        self.batch_size = batch_size
+        self.drop_last = drop_last
+        self.shuffle = shuffle
+
+    @classmethod
+    def from_triples(
+        cls,
+        mapped_triples: MappedTriples,
+        *,
+        num_entities: int,
+        num_relations: int,
+        target: Optional[int] = None,
+        **kwargs,
+    ) -> "BatchedLCWAInstances":
+        """
+        Create batched LCWA instances from triples.
+
+        :param mapped_triples: shape: (num_triples, 3)
+            The ID-based triples.
+        :param num_entities:
+            The number of entities.
+        :param num_relations:
+            The number of relations.
+        :param target:
+            The column to predict
+        :param kwargs:
+            additional keyword-based parameters passed to :meth:`BatchedLCWAInstances.__init__`
+
+        :return:
+            The instances.
+        """
+        instances = LCWAInstances.from_triples(
+            mapped_triples=mapped_triples, num_entities=num_entities, num_relations=num_relations, target=target
+        )
+        assert isinstance(instances, LCWAInstances)
+        return cls(pairs=instances.pairs, compressed=instances.compressed, **kwargs)
+
+    def __getitem__(self, item: Union[List[int], torch.LongTensor]) -> LCWABatchType:
+        """Get a batch from the given pair IDs."""
+        pair_ids = torch.as_tensor(item, dtype=torch.long)
+        starts = self.offsets[pair_ids]
+        counts = self.offsets[pair_ids + 1] - starts
+        # shape: (nnz,)
+        rows = torch.repeat_interleave(torch.arange(pair_ids.shape[0]), counts)
+        # position in the CSR arrays = start of the row + position within the row
+        positions = torch.arange(rows.shape[0]) - (torch.cumsum(counts, dim=0) - counts)[rows] + starts[rows]
+        labels = torch.sparse_coo_tensor(
+            indices=torch.stack([rows, self.targets[positions]]),
+            values=self.values[positions],
+            size=(pair_ids.shape[0], self.num_targets),
+        )
+        return self.pairs[pair_ids], labels
+
+    def __iter__(self) -> Iterator[LCWABatchType]:
+        """Iterate over batches."""
+        num_pairs = self.pairs.shape[0]
+        if self.shuffle:
+            generator = None
+            worker_info = torch.utils.data.get_worker_info()
+            if worker_info is not None:
+                # all workers have to use the same permutation to obtain disjoint batches
+                generator = torch.Generator().manual_seed(worker_info.seed - worker_info.id)
+            pair_ids = torch.randperm(num_pairs, generator=generator)
+        else:
+            pair_ids = torch.arange(num_pairs)
+        batches = pair_ids.split(self.batch_size)
+        # split the workload by batches, such that the total number of batches matches __len__
+        for i in _split_workload(n=len(self)):
+            yield self[batches[i]]
+
+    def __len__(self) -> int:
+        """Return the number of batches."""
+        num_batches, remainder = divmod(self.pairs.shape[0], self.batch_size)
+        if remainder and not self.drop_last:
+            num_batches += 1
+        return num_batches
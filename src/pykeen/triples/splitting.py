@@ -109,6 +109,69 @@ def _get_cover_deterministic(triples: MappedTriples) -> torch.BoolTensor:
     return seed_mask
 
 
+def _get_first_occurrence(ids: torch.LongTensor, order: torch.LongTensor, max_id: int) -> torch.LongTensor:
+    """
+    Get, for each ID, the smallest order of all positions where it occurs, via a single scatter-min.
+
+    :param ids: shape: (n, k)
+        the IDs, k per position
+    :param order: shape: (n,)
+        the order of the positions, a permutation of ``range(n)``
+    :param max_id:
+        the maximum ID (exclusive)
+
+    :return: shape: (max_id,)
+        the smallest order among all positions where the ID occurs, or n if it does not occur
+    """
+    num = order.shape[0]
+    order = order.unsqueeze(dim=-1).expand_as(ids)
+    return torch.full((max_id,), fill_value=num, dtype=torch.long).scatter_reduce_(
+        0, ids.reshape(-1), order.reshape(-1), reduce="amin"
+    )
+
+
+def _get_cover_randomized(triples: MappedTriples, permutation: torch.LongTensor) -> torch.BoolTensor:
+    """
+    Get a coverage mask for all entities and relations, preferring triples early in a random order.
+
+    The implementation is vectorized, and does not require any iteration over entities or relations:
+
+    1. Select, for each relation, the first triple with this relation.
+    2. Select, for each entity which is not yet covered, the first triple containing this entity as head or tail.
+
+    Each step is a single scatter-min over the triples' ranks. Similarly to :func:`_get_cover_deterministic`, the
+    cover is guaranteed to contain at most $num_relations + num_entities$ triples.
+
+    :param triples: shape: (n, 3)
+        The triples (ID-based).
+    :param permutation: shape: (n,)
+        The triple IDs in a random order, i.e., a permutation of ``range(n)``.
+
+    :return: shape: (n,)
+        A boolean mask indicating whether the triple is part of the cover.
+    """
+    num_triples = triples.shape[0]
+    # inverse permutation: the rank of each triple
+    rank = torch.empty_like(permutation)
+    rank[permutation] = torch.arange(num_triples)
+
+    # select one triple per relation
+    first = _get_first_occurrence(ids=triples[:, 1:2], order=rank, max_id=triples[:, 1].max().item() + 1)
+    chosen = permutation[first[first < num_triples]]
+    seed_mask = torch.zeros(num_triples, dtype=torch.bool)
+    seed_mask[chosen] = True
+
+    # select one triple per entity which is not yet covered by the relations' triples
+    entities = triples[:, [0, 2]]
+    max_id = entities.max().item() + 1
+    covered = torch.zeros(max_id, dtype=torch.bool)
+    covered[entities[chosen].reshape(-1)] = True
+    first = _get_first_occurrence(ids=entities, order=rank, max_id=max_id)
+    first = first[~covered]
+    seed_mask[permutation[first[first < num_triples]]] = True
+    return seed_mask
+
+
 class TripleCoverageError(RuntimeError):
     """An exception thrown when not all entities/relations are covered by triples."""
 
@@ -456,6 +519,40 @@ class CoverageSplitter(Splitter):
         return [torch.cat([train_seed, train], dim=0), *rest]
 
 
+class RandomizedCoverageSplitter(Splitter):
+    """
+    This splitter selects training triples such that each entity is covered in a single pass and then splits the rest.
+
+    In contrast to :class:`CoverageSplitter`, the triples are first shuffled, and the covering triples are chosen as
+    the first occurrence of each relation and entity in this random order, cf. :func:`_get_cover_randomized`. This is
+    fully vectorized, and thus also scales to very large graphs. Moreover, in contrast to the
+    :class:`CleanupSplitter`, no triples have to be moved between the split parts afterwards.
+    """
+
+    # docstr-coverage: inherited
+    def split_absolute_size(
+        self,
+        mapped_triples: MappedTriples,
+        sizes: Sequence[int],
+        random_state: torch.Generator,
+    ) -> Sequence[MappedTriples]:  # noqa: D102
+        num_triples = mapped_triples.shape[0]
+        if sum(sizes) != num_triples:
+            raise ValueError(f"Received {num_triples} triples, but the sizes sum up to {sum(sizes)}")
+        if num_triples == 0:
+            return [mapped_triples] * len(sizes)
+        idx = torch.randperm(num_triples, generator=random_state)
+        seed_mask = _get_cover_randomized(triples=mapped_triples, permutation=idx)
+        num_seed = int(seed_mask.sum())
+        if num_seed > sizes[0]:
+            raise ValueError(f"Could not find a coverage of all entities and relation with only {sizes[0]} triples.")
+        # the remaining triples are already in random order
+        idx = idx[~seed_mask[idx]]
+        remaining_sizes = [sizes[0] - num_seed, *sizes[1:]]
+        train, *rest = (mapped_triples[i] for i in idx.split(split_size=remaining_sizes, dim=0))
+        return [torch.cat([mapped_triples[seed_mask], train], dim=0), *rest]
+
+
 splitter_resolver: ClassResolver[Splitter] = ClassResolver.from_subclasses(base=Splitter, default=CoverageSplitter)
 
 
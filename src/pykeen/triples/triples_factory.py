@@ -6,6 +6,7 @@ import dataclasses
 import logging
 import pathlib
 import re
+import tempfile
 import warnings
 from typing import (
     Any,
@@ -14,6 +15,7 @@ from typing import (
     Collection,
     Dict,
     Iterable,
+    Iterator,
     List,
     Mapping,
     MutableMapping,
@@ -22,6 +24,7 @@ from typing import (
     Set,
     TextIO,
     Tuple,
+    Type,
     Union,
     cast,
 )
@@ -31,10 +34,17 @@ import pandas as pd
 import torch
 from torch.utils.data import Dataset
 
-from .instances import BatchedSLCWAInstances, LCWAInstances, SubGraphSLCWAInstances
+from .instances import (
+    BaseBatchedSLCWAInstances,
+    BatchedLCWAInstances,
+    BatchedSLCWAInstances,
+    DeviceBatchedSLCWAInstances,
+    FrontierSubGraphSLCWAInstances,
+    LCWAInstances,
+    SubGraphSLCWAInstances,
+)
 from .splitting import split
-from .utils import TRIPLES_DF_COLUMNS, load_triples, tensor_to_df
-from ..constants import COLUMN_LABELS
+from .utils import TRIPLES_DF_COLUMNS, iter_triples_chunks, load_triples, tensor_to_df
 from ..inverse import relation_inverter_resolver
 from ..typing import EntityMapping, LabeledTriples, MappedTriples, RelationMapping, TorchRandomHint
 from ..utils import (
@@ -51,6 +61,8 @@ __all__ = [
     "KGInfo",
     "CoreTriplesFactory",
     "TriplesFactory",
+    "Labeling",
+    "ArrayLabeling",
     "create_entity_mapping",
     "create_relation_mapping",
     "INVERSE_SUFFIX",
@@ -65,6 +77,40 @@ logger = logging.getLogger(__name__)
 
 INVERSE_SUFFIX = "_inverse"
 
+#: the sLCWA instances for each batch sampler; unknown samplers fall back to schlichtkrull-style subgraph sampling
+SLCWA_SAMPLERS: Mapping[Optional[str], Type[BaseBatchedSLCWAInstances]] = {
+    None: BatchedSLCWAInstances,
+    "schlichtkrull": SubGraphSLCWAInstances,
+    "frontier": FrontierSubGraphSLCWAInstances,
+}
+
+
+def _encode_labels(labels: Iterable[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Encode labels as one contiguous buffer of UTF-8 bytes, and the offsets of the labels therein."""
+    encoded = [label.encode("utf-8") for label in labels]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(label) for label in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _save_label_arrays(path: pathlib.Path, labeling: Union["Labeling", "ArrayLabeling"]) -> None:
+    """Save a labeling as the concatenated UTF-8 encoded labels with offsets, and the labels' IDs."""
+    if isinstance(labeling, ArrayLabeling):
+        np.savez(path, ids=labeling.ids, offsets=labeling.offsets, data=labeling.data)
+        return
+    items = sorted(labeling.label_to_id.items(), key=lambda pair: pair[1])
+    data, offsets = _encode_labels(label for label, _ in items)
+    np.savez(path, ids=np.asarray([i for _, i in items], dtype=np.int64), offsets=offsets, data=data)
+
+
+def _load_label_arrays(path: pathlib.Path) -> Dict[str, int]:
+    """Load a label-to-ID mapping stored by :func:`_save_label_arrays`."""
+    with np.load(path) as arrays:
+        buffer = arrays["data"].tobytes()
+        offsets = arrays["offsets"].tolist()
+        ids = arrays["ids"].tolist()
+    return {buffer[start:stop].decode("utf-8"): i for start, stop, i in zip(offsets, offsets[1:], ids)}
+
 
 def create_entity_mapping(triples: LabeledTriples) -> EntityMapping:
     """Create mapping from entity labels to IDs.
@@ -99,8 +145,8 @@ def create_relation_mapping(relations: Iterable[str]) -> RelationMapping:
 
 def _map_triples_elements_to_ids(
     triples: LabeledTriples,
-    entity_to_id: EntityMapping,
-    relation_to_id: RelationMapping,
+    entity_to_id: Union[EntityMapping, "Labeling", "ArrayLabeling"],
+    relation_to_id: Union[RelationMapping, "Labeling", "ArrayLabeling"],
 ) -> MappedTriples:
     """Map entities and relations to pre-defined ids."""
     if triples.size == 0:
@@ -108,11 +154,11 @@ def _map_triples_elements_to_ids(
         return torch.empty(0, 3, dtype=torch.long)
 
     # When triples that don't exist are trying to be mapped, they get the id "-1"
-    entity_getter = np.vectorize(entity_to_id.get)
-    head_column = entity_getter(triples[:, 0:1], [-1])
-    tail_column = entity_getter(triples[:, 2:3], [-1])
-    relation_getter = np.vectorize(relation_to_id.get)
-    relation_column = relation_getter(triples[:, 1:2], [-1])
+    entity_getter = _get_label_mapper(entity_to_id)
+    head_column = entity_getter(triples[:, 0:1])
+    tail_column = entity_getter(triples[:, 2:3])
+    relation_getter = _get_label_mapper(relation_to_id)
+    relation_column = relation_getter(triples[:, 1:2])
 
     # Filter all non-existent triples
     head_filter = head_column < 0
@@ -144,6 +190,138 @@ def _map_triples_elements_to_ids(
     return torch.tensor(unique_mapped_triples, dtype=torch.long)
 
 
+def _update_vocabulary(vocabulary: Dict[str, int], labels: np.ndarray) -> np.ndarray:
+    """Map labels to temporary IDs in order of first occurrence, and add unseen labels to the vocabulary."""
+    codes, uniques = pd.factorize(labels.ravel())
+    ids = np.fromiter(
+        (vocabulary.setdefault(label, len(vocabulary)) for label in uniques), dtype=np.int64, count=len(uniques)
+    )
+    return ids[codes].reshape(labels.shape)
+
+
+def _unique_mapped_triples(mapped_triples: np.ndarray, num_entities: int, num_relations: int) -> np.ndarray:
+    """Return the unique rows of the ID-based triples, sorted lexicographically, like ``np.unique(axis=0)``."""
+    if num_entities * num_relations * num_entities >= 2**63:
+        return np.unique(mapped_triples, axis=0)
+    # pack each triple into a single integer, which is considerably faster than the row-wise unique
+    keys = (mapped_triples[:, 0] * num_relations + mapped_triples[:, 1]) * num_entities + mapped_triples[:, 2]
+    keys = np.unique(keys)
+    keys, tails = np.divmod(keys, num_entities)
+    heads, relations = np.divmod(keys, num_relations)
+    return np.stack([heads, relations, tails], axis=-1)
+
+
+def _map_triples_chunks_to_ids(
+    chunks: Iterable[LabeledTriples],
+    entity_to_id: Optional[EntityMapping] = None,
+    relation_to_id: Optional[RelationMapping] = None,
+    compact_id: bool = True,
+    chunk_size: int = 1_000_000,
+) -> Tuple[EntityMapping, RelationMapping, MappedTriples]:
+    """
+    Map chunks of label-based triples to IDs, without materializing all label-based triples at once.
+
+    The result is the same as when concatenating all chunks, and passing them to
+    :meth:`TriplesFactory.from_labeled_triples`: if no mapping is given, the vocabulary is collected incrementally,
+    and the IDs are re-assigned in sorted label order once all chunks have been processed. The ID-based triples are
+    written to a temporary memory-mapped file, such that only the final de-duplication needs them in memory.
+
+    :param chunks:
+        the chunks of label-based triples, each of shape (n_i, 3)
+    :param entity_to_id:
+        The mapping from entity labels to ID. If None, create a new one from the triples.
+    :param relation_to_id:
+        The mapping from relations labels to ID. If None, create a new one from the triples.
+    :param compact_id:
+        Whether to compact IDs of given mappings such that the IDs are consecutive.
+    :param chunk_size:
+        the number of triples to re-map at once
+
+    :return:
+        a triple (entity_to_id, relation_to_id, mapped_triples)
+    """
+    # fixed mappings are applied directly, otherwise we collect the vocabulary in order of first occurrence
+    entity_vocabulary: Dict[str, int] = {}
+    relation_vocabulary: Dict[str, int] = {}
+    entity_mapper = relation_mapper = None
+    if entity_to_id is not None:
+        if compact_id:
+            entity_to_id = compact_mapping(mapping=entity_to_id)[0]
+        entity_mapper = _get_label_mapper(entity_to_id)
+    if relation_to_id is not None:
+        if compact_id:
+            relation_to_id = compact_mapping(mapping=relation_to_id)[0]
+        relation_mapper = _get_label_mapper(relation_to_id)
+
+    num_triples = num_read = num_inverse = 0
+    with tempfile.TemporaryFile() as buffer:
+        for triples in chunks:
+            num_read += triples.shape[0]
+            # cf. TriplesFactory.from_labeled_triples; only check the (few) unique relation labels
+            codes, uniques = pd.factorize(triples[:, 1])
+            is_inverse = np.asarray([label.endswith(INVERSE_SUFFIX) for label in uniques], dtype=bool)[codes]
+            if is_inverse.any():
+                num_inverse += int(is_inverse.sum())
+                triples = triples[~is_inverse]
+            if entity_mapper is None:
+                entity_ids = _update_vocabulary(entity_vocabulary, triples[:, [0, 2]])
+            else:
+                entity_ids = entity_mapper(triples[:, [0, 2]])
+            if relation_mapper is None:
+                relation_ids = _update_vocabulary(relation_vocabulary, triples[:, 1])
+            else:
+                relation_ids = relation_mapper(triples[:, 1])
+            mapped = np.stack([entity_ids[:, 0], relation_ids, entity_ids[:, 1]], axis=-1).astype(np.int64)
+            # filter all non-existent triples
+            mapped = mapped[(mapped >= 0).all(axis=-1)]
+            buffer.write(mapped.tobytes())
+            num_triples += mapped.shape[0]
+        if num_inverse:
+            logger.warning(
+                f"{num_inverse} triples already have the inverse relation suffix {INVERSE_SUFFIX}, and were removed. "
+                f"Inverse triples are re-created to ensure consistency.",
+            )
+        num_kept = num_read - num_inverse
+        if num_triples < num_kept:
+            logger.warning(
+                f"In total {num_kept - num_triples:.0f} from {num_kept:.0f} triples were filtered out, since they "
+                f"contained entities or relations which are not in the given mappings.",
+            )
+
+        # re-assign temporary IDs in sorted order, cf. create_entity_mapping and create_relation_mapping
+        remaps = {}
+        if entity_mapper is None:
+            entity_to_id = {label: i for i, label in enumerate(sorted(entity_vocabulary))}
+            remaps[0] = remaps[2] = np.fromiter(
+                map(entity_to_id.__getitem__, entity_vocabulary), dtype=np.int64, count=len(entity_vocabulary)
+            )
+        if relation_mapper is None:
+            relation_to_id = create_relation_mapping(relation_vocabulary.keys())
+            remaps[1] = np.fromiter(
+                map(relation_to_id.__getitem__, relation_vocabulary), dtype=np.int64, count=len(relation_vocabulary)
+            )
+        assert entity_to_id is not None and relation_to_id is not None
+        if num_triples == 0:
+            logger.warning("Provided empty triples to map.")
+            return entity_to_id, relation_to_id, torch.empty(0, 3, dtype=torch.long)
+
+        buffer.flush()
+        mapped_triples = np.memmap(buffer, dtype=np.int64, mode="r+", shape=(num_triples, 3))
+        if remaps:
+            for start in range(0, num_triples, chunk_size):
+                block = mapped_triples[start : start + chunk_size]
+                for column, remap in remaps.items():
+                    block[:, column] = remap[block[:, column]]
+        # Note: Unique changes the order of the triples
+        unique_mapped_triples = _unique_mapped_triples(
+            mapped_triples,
+            num_entities=max(entity_to_id.values(), default=-1) + 1,
+            num_relations=max(relation_to_id.values(), default=-1) + 1,
+        )
+        del mapped_triples
+    return entity_to_id, relation_to_id, torch.from_numpy(unique_mapped_triples)
+
+
 def _get_triple_mask(
     ids: Collection[int],
     triples: MappedTriples,
@@ -168,10 +346,21 @@ def _get_triple_mask(
 
 def _ensure_ids(
     labels_or_ids: Union[Collection[int], Collection[str]],
-    label_to_id: Mapping[str, int],
+    label_to_id: Union[Mapping[str, int], "Labeling", "ArrayLabeling"],
 ) -> Collection[int]:
     """Convert labels to IDs."""
-    return [label_to_id[l_or_i] if isinstance(l_or_i, str) else l_or_i for l_or_i in labels_or_ids]
+    labels_or_ids = list(labels_or_ids)
+    is_label = [isinstance(l_or_i, str) for l_or_i in labels_or_ids]
+    if not any(is_label):
+        return labels_or_ids
+    # map all labels at once
+    labels = [l_or_i for l_or_i, flag in zip(labels_or_ids, is_label) if flag]
+    ids = _get_label_mapper(label_to_id)(np.asarray(labels)).tolist()
+    for label, i in zip(labels, ids):
+        if i < 0:
+            raise KeyError(label)
+    id_iter = iter(ids)
+    return [next(id_iter) if flag else l_or_i for l_or_i, flag in zip(labels_or_ids, is_label)]
 
 
 @dataclasses.dataclass
@@ -211,6 +400,10 @@ class Labeling:
         # label
         return self._vectorized_labeler(ids, (unknown_label,))
 
+    def map(self, labels: Union[str, Sequence[str], np.ndarray]) -> np.ndarray:
+        """Convert labels to IDs, where unknown labels are mapped to -1."""
+        return self._vectorized_mapper(np.asanyarray(labels), (-1,))
+
     @property
     def max_id(self) -> int:
         """Return the maximum ID (excl.)."""
@@ -221,6 +414,296 @@ class Labeling:
         return self.label(range(self.max_id))
 
 
+#: the offset basis and prime of the 64-bit FNV-1a hash, cf. http://www.isthe.com/chongo/tech/comp/fnv/
+_FNV_OFFSET_BASIS = 0xCBF29CE484222325
+_FNV_PRIME = 0x100000001B3
+
+
+def _iter_byte_positions(lengths: np.ndarray) -> Iterable[Tuple[int, np.ndarray]]:
+    """Iterate over the byte positions, and the indices of the labels which are long enough to have them."""
+    # process the labels by decreasing length, such that the labels with more than j bytes form a prefix
+    order = np.argsort(-lengths, kind="stable")
+    num_longer = np.searchsorted(-lengths[order], -np.arange(lengths.max(initial=0)), side="left")
+    for j, n in enumerate(num_longer.tolist()):
+        yield j, order[:n]
+
+
+def _hash_labels(data: np.ndarray, offsets: np.ndarray, seed: int = 0) -> np.ndarray:
+    """Compute a seeded 64-bit FNV-1a hash of the encoded labels, vectorized over the labels."""
+    starts = offsets[:-1]
+    hashes = np.full(len(starts), fill_value=_FNV_OFFSET_BASIS ^ seed, dtype=np.uint64)
+    prime = np.uint64(_FNV_PRIME)
+    for j, indices in _iter_byte_positions(np.diff(offsets)):
+        hashes[indices] = (hashes[indices] ^ data[starts[indices] + j]) * prime
+    return hashes
+
+
+class _LabelToIdView(Mapping[str, int]):
+    """A read-only mapping from labels to IDs for an :class:`ArrayLabeling`."""
+
+    def __init__(self, labeling: "ArrayLabeling"):
+        self.labeling = labeling
+
+    def __getitem__(self, label: str) -> int:
+        if not isinstance(label, str):
+            raise KeyError(label)
+        i = int(self.labeling.map([label])[0])
+        if i < 0:
+            raise KeyError(label)
+        return i
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.labeling.label(self.labeling.ids).tolist())
+
+    def __len__(self) -> int:
+        return len(self.labeling.ids)
+
+
+class _IdToLabelView(Mapping[int, str]):
+    """A read-only mapping from IDs to labels for an :class:`ArrayLabeling`."""
+
+    def __init__(self, labeling: "ArrayLabeling"):
+        self.labeling = labeling
+
+    def __getitem__(self, i: int) -> str:
+        if not isinstance(i, (int, np.integer)):
+            raise KeyError(i)
+        position = self.labeling._get_positions(np.asarray([i]))[0]
+        if position < 0:
+            raise KeyError(i)
+        return self.labeling._decode(position)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(np.flatnonzero(self.labeling.positions >= 0).tolist())
+
+    def __len__(self) -> int:
+        return len(self.labeling.ids)
+
+
+class ArrayLabeling:
+    """
+    A mapping between labels and IDs, which is backed by arrays rather than Python dictionaries.
+
+    The labels are stored as one contiguous buffer of UTF-8 encoded bytes with an offset array, sorted by a 64-bit
+    hash of the labels. Labels are mapped to IDs by a vectorized binary search over the sorted hashes, followed by an
+    exact comparison of the candidate's bytes, and IDs are mapped to labels via an ID-indexed position array.
+
+    Since there are no per-label Python objects, the memory requirement is close to the size of the encoded labels,
+    and forked worker processes do not trigger copy-on-write by reference counting. Moreover, the arrays can be
+    stored via :meth:`save`, and memory-mapped by multiple processes via :meth:`load`, without pickling.
+
+    It can be used in place of a :class:`Labeling`, e.g., by passing it as `entity_to_id` to :class:`TriplesFactory`.
+
+    >>> labeling = ArrayLabeling.from_label_to_id({"a": 0, "b": 1})
+    >>> labeling.map(["b", "c"]).tolist()
+    [1, -1]
+    >>> labeling.label([0, 2]).tolist()
+    ['a', 'unknown']
+    """
+
+    #: the names of the arrays, cf. :meth:`save`
+    array_names: ClassVar[Tuple[str, ...]] = ("data", "offsets", "ids", "hashes")
+
+    #: the maximum number of hash seeds to try to resolve collisions
+    max_seeds: ClassVar[int] = 8
+
+    def __init__(
+        self,
+        data: np.ndarray,
+        offsets: np.ndarray,
+        ids: np.ndarray,
+        hashes: np.ndarray,
+        seed: int = 0,
+    ):
+        """
+        Initialize the labeling from its arrays; use :meth:`from_labels` or :meth:`from_label_to_id` to create one.
+
+        :param data: shape: (num_bytes,), dtype: uint8
+            the UTF-8 encoded labels, sorted by hash
+        :param offsets: shape: (num_labels + 1,)
+            the offsets of the labels in `data`
+        :param ids: shape: (num_labels,)
+            the IDs of the labels
+        :param hashes: shape: (num_labels,), dtype: uint64
+            the sorted hashes of the labels
+        :param seed:
+            the seed of the hash function
+        """
+        self.data = data
+        self.offsets = offsets
+        self.ids = ids
+        self.hashes = hashes
+        self.seed = seed
+        self.positions = np.full(shape=(self.max_id,), fill_value=-1, dtype=np.int64)
+        self.positions[ids] = np.arange(len(ids))
+
+    @classmethod
+    def from_labels(cls, labels: Sequence[str], ids: Optional[Sequence[int]] = None) -> "ArrayLabeling":
+        """
+        Create a labeling from labels.
+
+        :param labels:
+            the labels
+        :param ids:
+            the IDs of the labels. Defaults to the position of the label.
+
+        :raises ValueError:
+            if there are duplicate labels
+
+        :return:
+            the labeling
+        """
+        data, offsets = _encode_labels(labels)
+        ids = np.arange(len(labels)) if ids is None else np.asarray(ids, dtype=np.int64)
+        for seed in range(cls.max_seeds):
+            hashes = _hash_labels(data=data, offsets=offsets, seed=seed)
+            order = np.argsort(hashes, kind="stable")
+            hashes = hashes[order]
+            # make sure that there are no collisions; otherwise try a different seed
+            if (hashes[1:] != hashes[:-1]).all():
+                break
+        else:
+            raise ValueError("The labels are not unique.")
+        # re-order buffer
+        lengths = np.diff(offsets)[order]
+        new_offsets = np.zeros_like(offsets)
+        np.cumsum(lengths, out=new_offsets[1:])
+        index = np.repeat(offsets[:-1][order] - new_offsets[:-1], lengths) + np.arange(new_offsets[-1])
+        return cls(data=data[index], offsets=new_offsets, ids=ids[order], hashes=hashes, seed=seed)
+
+    @classmethod
+    def from_label_to_id(cls, label_to_id: Mapping[str, int]) -> "ArrayLabeling":
+        """Create a labeling from a mapping from labels to IDs."""
+        return cls.from_labels(labels=list(label_to_id.keys()), ids=list(label_to_id.values()))
+
+    def save(self, directory: Union[str, pathlib.Path]) -> pathlib.Path:
+        """
+        Save the labeling's arrays to a directory.
+
+        :param directory:
+            the directory
+
+        :return:
+            the directory
+        """
+        directory = normalize_path(directory, mkdir=True)
+        for name in self.array_names:
+            np.save(directory.joinpath(f"{name}.npy"), getattr(self, name))
+        np.save(directory.joinpath("seed.npy"), np.asarray(self.seed))
+        return directory
+
+    @classmethod
+    def load(cls, directory: Union[str, pathlib.Path], mmap: bool = True) -> "ArrayLabeling":
+        """
+        Load a labeling from a directory.
+
+        :param directory:
+            the directory, as written by :meth:`save`
+        :param mmap:
+            whether to memory-map the arrays (read-only), such that multiple processes share the memory
+
+        :return:
+            the labeling
+        """
+        directory = normalize_path(directory)
+        mmap_mode = "r" if mmap else None
+        arrays = {name: np.load(directory.joinpath(f"{name}.npy"), mmap_mode=mmap_mode) for name in cls.array_names}
+        return cls(**arrays, seed=int(np.load(directory.joinpath("seed.npy"))))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (ArrayLabeling, Labeling)):
+            return NotImplemented
+        return dict(self.label_to_id) == dict(other.label_to_id)
+
+    @property
+    def max_id(self) -> int:
+        """Return the maximum ID (excl.)."""
+        return int(self.ids.max(initial=-1)) + 1
+
+    @property
+    def label_to_id(self) -> Mapping[str, int]:
+        """Return a (lazy) mapping from labels to IDs."""
+        return _LabelToIdView(self)
+
+    @property
+    def id_to_label(self) -> Mapping[int, str]:
+        """Return a (lazy) mapping from IDs to labels."""
+        return _IdToLabelView(self)
+
+    def _get_positions(self, ids: np.ndarray) -> np.ndarray:
+        """Get the positions of the labels for the given IDs, or -1 for unknown IDs."""
+        valid = (ids >= 0) & (ids < self.max_id)
+        return np.where(valid, self.positions[np.where(valid, ids, 0)], -1)
+
+    def _decode(self, position: int) -> str:
+        """Decode a single label."""
+        return self.data[self.offsets[position] : self.offsets[position + 1]].tobytes().decode("utf-8")
+
+    def map(self, labels: Union[str, Sequence[str], np.ndarray]) -> np.ndarray:
+        """Convert labels to IDs, where unknown labels are mapped to -1."""
+        labels = np.asanyarray(labels)
+        data, offsets = _encode_labels(labels.reshape(-1).tolist())
+        result = np.full(shape=(len(offsets) - 1,), fill_value=-1, dtype=np.int64)
+        if not len(self) or not len(result):
+            return result.reshape(labels.shape)
+        # binary search over the hashes
+        hashes = _hash_labels(data=data, offsets=offsets, seed=self.seed)
+        positions = np.searchsorted(self.hashes, hashes).clip(max=len(self) - 1)
+        # exact comparison of the candidate's bytes, since unknown labels may share the hash of a known one
+        lengths = np.diff(offsets)
+        found = (self.hashes[positions] == hashes) & (np.diff(self.offsets)[positions] == lengths)
+        lengths[~found] = 0
+        for j, indices in _iter_byte_positions(lengths):
+            found[indices] &= self.data[self.offsets[positions[indices]] + j] == data[offsets[indices] + j]
+        result[found] = self.ids[positions[found]]
+        return result.reshape(labels.shape)
+
+    def label(
+        self,
+        ids: Union[int, Sequence[int], np.ndarray, torch.LongTensor],
+        unknown_label: str = "unknown",
+    ) -> np.ndarray:
+        """Convert IDs to labels."""
+        # Normalize input
+        if isinstance(ids, torch.Tensor):
+            ids = ids.cpu().numpy()
+        if isinstance(ids, int):
+            ids = [ids]
+        ids = np.asanyarray(ids, dtype=np.int64)
+        positions = self._get_positions(ids.reshape(-1))
+        return np.asarray(
+            [unknown_label if position < 0 else self._decode(position) for position in positions.tolist()],
+            dtype=str,
+        ).reshape(ids.shape)
+
+    def all_labels(self) -> np.ndarray:
+        """Get all labels, in order."""
+        return self.label(range(self.max_id))
+
+
+def _as_labeling(label_to_id: Union[Mapping[str, int], Labeling, ArrayLabeling]) -> Union[Labeling, ArrayLabeling]:
+    """Normalize a labeling, or a mapping from labels to IDs."""
+    if isinstance(label_to_id, (Labeling, ArrayLabeling)):
+        return label_to_id
+    # do not materialize the lazy mapping of an array labeling
+    if isinstance(label_to_id, _LabelToIdView):
+        return label_to_id.labeling
+    return Labeling(label_to_id=label_to_id)
+
+
+def _get_label_mapper(
+    label_to_id: Union[Mapping[str, int], Labeling, ArrayLabeling]
+) -> Callable[[np.ndarray], np.ndarray]:
+    """Get a vectorized function mapping labels to IDs, and unknown labels to -1."""
+    if isinstance(label_to_id, (Labeling, ArrayLabeling, _LabelToIdView)):
+        return _as_labeling(label_to_id).map
+    getter = np.vectorize(label_to_id.get, otypes=[int])
+    return lambda labels: getter(labels, -1)
+
+
 def restrict_triples(
     mapped_triples: MappedTriples,
     entities: Optional[Collection[int]] = None,
@@ -320,8 +803,13 @@ class KGInfo(ExtraReprMixin):
 class CoreTriplesFactory(KGInfo):
     """Create instances from ID-based triples."""
 
+    #: the file name of the numeric triples in the legacy TSV-based binary format
     triples_file_name: ClassVar[str] = "numeric_triples.tsv.gz"
+    #: the file name of the numeric triples as raw int64 array
+    triples_array_file_name: ClassVar[str] = "numeric_triples.npy"
     base_file_name: ClassVar[str] = "base.pth"
+    #: the version of the binary format written by :meth:`to_path_binary`
+    binary_format_version: ClassVar[int] = 2
 
     def __init__(
         self,
@@ -474,9 +962,26 @@ class CoreTriplesFactory(KGInfo):
             ]
         )
 
-    def create_slcwa_instances(self, *, sampler: Optional[str] = None, **kwargs) -> Dataset:
-        """Create sLCWA instances for this factory's triples."""
-        cls = BatchedSLCWAInstances if sampler is None else SubGraphSLCWAInstances
+    def create_slcwa_instances(self, *, sampler: Optional[str] = None, on_device: bool = False, **kwargs) -> Dataset:
+        """Create sLCWA instances for this factory's triples.
+
+        The `sampler` selects how the batches are formed: None for uniformly random batches, "schlichtkrull" for
+        coherent subgraphs sampled edge-by-edge, cf. :class:`pykeen.triples.instances.SubGraphSLCWAInstances`, or
+        "frontier" for coherent subgraphs sampled by vectorized frontier expansion, cf.
+        :class:`pykeen.triples.instances.FrontierSubGraphSLCWAInstances`.
+
+        If `on_device` is True, create instances which perform batching and negative sampling on a device, cf.
+        :class:`pykeen.triples.instances.DeviceBatchedSLCWAInstances`; the device is passed via `kwargs`.
+
+        :raises NotImplementedError:
+            if on-device instances are requested together with a non-default sampler
+        """
+        if on_device:
+            if sampler is not None:
+                raise NotImplementedError(f"On-device sLCWA instances do not support sampler='{sampler}'.")
+            cls: Type[BaseBatchedSLCWAInstances] = DeviceBatchedSLCWAInstances
+        else:
+            cls = SLCWA_SAMPLERS.get(sampler, SubGraphSLCWAInstances)
         if "shuffle" in kwargs:
             if kwargs.pop("shuffle"):
                 warnings.warn("Training instances are always shuffled.", DeprecationWarning)
@@ -489,10 +994,26 @@ class CoreTriplesFactory(KGInfo):
             **kwargs,
         )
 
-    def create_lcwa_instances(self, use_tqdm: Optional[bool] = None, target: Optional[int] = None) -> Dataset:
-        """Create LCWA instances for this factory's triples."""
+    def create_lcwa_instances(
+        self, use_tqdm: Optional[bool] = None, target: Optional[int] = None, batch_size: Optional[int] = None, **kwargs
+    ) -> Dataset:
+        """Create LCWA instances for this factory's triples.
+
+        If a batch size is given, create pre-batched instances, cf. :class:`pykeen.triples.BatchedLCWAInstances`, and
+        pass the remaining keyword-based parameters to them.
+        """
+        mapped_triples = self._add_inverse_triples_if_necessary(mapped_triples=self.mapped_triples)
+        if batch_size is not None:
+            return BatchedLCWAInstances.from_triples(
+                mapped_triples=mapped_triples,
+                num_entities=self.num_entities,
+                num_relations=self.num_relations,
+                target=target,
+                batch_size=batch_size,
+                **kwargs,
+            )
         return LCWAInstances.from_triples(
-            mapped_triples=self._add_inverse_triples_if_necessary(mapped_triples=self.mapped_triples),
+            mapped_triples=mapped_triples,
             num_entities=self.num_entities,
             num_relations=self.num_relations,
             target=target,
@@ -740,32 +1261,50 @@ class CoreTriplesFactory(KGInfo):
     def from_path_binary(
         cls,
         path: Union[str, pathlib.Path, TextIO],
+        mmap: bool = False,
     ) -> "CoreTriplesFactory":  # noqa: D102
         """
         Load triples factory from a binary file.
 
         :param path:
             The path, pointing to an existing PyTorch .pt file.
+        :param mmap:
+            Whether to memory-map the numeric triples instead of reading them into memory. The mapping is
+            copy-on-write, i.e., in-place modifications of the triples are not written back to the file. Only
+            applicable for the current binary format; the legacy TSV-based format is always parsed.
 
         :return:
             The loaded triples factory.
         """
         path = normalize_path(path)
         logger.info(f"Loading from {path.as_uri()}")
-        return cls(**cls._from_path_binary(path=path))
+        return cls(**cls._from_path_binary(path=path, mmap=mmap))
 
     @classmethod
     def _from_path_binary(
         cls,
         path: pathlib.Path,
+        mmap: bool = False,
     ) -> MutableMapping[str, Any]:
         # load base
         data = dict(torch.load(path.joinpath(cls.base_file_name)))
+        # note: the legacy format did not store a version
+        format_version = data.pop("format_version", 1)
+        if format_version > cls.binary_format_version:
+            raise ValueError(
+                f"{path.as_uri()} uses binary format version {format_version}, but only versions up to "
+                f"{cls.binary_format_version} are supported. Please update PyKEEN.",
+            )
         # load numeric triples
-        data["mapped_triples"] = torch.as_tensor(
-            pd.read_csv(path.joinpath(cls.triples_file_name), sep="\t", dtype=int).values,
-            dtype=torch.long,
-        )
+        if format_version < 2:
+            data["mapped_triples"] = torch.as_tensor(
+                pd.read_csv(path.joinpath(cls.triples_file_name), sep="\t", dtype=int).values,
+                dtype=torch.long,
+            )
+        else:
+            data["mapped_triples"] = torch.from_numpy(
+                np.load(path.joinpath(cls.triples_array_file_name), mmap_mode="c" if mmap else None)
+            )
         return data
 
     def to_path_binary(
@@ -782,11 +1321,8 @@ class CoreTriplesFactory(KGInfo):
         """
         path = normalize_path(path, mkdir=True)
 
-        # store numeric triples
-        pd.DataFrame(
-            data=self.mapped_triples.numpy(),
-            columns=COLUMN_LABELS,
-        ).to_csv(path.joinpath(self.triples_file_name), sep="\t", index=False)
+        # store numeric triples as raw array, which can be memory-mapped when loading
+        np.save(path.joinpath(self.triples_array_file_name), self.mapped_triples.numpy())
 
         # store metadata
         torch.save(self._get_binary_state(), path.joinpath(self.base_file_name))
@@ -796,6 +1332,7 @@ class CoreTriplesFactory(KGInfo):
 
     def _get_binary_state(self):
         return dict(
+            format_version=self.binary_format_version,
             num_entities=self.num_entities,
             # note: num_relations will be doubled again when instantiating with create_inverse_triples=True
             num_relations=self.real_num_relations,
@@ -842,7 +1379,7 @@ class TriplesFactory(CoreTriplesFactory):
             if the explicitly provided number of entities or relations does not match with the one given
             by the label mapping
         """
-        self.entity_labeling = Labeling(label_to_id=entity_to_id)
+        self.entity_labeling = _as_labeling(entity_to_id)
         if num_entities is None:
             num_entities = self.entity_labeling.max_id
         elif num_entities != self.entity_labeling.max_id:
@@ -850,7 +1387,7 @@ class TriplesFactory(CoreTriplesFactory):
                 f"Mismatch between the number of entities in labeling ({self.entity_labeling.max_id}) "
                 f"vs. explicitly provided num_entities={num_entities}",
             )
-        self.relation_labeling = Labeling(label_to_id=relation_to_id)
+        self.relation_labeling = _as_labeling(relation_to_id)
         if num_relations is None:
             num_relations = self.relation_labeling.max_id
         elif num_relations != self.relation_labeling.max_id:
@@ -956,6 +1493,7 @@ class TriplesFactory(CoreTriplesFactory):
         compact_id: bool = True,
         metadata: Optional[Dict[str, Any]] = None,
         load_triples_kwargs: Optional[Mapping[str, Any]] = None,
+        chunk_size: Optional[int] = None,
         **kwargs,
     ) -> "TriplesFactory":
         """
@@ -977,6 +1515,12 @@ class TriplesFactory(CoreTriplesFactory):
             kwarg to this function.
         :param load_triples_kwargs: Optional keyword arguments to pass to :func:`load_triples`.
             Could include the ``delimiter`` or a ``column_remapping``.
+        :param chunk_size:
+            If given, stream the file in chunks of (at most) this many triples instead of loading all label-based
+            triples into memory, cf. :func:`pykeen.triples.utils.iter_triples_chunks`. This allows loading files
+            which are larger than the available memory, and (compressed) files in any format supported by
+            :func:`pandas.read_csv`. The resulting factory is the same as without chunking; however, custom
+            importers are not supported.
         :param kwargs:
             additional keyword-based parameters, which are ignored.
 
@@ -985,7 +1529,25 @@ class TriplesFactory(CoreTriplesFactory):
         """
         path = normalize_path(path)
 
-        # TODO: Check if lazy evaluation would make sense
+        if chunk_size is not None:
+            entity_to_id, relation_to_id, mapped_triples = _map_triples_chunks_to_ids(
+                chunks=iter_triples_chunks(path, chunk_size=chunk_size, **(load_triples_kwargs or {})),
+                entity_to_id=entity_to_id,
+                relation_to_id=relation_to_id,
+                compact_id=compact_id,
+                chunk_size=chunk_size,
+            )
+            return cls(
+                entity_to_id=entity_to_id,
+                relation_to_id=relation_to_id,
+                mapped_triples=mapped_triples,
+                create_inverse_triples=create_inverse_triples,
+                metadata={
+                    "path": path,
+                    **(metadata or {}),
+                },
+            )
+
         triples = load_triples(path, **(load_triples_kwargs or {}))
 
         return cls.from_labeled_triples(
@@ -1022,32 +1584,29 @@ class TriplesFactory(CoreTriplesFactory):
     def to_path_binary(self, path: Union[str, pathlib.Path, TextIO]) -> pathlib.Path:  # noqa: D102
         path = super().to_path_binary(path=path)
         # store entity/relation to ID
-        for name, data in (
+        for name, labeling in (
             (
                 self.file_name_entity_to_id,
-                self.entity_to_id,
+                self.entity_labeling,
             ),
             (
                 self.file_name_relation_to_id,
-                self.relation_to_id,
+                self.relation_labeling,
             ),
         ):
-            pd.DataFrame(
-                data=data.items(),
-                columns=["label", "id"],
-            ).sort_values(
-                by="id"
-            ).set_index("id").to_csv(
-                path.joinpath(f"{name}.tsv.gz"),
-                sep="\t",
-            )
+            _save_label_arrays(path=path.joinpath(f"{name}.npz"), labeling=labeling)
         return path
 
     @classmethod
-    def _from_path_binary(cls, path: pathlib.Path) -> MutableMapping[str, Any]:
-        data = super()._from_path_binary(path)
+    def _from_path_binary(cls, path: pathlib.Path, mmap: bool = False) -> MutableMapping[str, Any]:
+        data = super()._from_path_binary(path, mmap=mmap)
         # load entity/relation to ID
         for name in [cls.file_name_entity_to_id, cls.file_name_relation_to_id]:
+            array_path = path.joinpath(f"{name}.npz")
+            if array_path.is_file():
+                data[name] = _load_label_arrays(path=array_path)
+                continue
+            # legacy format
             df = pd.read_csv(
                 path.joinpath(f"{name}.tsv.gz"),
                 sep="\t",
@@ -1147,11 +1706,11 @@ class TriplesFactory(CoreTriplesFactory):
 
     # docstr-coverage: inherited
     def entities_to_ids(self, entities: Union[Collection[int], Collection[str]]) -> Collection[int]:  # noqa: D102
-        return _ensure_ids(labels_or_ids=entities, label_to_id=self.entity_labeling.label_to_id)
+        return _ensure_ids(labels_or_ids=entities, label_to_id=self.entity_labeling)
 
     # docstr-coverage: inherited
     def relations_to_ids(self, relations: Union[Collection[int], Collection[str]]) -> Collection[int]:  # noqa: D102
-        return _ensure_ids(labels_or_ids=relations, label_to_id=self.relation_labeling.label_to_id)
+        return _ensure_ids(labels_or_ids=relations, label_to_id=self.relation_labeling)
 
     def get_mask_for_relations(
         self,
@@ -1276,8 +1835,8 @@ class TriplesFactory(CoreTriplesFactory):
         """Convert label-based triples to ID-based triples."""
         return _map_triples_elements_to_ids(
             triples=triples,
-            entity_to_id=self.entity_to_id,
-            relation_to_id=self.relation_to_id,
+            entity_to_id=self.entity_labeling,
+            relation_to_id=self.relation_labeling,
         )
 
 
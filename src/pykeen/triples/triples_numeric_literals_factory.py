@@ -163,8 +163,8 @@ class TriplesNumericLiteralsFactory(TriplesFactory):
         return path
 
     @classmethod
-    def _from_path_binary(cls, path: pathlib.Path) -> MutableMapping[str, Any]:
-        data = super()._from_path_binary(path)
+    def _from_path_binary(cls, path: pathlib.Path, mmap: bool = False) -> MutableMapping[str, Any]:
+        data = super()._from_path_binary(path, mmap=mmap)
         # load literal-to-id
         df = pandas.read_csv(
             path.joinpath(f"{cls.file_name_literal_to_id}.tsv.gz"),
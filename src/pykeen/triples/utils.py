@@ -3,7 +3,7 @@
 """Instance creation utilities."""
 
 import pathlib
-from typing import Callable, List, Mapping, Optional, Sequence, Set, TextIO, Tuple, Union
+from typing import Callable, Iterable, Mapping, Optional, Sequence, Set, TextIO, Tuple, Union
 
 import numpy as np
 import pandas
@@ -15,6 +15,7 @@ from ..typing import LabeledTriples, MappedTriples
 __all__ = [
     "compute_compressed_adjacency_list",
     "load_triples",
+    "iter_triples_chunks",
     "get_entities",
     "get_relations",
     "tensor_to_df",
@@ -89,6 +90,52 @@ def load_triples(
     return df.to_numpy()
 
 
+def iter_triples_chunks(
+    path: Union[str, pathlib.Path, TextIO],
+    chunk_size: int = 1_000_000,
+    delimiter: str = "\t",
+    encoding: Optional[str] = None,
+    column_remapping: Optional[Sequence[int]] = None,
+) -> Iterable[LabeledTriples]:
+    """Iterate over chunks of triples saved as (optionally compressed) separated values.
+
+    In contrast to :func:`load_triples`, the file is never read into memory as a whole, and thus can be larger than
+    the available memory. The compression is inferred from the file extension, e.g., ``.gz``, ``.bz2``, ``.zip``, or
+    ``.xz``.
+
+    :param path: The path to a file with three columns - the head, relation, and tail.
+    :param chunk_size: The maximum number of triples per chunk.
+    :param delimiter: The delimiter between the columns in the file
+    :param encoding: The encoding for the file. Defaults to utf-8.
+    :param column_remapping: A remapping if the three columns do not follow the order head-relation-tail.
+        For example, if the order is head-tail-relation, pass ``(0, 2, 1)``
+
+    :yields: shape: (chunk_size, 3), dtype: str
+        chunks of "labeled" triples. The last chunk may be smaller.
+
+    :raises ValueError: if a column remapping was passed but it was not a length 3 sequence
+    """
+    if encoding is None:
+        encoding = "utf-8"
+    if column_remapping is not None:
+        if len(column_remapping) != 3:
+            raise ValueError("remapping must have length of three")
+    with pandas.read_csv(
+        path,
+        sep=delimiter,
+        encoding=encoding,
+        dtype=str,
+        header=None,
+        usecols=column_remapping,
+        keep_default_na=False,
+        chunksize=chunk_size,
+    ) as reader:
+        for df in reader:
+            if column_remapping is not None:
+                df = df[[df.columns[c] for c in column_remapping]]
+            yield df.to_numpy()
+
+
 def get_entities(triples: torch.LongTensor) -> Set[int]:
     """Get all entities from the triples."""
     return set(triples[:, [0, 2]].flatten().tolist())
@@ -172,15 +219,16 @@ def compute_compressed_adjacency_list(
     """
     num_entities = num_entities or mapped_triples[:, [0, 2]].max().item() + 1
     num_triples = mapped_triples.shape[0]
-    adj_lists: List[List[Tuple[int, float]]] = [[] for _ in range(num_entities)]
-    for i, (s, _, o) in enumerate(mapped_triples):
-        adj_lists[s].append((i, o.item()))
-        adj_lists[o].append((i, s.item()))
-    degrees = torch.tensor([len(a) for a in adj_lists], dtype=torch.long)
+    # every triple occurs in the adjacency lists of its head and its tail; interleaving both roles before a stable sort
+    # keeps each adjacency list ordered by triple ID
+    sources = mapped_triples[:, [0, 2]].reshape(-1)
+    targets = mapped_triples[:, [2, 0]].reshape(-1)
+    triple_ids = torch.arange(num_triples, device=mapped_triples.device).repeat_interleave(2)
+    order = torch.sort(sources, stable=True).indices
+    degrees = torch.bincount(sources, minlength=num_entities)
     assert torch.sum(degrees) == 2 * num_triples
 
-    offset = torch.empty(num_entities, dtype=torch.long)
-    offset[0] = 0
+    offset = torch.zeros(num_entities, dtype=torch.long, device=mapped_triples.device)
     offset[1:] = torch.cumsum(degrees, dim=0)[:-1]
-    compressed_adj_lists = torch.cat([torch.as_tensor(adj_list, dtype=torch.long) for adj_list in adj_lists], dim=0)
+    compressed_adj_lists = torch.stack([triple_ids[order], targets[order]], dim=-1)
     return degrees, offset, compressed_adj_lists
@@ -2,8 +2,10 @@
 
 """Utilities for PyKEEN."""
 
+import dataclasses
 import ftplib
 import functools
+import hashlib
 import itertools as itt
 import json
 import logging
@@ -13,6 +15,7 @@ import os
 import pathlib
 import random
 import re
+import tempfile
 import time
 from abc import ABC, abstractmethod
 from collections import defaultdict
@@ -21,6 +24,7 @@ from pathlib import Path
 from textwrap import dedent
 from typing import (
     Any,
+    BinaryIO,
     Callable,
     Collection,
     Dict,
@@ -111,11 +115,16 @@ __all__ = [
     "point_to_box_distance",
     "get_devices",
     "get_preferred_device",
+    "get_available_memory",
+    "estimate_peak_memory",
+    "LinearMemoryEstimate",
     "triple_tensor_to_set",
     "is_triple_tensor_subset",
     "logcumsumexp",
     "get_connected_components",
     "normalize_path",
+    "write_atomically",
+    "get_state_dict_hash",
     "get_edge_index",
     "prepare_filter_triples",
     "nested_get",
@@ -192,6 +201,130 @@ def get_preferred_device(module: nn.Module, allow_ambiguity: bool = True) -> tor
     raise AmbiguousDeviceError(module=module)
 
 
+def get_available_memory(device: torch.device) -> Optional[int]:
+    """
+    Return the currently available memory on a device, in bytes.
+
+    :param device:
+        the device
+    :return:
+        the number of free bytes, or None if it cannot be determined on this device/platform
+    """
+    if device.type == "cuda":
+        free, _total = torch.cuda.mem_get_info(device)
+        return free
+    if device.type == "cpu":
+        try:
+            return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+        except (AttributeError, ValueError, OSError):
+            # os.sysconf is not available on all platforms, e.g., Windows, and not all names on all others, e.g., macOS
+            return None
+    return None
+
+
+def _get_num_bytes(tensor: torch.Tensor) -> int:
+    """Return the number of bytes occupied by a tensor's elements."""
+    return tensor.numel() * tensor.element_size()
+
+
+def estimate_peak_memory(closure: Callable[[], torch.Tensor], exclude: Iterable[torch.Tensor] = tuple()) -> int:
+    """
+    Estimate the peak memory, in bytes, of a forward and backward pass.
+
+    The estimate is empirical: while the closure runs, all tensors which autograd retains for the backward pass are
+    recorded via :func:`torch.autograd.graph.saved_tensors_hooks`. Their (de-duplicated) storages, together with the
+    closure's result, approximate the memory which is alive at the end of the forward pass, which is where the peak
+    of a training step typically occurs. Since no backward pass is executed, this works on any device, including
+    CPUs, where no allocator statistics are available.
+
+    .. note ::
+        if the closure runs without gradient tracking, nothing is saved for backward and only the result is counted.
+
+    :param closure:
+        the forward pass, returning a tensor, e.g., the loss or the scores. The result is discarded afterwards.
+    :param exclude:
+        tensors which are already allocated and should not be counted, e.g., the model's parameters
+
+    :return:
+        the estimated number of bytes
+    """
+    excluded = {tensor.untyped_storage().data_ptr() for tensor in exclude}
+    storages: Dict[int, int] = {}
+
+    def pack(tensor: torch.Tensor) -> torch.Tensor:
+        """Record the storage of a tensor saved for backward."""
+        if tensor.layout != torch.strided:
+            storages[id(tensor)] = _get_num_bytes(tensor)
+            return tensor
+        storage = tensor.untyped_storage()
+        key = storage.data_ptr()
+        if key not in excluded:
+            storages[key] = storage.nbytes()
+        return tensor
+
+    with torch.autograd.graph.saved_tensors_hooks(pack, lambda tensor: tensor):
+        result = closure()
+    result_bytes = _get_num_bytes(result)
+    if result.layout == torch.strided and result.untyped_storage().data_ptr() in storages:
+        result_bytes = 0
+    return sum(storages.values()) + result_bytes
+
+
+@dataclasses.dataclass
+class LinearMemoryEstimate:
+    """A linear model of the peak memory, in bytes, as a function of a size parameter, e.g., the batch size."""
+
+    #: the size-independent number of bytes
+    intercept: float
+
+    #: the number of additional bytes per unit of size
+    slope: float
+
+    @classmethod
+    def from_probes(cls, sizes: Sequence[int], peaks: Sequence[int]) -> "LinearMemoryEstimate":
+        """
+        Fit the estimate to the peak memory of a few (small) probes, using least squares.
+
+        :param sizes:
+            the probed sizes
+        :param peaks:
+            the peak memory of each probe, in bytes, cf. :func:`estimate_peak_memory`
+
+        :return:
+            the fitted estimate. The slope is non-negative, and the estimate does not under-estimate any of the probes.
+        """
+        sizes_array, peaks_array = np.asarray(sizes, dtype=float), np.asarray(peaks, dtype=float)
+        if np.unique(sizes_array).size < 2:
+            return cls(intercept=float(peaks_array.max()), slope=0.0)
+        slope, intercept = np.polyfit(sizes_array, peaks_array, deg=1)
+        slope = max(float(slope), 0.0)
+        # shift upwards, such that the line is an upper bound of all observations
+        intercept = float((peaks_array - slope * sizes_array).max())
+        return cls(intercept=intercept, slope=slope)
+
+    def __call__(self, size: int) -> int:
+        """Predict the peak memory for the given size, in bytes."""
+        return math.ceil(self.intercept + self.slope * size)
+
+    def get_max_size(self, budget: int, maximum: int) -> int:
+        """
+        Get the largest size whose predicted peak memory fits into the given budget.
+
+        :param budget:
+            the memory budget, in bytes
+        :param maximum:
+            the maximum size to consider
+
+        :return:
+            the largest size from $[1, maximum]$ which fits into the budget, or 0, if even size 1 does not fit.
+        """
+        if self(1) > budget:
+            return 0
+        if self.slope <= 0:
+            return maximum
+        return max(1, min(maximum, math.floor((budget - self.intercept) / self.slope)))
+
+
 X = TypeVar("X")
 
 
@@ -1250,22 +1383,30 @@ def is_triple_tensor_subset(a: torch.LongTensor, b: torch.LongTensor) -> bool:
 
 
 def create_relation_to_entity_set_mapping(
-    triples: Iterable[Tuple[int, int, int]],
+    triples: Union[Iterable[Tuple[int, int, int]], MappedTriples, np.ndarray],
 ) -> Tuple[Mapping[int, Set[int]], Mapping[int, Set[int]]]:
     """
     Create mappings from relation IDs to the set of their head / tail entities.
 
     :param triples:
-        The triples.
+        The triples, either as an iterable of ID-based triples, or as an array / tensor of shape (n, 3). The latter
+        avoids the conversion to Python objects for all but the unique (relation, entity) pairs.
 
     :return:
         A pair of dictionaries, each mapping relation IDs to entity ID sets.
     """
-    tails = defaultdict(set)
-    heads = defaultdict(set)
-    for h, r, t in triples:
-        heads[r].add(h)
-        tails[r].add(t)
+    if torch.is_tensor(triples):
+        triples = triples.cpu().numpy()
+    triples = np.asarray(triples if isinstance(triples, np.ndarray) else list(triples), dtype=np.int64).reshape(-1, 3)
+    num_entities = int(triples[:, [0, 2]].max()) + 1 if triples.size else 1
+    heads: Dict[int, Set[int]] = defaultdict(set)
+    tails: Dict[int, Set[int]] = defaultdict(set)
+    for mapping, column in ((heads, 0), (tails, 2)):
+        # unique packed (relation, entity) keys are sorted by relation
+        keys = np.unique(triples[:, 1] * num_entities + triples[:, column])
+        relations, starts = np.unique(keys // num_entities, return_index=True)
+        for relation, entities in zip(relations.tolist(), np.split(keys % num_entities, starts[1:])):
+            mapping[relation] = set(entities.tolist())
     return heads, tails
 
 
@@ -1404,6 +1545,41 @@ def normalize_path(
     return path
 
 
+def write_atomically(path: pathlib.Path, write: Callable[[BinaryIO], Any]) -> None:
+    """
+    Write a file such that it is either complete or missing, e.g., for caches shared by concurrent processes.
+
+    The content is written to a temporary file in the same directory first, which is then atomically moved.
+
+    :param path:
+        the path of the file
+    :param write:
+        a function which writes the content to a given binary file object, e.g., ``functools.partial(numpy.save,
+        arr=array)`` or ``lambda file: torch.save(obj, file)``
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as file:
+        write(file)
+    os.replace(file.name, path)
+
+
+def get_state_dict_hash(module: nn.Module) -> str:
+    """
+    Hash all parameters and buffers of a module, e.g., to identify a trained model.
+
+    :param module:
+        the module
+
+    :return:
+        the hexadecimal SHA-512 digest of the names and values in the module's state dict
+    """
+    digest = hashlib.sha512()
+    for key, value in module.state_dict().items():
+        digest.update(key.encode("utf-8"))
+        digest.update(value.detach().cpu().contiguous().numpy().tobytes())
+    return digest.hexdigest()
+
+
 def ensure_complex(*xs: torch.Tensor) -> Iterable[torch.Tensor]:
     """
     Ensure that all tensors are of complex dtype.
@@ -1507,11 +1683,71 @@ def _weisfeiler_lehman_iteration_approx(
     return colors.unique(return_inverse=True, dim=0)[1]
 
 
+#: constants of the splitmix64 generator, cf. https://prng.di.unimi.it/splitmix64.c, as signed 64-bit integers
+_SPLITMIX64_GAMMA = 0x9E3779B97F4A7C15 - 2**64
+_SPLITMIX64_MULTIPLIERS = (0xBF58476D1CE4E5B9 - 2**64, 0x94D049BB133111EB - 2**64)
+
+
+def _shift_right_logical(x: torch.LongTensor, shift: int) -> torch.LongTensor:
+    """Shift the bits of a 64-bit integer to the right, filling with zeros (rather than the sign bit)."""
+    return (x >> shift) & ((1 << (64 - shift)) - 1)
+
+
+def _mix64(x: torch.LongTensor) -> torch.LongTensor:
+    """Apply the splitmix64 mixing function, a bijection on 64-bit integers with good avalanche properties."""
+    x = x + _SPLITMIX64_GAMMA
+    for shift, multiplier in zip((30, 27), _SPLITMIX64_MULTIPLIERS):
+        x = (x ^ _shift_right_logical(x, shift)) * multiplier
+    return x ^ _shift_right_logical(x, 31)
+
+
+def _weisfeiler_lehman_iteration_hashed(
+    edge_index: torch.LongTensor,
+    colors: torch.LongTensor,
+    chunk_size: Optional[int] = None,
+) -> torch.Tensor:
+    """
+    Perform a single Weisfeiler-Lehman iteration by hashing the multi-sets of neighbor colors.
+
+    Each color is mapped to a pseudo-random 64-bit value, and the multi-set of neighbor colors is summarized by the
+    (wrap-around) sum of these values, which is independent of the order of neighbors. Together with the node's own
+    color, this sum is hashed into a 64-bit signature, and the distinct signatures become the new colors. Thus, the
+    memory requirement is linear in the number of nodes and edges, and two nodes with different colors of themselves
+    or their neighbors only receive the same new color in case of a hash collision, i.e., with a probability of
+    roughly $n^2 / 2^{64}$.
+
+    :param edge_index: shape: `(2, m)`
+        the edge list, without duplicates
+    :param colors: shape: `(n,)`
+        the node colors (as integers)
+    :param chunk_size:
+        the number of edges to aggregate at once. If None, aggregate all edges at once.
+
+    :return: shape: `(n,)`
+        the new node colors
+    """
+    source, target = edge_index
+    num_edges = source.shape[0]
+    chunk_size = chunk_size or num_edges
+    # message passing: sum the hashes of the neighbors' colors
+    color_hashes = _mix64(colors)
+    aggregated = torch.zeros_like(colors)
+    for start in range(0, num_edges, chunk_size):
+        aggregated.index_add_(
+            dim=0, index=source[start : start + chunk_size], source=color_hashes[target[start : start + chunk_size]]
+        )
+    # combine with (re-hashed) old colors
+    signatures = _mix64(_mix64(color_hashes) + aggregated)
+    return signatures.unique(return_inverse=True)[1]
+
+
 def iter_weisfeiler_lehman(
     edge_index: torch.LongTensor,
     max_iter: int = 2,
     num_nodes: Optional[int] = None,
     approximate: bool = False,
+    hashed: bool = False,
+    chunk_size: Optional[int] = None,
 ) -> Iterable[torch.Tensor]:
     """
     Iterate Weisfeiler-Lehman colors.
@@ -1531,7 +1767,8 @@ def iter_weisfeiler_lehman(
         https://www.jmlr.org/papers/volume12/shervashidze11a/shervashidze11a.pdf
 
     .. note::
-        the implementation creates intermediate dense tensors of shape `(num_nodes, num_colors)`
+        the exact implementation creates intermediate dense tensors of shape `(num_nodes, num_colors)`. For large
+        graphs, use `hashed=True`, which only requires memory linear in the number of nodes and edges.
 
     .. seealso::
         https://towardsdatascience.com/expressive-power-of-graph-neural-networks-and-the-weisefeiler-lehman-test-b883db3c7c49
@@ -1544,13 +1781,22 @@ def iter_weisfeiler_lehman(
         the number of nodes. If None, will be inferred from the edge index.
     :param approximate:
         whether to use an approximate, but more memory-efficient implementation.
+    :param hashed:
+        whether to hash the multi-sets of neighbor colors into 64-bit signatures, cf.
+        :func:`_weisfeiler_lehman_iteration_hashed`. This gives the exact coloring up to hash collisions, which are
+        highly unlikely, in time and memory linear in the number of edges.
+    :param chunk_size:
+        the number of edges to aggregate at once for the hashed implementation. If None, aggregate all edges at once.
 
     :raises ValueError:
         if the number of nodes exceeds `torch.long` (this cannot happen in practice, as the edge index tensor
-        construction would already fail earlier)
+        construction would already fail earlier), or if both, `approximate` and `hashed` are requested
 
     :yields: the colors for each Weisfeiler-Lehman iteration
     """
+    if approximate and hashed:
+        raise ValueError("The approximate and the hashed implementation are mutually exclusive.")
+
     # only keep connectivity, but remove multiplicity
     edge_index = edge_index.unique(dim=1)
 
@@ -1585,7 +1831,9 @@ def iter_weisfeiler_lehman(
         size=(num_nodes, num_nodes),
     )
     for i in range(2, max_iter + 1):
-        if approximate:
+        if hashed:
+            colors = _weisfeiler_lehman_iteration_hashed(edge_index=edge_index, colors=colors, chunk_size=chunk_size)
+        elif approximate:
             colors = _weisfeiler_lehman_iteration_approx(adj=adj, colors=colors)
         else:
             colors = _weisfeiler_lehman_iteration(adj=adj, colors=colors, dense_dtype=dense_dtype)
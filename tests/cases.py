@@ -2,9 +2,11 @@
 
 """Test cases for PyKEEN."""
 
+import copy
 import logging
 import os
 import pathlib
+import pickle
 import tempfile
 import timeit
 import traceback
@@ -74,7 +76,7 @@ from pykeen.models.cli import build_cli_from_cls
 from pykeen.models.meta.filtered import CooccurrenceFilteredModel
 from pykeen.models.mocks import FixedModel
 from pykeen.nn.modules import DistMultInteraction, FunctionalInteraction, Interaction
-from pykeen.nn.representation import Representation
+from pykeen.nn.representation import Representation, cached_representations
 from pykeen.nn.utils import adjacency_tensor_to_stacked_matrix
 from pykeen.optimizers import optimizer_resolver
 from pykeen.pipeline import pipeline
@@ -1171,6 +1173,23 @@ class ModelTestCase(unittest_templates.GenericTestCase[Model]):
             original_model.save_state(path=file_path)
             loaded_model.load_state(path=file_path)
 
+    def test_freeze(self):
+        """Test whether a frozen model produces the same scores."""
+        if not isinstance(self.instance, ERModel) or self.mode is not None:
+            raise SkipTest("Only transductive ERModels can be frozen.")
+        batch = self.factory.mapped_triples[: self.batch_size].to(self.instance.device)
+        self.instance.eval()
+        with tempfile.TemporaryDirectory() as directory:
+            self.instance.freeze(directory=directory, batch_size=5)
+            frozen = ERModel.from_frozen(directory=directory).to(self.instance.device)
+            for name, columns in (("predict_t", slice(0, 2)), ("predict_h", slice(1, None))):
+                with self.subTest(name=name):
+                    expected = getattr(self.instance, name)(batch[:, columns])
+                    scores = getattr(frozen, name)(batch[:, columns])
+                    self.assertTrue(torch.allclose(scores, expected, rtol=1e-4, atol=1e-5))
+        # clear buffers for message passing models
+        self.instance.post_parameter_update()
+
     @property
     def _cli_extras(self):
         """Return a list of extra flags for the CLI."""
@@ -1536,6 +1555,31 @@ class RepresentationTestCase(GenericTestCase[Representation]):
         # this implicitly tests extra_repr / iter_extra_repr
         assert isinstance(str(self), str)
 
+    def test_cache(self):
+        """Test serving representations from a cache."""
+        self.instance.eval()
+        indices = torch.randint(self.instance.max_id, size=(self.batch_size, self.num_negatives))
+        expected = self.instance(indices=indices)
+        with cached_representations(self.instance) as enabled:
+            assert self.instance.cache_enabled == (self.instance in enabled)
+            for _ in range(2):
+                assert torch.allclose(self.instance(indices=indices), expected)
+            if self.instance.cache_enabled:
+                # repeated calls to eval() keep the cache
+                self.instance.eval()
+                assert self.instance._cache is not None
+            # parameter updates invalidate the cache
+            self.instance.post_parameter_update()
+            assert self.instance._cache is None
+            # as well as switching to training mode
+            self.instance(indices=indices)
+            self.instance.train()
+            assert self.instance._cache is None
+        assert not self.instance.cache_enabled
+        # a memory budget of zero bytes disables caching
+        with cached_representations(self.instance, max_memory=0) as enabled:
+            assert not enabled
+
 
 class TriplesFactoryRepresentationTestCase(RepresentationTestCase):
     """Tests for representations requiring triples factories."""
@@ -1926,6 +1970,25 @@ class EvaluatorTestCase(unittest_templates.GenericTestCase[Evaluator]):
             )
         return hrt_batch, scores, mask
 
+    def test_merge_state(self) -> None:
+        """Test merging the serialized state of an evaluator which processed a different part of the data."""
+        hrt_batch, scores, mask = self._get_input()
+        true_scores = scores[torch.arange(0, hrt_batch.shape[0]), hrt_batch[:, 2]][:, None]
+        kwargs = dict(hrt_batch=hrt_batch, true_scores=true_scores, scores=scores, dense_positive_mask=mask)
+        # note: a copy shares sampled state, e.g., negatives, like the copies sent to worker processes
+        other = copy.deepcopy(self.instance)
+        self.instance.process_scores_(target=LABEL_HEAD, **kwargs)
+        other.process_scores_(target=LABEL_TAIL, **kwargs)
+        # the state has to survive a round-trip through pickle, e.g., to be sent between processes
+        self.instance.merge_state_(state=pickle.loads(pickle.dumps(other.get_state())))
+        merged = self.instance.finalize().to_flat_dict()
+        # compare against processing all data with a single evaluator
+        other.process_scores_(target=LABEL_HEAD, **kwargs)
+        expected = other.finalize().to_flat_dict()
+        self.assertEqual(set(expected.keys()), set(merged.keys()))
+        for key, value in expected.items():
+            numpy.testing.assert_allclose(merged[key], value, rtol=1.0e-05, atol=1.0e-06, err_msg=key)
+
     def test_finalize(self) -> None:
         """Test the finalize() function."""
         # Process one batch
@@ -2205,6 +2268,33 @@ class RankBasedMetricTestCase(unittest_templates.GenericTestCase[RankBasedMetric
         else:
             self.assertLessEqual(y, x)
 
+    def test_sufficient_statistics(self):
+        """Test the computation from (merged) sufficient statistics."""
+        if not self.instance.supports_streaming:
+            raise SkipTest(f"{self.instance} does not support streaming.")
+        ranks = torch.as_tensor(self.ranks, dtype=torch.float)
+        num_candidates = torch.as_tensor(self.num_candidates)
+        # statistics are additive -> compute for two parts
+        statistics = {}
+        for part in (slice(None, self.num_ranks // 2), slice(self.num_ranks // 2, None)):
+            for name, value in self.instance.get_sufficient_statistics(
+                ranks=ranks[part], num_candidates=num_candidates[part]
+            ).items():
+                statistics[name] = statistics.get(name, 0) + value.numpy()
+        self.assertAlmostEqual(
+            self.instance(ranks=self.ranks, num_candidates=self.num_candidates),
+            self.instance.from_sufficient_statistics(statistics=statistics),
+        )
+        for closed, streamed in (
+            (self.instance.expected_value, self.instance.expected_value_from_sufficient_statistics),
+            (self.instance.variance, self.instance.variance_from_sufficient_statistics),
+        ):
+            try:
+                value = streamed(statistics=statistics)
+            except NoClosedFormError:
+                continue
+            self.assertAlmostEqual(closed(num_candidates=self.num_candidates), value)
+
     def _test_expectation(self, weights: Optional[numpy.ndarray]):
         """Test the numeric expectation is close to the closed form one."""
         try:
@@ -2650,6 +2740,40 @@ class TextEncoderTestCase(unittest_templates.GenericTestCase[pykeen.nn.text.Text
         assert torch.is_tensor(x)
         assert x.shape[0] == len(labels)
 
+    def test_encode_bucketed(self):
+        """Test that identical labels are encoded once, and batches are formed by length."""
+        self.instance.eval()
+        labels = ["a", "a much longer label", "a", "medium label", "tiny", "medium label"]
+        with patch.object(self.instance, "forward_normalized", wraps=self.instance.forward_normalized) as mock:
+            x = self.instance.encode_all(labels=labels, batch_size=2)
+        assert x.shape[0] == len(labels)
+        assert torch.allclose(x[0], x[2])
+        assert torch.allclose(x[3], x[5])
+        batches = [call.args[0] if call.args else call.kwargs["texts"] for call in mock.call_args_list]
+        assert sorted(text for batch in batches for text in batch) == sorted(set(labels))
+        lengths = [self.instance.get_lengths(batch).tolist() for batch in batches]
+        assert all(min(a) >= max(b) for a, b in zip(lengths, lengths[1:]))
+
+    def test_encode_cache(self):
+        """Test encoding of texts with a persistent cache."""
+        self.instance.eval()
+        labels = ["A first sentence", "some other label", "A first sentence"]
+        expected = self.instance.encode_all(labels=labels).cpu()
+        with tempfile.TemporaryDirectory() as directory:
+            for more_labels in ([], ["a new label"]):
+                with patch.object(
+                    pykeen.nn.text,
+                    "_encode_all_memory_utilization_optimized",
+                    wraps=pykeen.nn.text._encode_all_memory_utilization_optimized,
+                ) as mock:
+                    x = self.instance.encode_all(labels=labels + more_labels, cache_directory=directory, chunk_size=1)
+                assert x.shape[0] == len(labels) + len(more_labels)
+                assert torch.allclose(x[: len(labels)], expected, atol=1.0e-05)
+                # identical labels are encoded only once, and cached labels not at all
+                assert mock.call_count == (2 if not more_labels else 1)
+            # one chunk per new unique label
+            assert len(list(pathlib.Path(directory).glob("*/*.keys.npy"))) == 3
+
 
 class PredictionTestCase(unittest_templates.GenericTestCase[pykeen.predict.Predictions]):
     """Tests for prediction post-processing."""
@@ -34,6 +34,24 @@ class TestUtils(unittest.TestCase):
         )
         self.assertEqual(set(_old_skyline(pairs)), set(triple_analysis._get_skyline(pairs)))
 
+    def test_iter_patterns(self):
+        """Test that the sparse pattern mining yields the same patterns as the set-based one."""
+        generator = np.random.default_rng(seed=42)
+        mapped_triples = generator.integers(low=0, high=[17, 7, 17], size=(300, 3)).tolist()
+        pairs = triple_analysis.index_pairs(mapped_triples)
+        expected = itertools.chain(
+            triple_analysis.iter_unary_patterns(pairs=pairs),
+            triple_analysis.iter_binary_patterns(pairs=pairs),
+            triple_analysis.iter_ternary_patterns(mapped_triples=mapped_triples, pairs=pairs),
+        )
+        self.assertEqual(
+            {(r, p, s, round(c, 8)) for r, p, s, c in expected},
+            {
+                (r, p, int(s), round(float(c), 8))
+                for r, p, s, c in triple_analysis.iter_patterns(mapped_triples=mapped_triples)
+            },
+        )
+
 
 def _test_count_dataframe(
     dataset: Dataset,
@@ -1,8 +1,15 @@
 """Tests for evaluation loops."""
+import unittest
 from typing import Any, MutableMapping
 
+import numpy
+import numpy.testing
+import pandas
+
 import pykeen.evaluation.evaluation_loop
 import pykeen.evaluation.rank_based_evaluator
+from pykeen.constants import COLUMN_LABELS
+from pykeen.datasets import Nations
 from pykeen.typing import LABEL_RELATION
 from tests import cases
 
@@ -23,3 +30,39 @@ class RelationPredictionLinkPredictionEvaluationLoopTestCase(LinkPredictionEvalu
 
     cls = pykeen.evaluation.evaluation_loop.LCWAEvaluationLoop
     kwargs = dict(targets=(LABEL_RELATION,))
+
+
+class LCWAEvaluationDatasetTests(unittest.TestCase):
+    """Tests for the LCWA evaluation dataset and its filter index."""
+
+    def setUp(self) -> None:
+        """Prepare the dataset."""
+        dataset = Nations()
+        self.instance = pykeen.evaluation.evaluation_loop.LCWAEvaluationDataset(
+            factory=dataset.validation, additional_filter_triples=[dataset.training.mapped_triples]
+        )
+
+    def test_filter_index(self):
+        """Test that the filter index contains exactly the unique targets of each key."""
+        df = pandas.DataFrame(data=numpy.random.randint(0, 7, size=(200, 3)), columns=COLUMN_LABELS)
+        for target in COLUMN_LABELS:
+            index = pykeen.evaluation.evaluation_loop.FilterIndex.from_df(df=df, target=target)
+            key = [c for c in COLUMN_LABELS if c != target]
+            for triple_id, row in df.iterrows():
+                expected = df.loc[(df[key] == row[key]).all(axis=1), target].unique()
+                numpy.testing.assert_array_equal(index[triple_id].numpy(), expected)
+            # batched lookup
+            triple_ids = [0, 5, 3, 5]
+            sparse = index[triple_ids]
+            for batch_id, triple_id in enumerate(triple_ids):
+                numpy.testing.assert_array_equal(sparse[sparse[:, 0] == batch_id, 1], index[triple_id])
+
+    def test_getitems(self):
+        """Test that batched access gives the same result as collating single items."""
+        indices = list(range(len(self.instance) // 2 - 7, len(self.instance) // 2 + 7))
+        expected = self.instance.collate([self.instance[i] for i in indices])
+        batch = self.instance.collate(self.instance.__getitems__(indices))
+        self.assertEqual(list(expected.keys()), list(batch.keys()))
+        for target, (hrt_batch, filter_batch) in expected.items():
+            assert (hrt_batch == batch[target][0]).all()
+            assert (filter_batch == batch[target][1]).all()
@@ -25,6 +25,7 @@ from pykeen.evaluation.classification_evaluator import (
     ClassificationMetricResults,
 )
 from pykeen.evaluation.evaluator import (
+    PositiveFilterIndex,
     create_dense_positive_mask_,
     create_sparse_positive_filter_,
     filter_scores_,
@@ -46,7 +47,8 @@ from pykeen.metrics.ranking import (
     InverseHarmonicMeanRank,
     rank_based_metric_resolver,
 )
-from pykeen.models import FixedModel
+from pykeen.models import FixedModel, NodePiece
+from pykeen.nn import Representation
 from pykeen.typing import (
     LABEL_HEAD,
     LABEL_RELATION,
@@ -127,6 +129,66 @@ class RankBasedEvaluatorTests(cases.EvaluatorTestCase):
         assert all(c >= 0 for _, c in result.values())
 
 
+class StreamingRankBasedEvaluatorTests(cases.EvaluatorTestCase):
+    """unittest for the RankBasedEvaluator in streaming mode."""
+
+    cls = RankBasedEvaluator
+    kwargs = dict(streaming=True)
+
+    def test_streaming_equals_default(self):
+        """Test that streaming evaluation gives the same results as storing all ranks."""
+        kwargs = dict(
+            model=self.model,
+            mapped_triples=self.factory.mapped_triples,
+            additional_filter_triples=[self.dataset.training.mapped_triples],
+            batch_size=self.batch_size,
+            use_tqdm=False,
+        )
+        expected = RankBasedEvaluator().evaluate(**kwargs).data
+        result = self.instance.evaluate(**kwargs).data
+        assert set(result.keys()).issubset(expected.keys())
+        for key, value in result.items():
+            self.assertAlmostEqual(expected[key], value, places=4, msg=key)
+
+    def test_merge(self):
+        """Test merging the buffers of evaluators which processed disjoint parts of the triples."""
+        mapped_triples = self.factory.mapped_triples
+        # note: the filter triples must not depend on the part
+        kwargs = dict(
+            model=self.model,
+            batch_size=self.batch_size,
+            use_tqdm=False,
+            additional_filter_triples=[mapped_triples],
+        )
+        expected = self.instance.evaluate(mapped_triples=mapped_triples, **kwargs).data
+        first, second = (RankBasedEvaluator(streaming=True, clear_on_finalize=False) for _ in range(2))
+        first.evaluate(mapped_triples=mapped_triples[:50], **kwargs)
+        second.evaluate(mapped_triples=mapped_triples[50:], **kwargs)
+        first.merge_(second)
+        for key, value in first.finalize().data.items():
+            self.assertAlmostEqual(expected[key], value, places=4, msg=key)
+
+    def test_multi_process(self):
+        """Test that multi-process evaluation gives the same results as single-process evaluation."""
+        kwargs = dict(
+            model=self.model,
+            mapped_triples=self.factory.mapped_triples,
+            additional_filter_triples=[self.dataset.training.mapped_triples],
+            batch_size=self.batch_size,
+            use_tqdm=False,
+        )
+        expected = self.instance.evaluate(**kwargs).data
+        result = self.instance.evaluate(num_workers=2, **kwargs).data
+        self.assertEqual(set(expected.keys()), set(result.keys()))
+        for key, value in result.items():
+            self.assertAlmostEqual(expected[key], value, places=4, msg=key)
+
+    def test_unsupported_metric(self):
+        """Test that requesting a metric without streaming support raises an error."""
+        with self.assertRaises(ValueError):
+            RankBasedEvaluator(streaming=True, metrics=["mad"])
+
+
 class SampledRankBasedEvaluatorTests(RankBasedEvaluatorTests):
     """unittest for the SampledRankBasedEvaluator."""
 
@@ -276,6 +338,23 @@ class EvaluatorUtilsTests(unittest.TestCase):
             same = batch[batch_id, 1:]
             assert (int(entity_id),) + tuple(map(int, same)) in triples
 
+    def test_positive_filter_index(self):
+        """Test the sorted-key positive filter index against the exhaustive scan."""
+        factory = Nations().training
+        all_triples = factory.mapped_triples
+        # include triples which are not positives
+        batch = torch.cat([all_triples[:8, :], torch.as_tensor([[0, factory.num_relations + 1, 0]])], dim=0)
+        index = PositiveFilterIndex(all_pos_triples=all_triples, num_relations=factory.num_relations)
+        for filter_col in (0, 2):
+            expected, _ = create_sparse_positive_filter_(
+                hrt_batch=batch, all_pos_triples=all_triples, filter_col=filter_col
+            )
+            positives = index.lookup(hrt_batch=batch, filter_col=filter_col)
+            assert positives.shape == expected.shape
+            assert set(map(tuple, positives.tolist())) == set(map(tuple, expected.tolist()))
+        with pytest.raises(NotImplementedError):
+            index.lookup(hrt_batch=batch, filter_col=1)
+
     def test_create_dense_positive_mask_(self):
         """Test method create_dense_positive_mask_."""
         batch_size = 3
@@ -529,6 +608,26 @@ class TestEvaluationFiltering(unittest.TestCase):
         assert eval_results.get_metric(name="mr") == 1, "The rank should equal 1"
 
 
+def test_evaluation_cache_representations():
+    """Test that caching representations during evaluation does not change the results."""
+    dataset = Nations(create_inverse_triples=True)
+    model = NodePiece(triples_factory=dataset.training, num_tokens=3, random_seed=42)
+    kwargs = dict(
+        model=model,
+        mapped_triples=dataset.validation.mapped_triples,
+        additional_filter_triples=[dataset.training.mapped_triples],
+        batch_size=16,
+        use_tqdm=False,
+    )
+    expected = RankBasedEvaluator().evaluate(cache_representations=False, **kwargs).data
+    result = RankBasedEvaluator().evaluate(cache_representations=True, **kwargs).data
+    assert set(result.keys()) == set(expected.keys())
+    for key, value in result.items():
+        assert value == pytest.approx(expected[key], rel=1.0e-05, abs=1.0e-05), key
+    # the cache does not outlive the evaluation
+    assert not any(m.cache_enabled for m in model.modules() if isinstance(m, Representation))
+
+
 def test_resolve_metric_name():
     """Test metric name resolution."""
     for s, (cls, side, rank_type, *args) in (
@@ -2,8 +2,20 @@
 
 from typing import Any, MutableMapping
 
-from pykeen.triples import LCWAInstances, SLCWAInstances
-from pykeen.triples.instances import BatchedSLCWAInstances, SubGraphSLCWAInstances
+import numpy
+import scipy.sparse
+import scipy.sparse.csgraph
+import torch
+import unittest_templates
+
+from pykeen.datasets import Nations
+from pykeen.triples import BatchedLCWAInstances, LCWAInstances, SLCWAInstances
+from pykeen.triples.instances import (
+    BatchedSLCWAInstances,
+    DeviceBatchedSLCWAInstances,
+    FrontierSubGraphSLCWAInstances,
+    SubGraphSLCWAInstances,
+)
 from tests import cases
 
 
@@ -47,7 +59,102 @@ class BatchedSLCWAInstancesTestCase(cases.BatchSLCWATrainingInstancesTestCase):
     cls = BatchedSLCWAInstances
 
 
+class DeviceBatchedSLCWAInstancesTestCase(cases.BatchSLCWATrainingInstancesTestCase):
+    """Tests for on-device batched sLCWA training instances."""
+
+    cls = DeviceBatchedSLCWAInstances
+
+    def test_data_loader_multiprocessing(self):
+        """Test that data loader worker processes are rejected."""
+        with self.assertRaises(RuntimeError):
+            list(torch.utils.data.DataLoader(dataset=self.instance, batch_size=None, num_workers=2))
+
+    def test_reproducibility(self):
+        """Test that a fixed seed leads to identical batches."""
+        kwargs = dict(self.instance_kwargs, seed=42)
+        first, second = ([batch.negatives for batch in self.cls(**kwargs)] for _ in range(2))
+        for x, y in zip(first, second):
+            assert torch.equal(x, y)
+
+
 class SubGraphSLCWAInstancesTestCase(cases.BatchSLCWATrainingInstancesTestCase):
     """Tests for subgraph sLCWA training instances."""
 
     cls = SubGraphSLCWAInstances
+
+
+class FrontierSubGraphSLCWAInstancesTestCase(cases.BatchSLCWATrainingInstancesTestCase):
+    """Tests for subgraph sLCWA training instances sampled by frontier expansion."""
+
+    cls = FrontierSubGraphSLCWAInstances
+    batch_size = 199
+    kwargs = dict(
+        batch_size=batch_size,
+        negative_sampler_kwargs=dict(
+            num_negs_per_pos=cases.BatchSLCWATrainingInstancesTestCase.num_negatives_per_positive,
+        ),
+    )
+
+    def test_subgraph_sample(self):
+        """Test that the sampled subgraph consists of unique triples, and is connected."""
+        triple_ids = self.instance.subgraph_sample()
+        assert triple_ids.shape == (self.batch_size,)
+        assert triple_ids.unique().numel() == self.batch_size
+        heads, _, tails = self.factory.mapped_triples[triple_ids].t().numpy()
+        adjacency = scipy.sparse.coo_matrix(
+            (numpy.ones_like(heads), (heads, tails)), shape=(self.factory.num_entities, self.factory.num_entities)
+        )
+        nodes = numpy.union1d(heads, tails)
+        _, labels = scipy.sparse.csgraph.connected_components(adjacency, directed=False)
+        assert numpy.unique(labels[nodes]).size == 1
+
+
+class BatchedLCWAInstancesTestCase(unittest_templates.GenericTestCase[BatchedLCWAInstances]):
+    """Tests for batched LCWA training instances."""
+
+    cls = BatchedLCWAInstances
+    kwargs = dict(
+        batch_size=7,
+    )
+
+    def _pre_instantiation_hook(self, kwargs: MutableMapping[str, Any]) -> MutableMapping[str, Any]:  # noqa: D102
+        kwargs = super()._pre_instantiation_hook(kwargs=kwargs)
+        self.factory = Nations().training
+        self.instances = LCWAInstances.from_triples(
+            mapped_triples=self.factory.mapped_triples,
+            num_entities=self.factory.num_entities,
+            num_relations=self.factory.num_relations,
+        )
+        kwargs["pairs"] = self.instances.pairs
+        kwargs["compressed"] = self.instances.compressed
+        return kwargs
+
+    def test_getitem(self):
+        """Test that batches agree with the unbatched instances."""
+        pair_ids = torch.randperm(len(self.instances))[: self.instance.batch_size]
+        pairs, labels = self.instance[pair_ids]
+        assert labels.is_sparse
+        assert labels.shape == (pair_ids.shape[0], self.factory.num_entities)
+        for pair_id, pair, label in zip(pair_ids.tolist(), pairs, labels.to_dense()):
+            exp_pair, exp_label = self.instances[pair_id]
+            numpy.testing.assert_array_equal(pair.numpy(), exp_pair)
+            numpy.testing.assert_allclose(label.numpy(), exp_label)
+
+    def test_data_loader(self):
+        """Test data loader."""
+        pairs = torch.cat([pairs for pairs, _ in torch.utils.data.DataLoader(dataset=self.instance, batch_size=None)])
+        # every pair occurs exactly once
+        assert pairs.shape[0] == len(self.instances)
+        assert pairs.unique(dim=0).shape[0] == len(self.instances)
+
+    def test_length(self):
+        """Test length."""
+        assert len(self.instance) == len(list(iter(self.instance)))
+
+    def test_data_loader_multiprocessing(self):
+        """Test data loader with multiple workers."""
+        loader = torch.utils.data.DataLoader(dataset=self.instance, batch_size=None, num_workers=2)
+        batches = list(loader)
+        assert len(batches) == len(loader)
+        pairs = torch.cat([pairs for pairs, _ in batches])
+        assert pairs.unique(dim=0).shape[0] == len(self.instances)
@@ -1,11 +1,15 @@
 """Tests for node piece."""
 
+import pathlib
 import random
+import tempfile
+import unittest.mock
 from typing import Any, MutableMapping
 
 import numpy
 import numpy.testing
 import scipy.sparse.csgraph
+import torch
 import unittest_templates
 
 import pykeen.nn.node_piece
@@ -98,6 +102,43 @@ class SparseBFSSearcherTests(cases.AnchorSearcherTestCase):
     cls = pykeen.nn.node_piece.SparseBFSSearcher
 
 
+class ChunkedBFSAnchorSearcherTests(cases.AnchorSearcherTestCase):
+    """Tests for chunked anchor search with scipy.sparse."""
+
+    cls = pykeen.nn.node_piece.ChunkedBFSAnchorSearcher
+    kwargs = dict(chunk_size=3)
+
+    def post_instantiation_hook(self) -> None:  # noqa: D102
+        super().post_instantiation_hook()
+        generator = numpy.random.default_rng(seed=42)
+        self.random_edge_index = generator.integers(self.num_entities, size=(2, 2 * self.num_entities))
+        self.random_anchors = generator.permutation(self.num_entities)[:8]
+
+    def test_distances(self):
+        """Test that the closest anchors are found."""
+        k = 3
+        tokens = self.instance(edge_index=self.random_edge_index, anchors=self.random_anchors, k=k)
+        # determine expected distances using shortest path distances via scipy.sparse.csgraph
+        adjacency = pykeen.nn.node_piece.ScipySparseAnchorSearcher.create_adjacency(
+            edge_index=self.random_edge_index, num_entities=self.num_entities
+        )
+        distances = scipy.sparse.csgraph.shortest_path(
+            csgraph=adjacency, directed=False, unweighted=True, indices=self.random_anchors
+        ).T
+        distances[distances > self.instance.max_iter] = numpy.inf
+        exp_distances = numpy.sort(distances, axis=1)[:, :k]
+        token_distances = numpy.take_along_axis(distances, numpy.maximum(tokens, 0), axis=1)
+        token_distances[tokens < 0] = numpy.inf
+        numpy.testing.assert_array_equal(token_distances, exp_distances)
+
+    def test_num_workers(self):
+        """Test that multi-process search yields the same result."""
+        expected = self.instance(edge_index=self.random_edge_index, anchors=self.random_anchors, k=3)
+        self.instance.num_workers = 2
+        tokens = self.instance(edge_index=self.random_edge_index, anchors=self.random_anchors, k=3)
+        numpy.testing.assert_array_equal(tokens, expected)
+
+
 class PersonalizedPageRankAnchorSearcherTests(cases.AnchorSearcherTestCase):
     """Tests for anchor search via PPR."""
 
@@ -122,6 +163,24 @@ class AnchorTokenizerTests(cases.TokenizerTestCase):
 
     cls = pykeen.nn.node_piece.AnchorTokenizer
 
+    def test_cache(self):
+        """Test caching the tokenization."""
+        kwargs = dict(
+            mapped_triples=self.factory.mapped_triples,
+            num_tokens=self.num_tokens,
+            num_entities=self.factory.num_entities,
+            num_relations=self.factory.num_relations,
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            self.instance.cache_directory = pathlib.Path(directory)
+            vocabulary_size, tokens = self.instance(**kwargs)
+            assert len(list(self.instance.cache_directory.iterdir())) == 1
+            # the second call must not search again
+            with unittest.mock.patch.object(type(self.instance.searcher), "__call__", side_effect=AssertionError):
+                cached_vocabulary_size, cached_tokens = self.instance(**kwargs)
+        assert cached_vocabulary_size == vocabulary_size
+        assert torch.equal(cached_tokens, tokens)
+
 
 @needs_packages("torch_sparse")
 class MetisAnchorTokenizerTests(cases.TokenizerTestCase):
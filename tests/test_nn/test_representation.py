@@ -2,6 +2,8 @@
 
 """Test embeddings."""
 
+import pathlib
+import tempfile
 from collections import ChainMap
 from typing import Any, ClassVar, MutableMapping, Tuple
 
@@ -50,6 +52,42 @@ class LowRankEmbeddingRepresentationTests(cases.RepresentationTestCase):
         assert isinstance(approx, self.cls)
 
 
+class MemoryMappedRepresentationTests(cases.RepresentationTestCase):
+    """Tests for memory-mapped representations."""
+
+    cls = pykeen.nn.representation.MemoryMappedRepresentation
+    kwargs = dict(
+        shape=(3, 5),
+    )
+
+    def _pre_instantiation_hook(self, kwargs: MutableMapping[str, Any]) -> MutableMapping[str, Any]:  # noqa: D102
+        kwargs = super()._pre_instantiation_hook(kwargs=kwargs)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = pathlib.Path(directory.name).joinpath("representations.npy")
+        # store in reduced precision
+        numpy.save(self.path, numpy.random.rand(self.max_id, *kwargs["shape"]).astype(numpy.float16))
+        kwargs["path"] = self.path
+        return kwargs
+
+    def test_from_representation(self):
+        """Test freezing another representation."""
+        for other in (
+            pykeen.nn.representation.Embedding(max_id=self.max_id, shape=(3, 5)),
+            pykeen.nn.representation.Embedding(max_id=self.max_id, shape=(3, 5), dtype=torch.cfloat),
+        ):
+            with self.subTest(is_complex=other.is_complex):
+                frozen = self.cls.from_representation(other=other, path=self.path, batch_size=3)
+                assert frozen.max_id == other.max_id
+                assert frozen.shape == other.shape
+                assert torch.allclose(frozen(indices=None), other(indices=None))
+
+    def test_mismatch(self):
+        """Test verification of the maximum ID."""
+        with self.assertRaises(ValueError):
+            self.cls(path=self.path, max_id=self.max_id + 1)
+
+
 class TensorEmbeddingTests(cases.RepresentationTestCase):
     """Tests for Embedding with 2-dimensional shape."""
 
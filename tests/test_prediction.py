@@ -1,5 +1,8 @@
 """Tests for prediction tools."""
+import pathlib
+import tempfile
 from typing import Any, Collection, Iterable, MutableMapping, Optional, Sequence, Tuple, Union
+from unittest import mock
 
 import numpy
 import pandas
@@ -15,7 +18,7 @@ import pykeen.typing
 from pykeen.constants import COLUMN_LABELS
 from pykeen.datasets.nations import Nations
 from pykeen.triples.triples_factory import AnyTriples, CoreTriplesFactory, KGInfo
-from pykeen.utils import resolve_device
+from pykeen.utils import resolve_device, triple_tensor_to_set
 from tests import cases
 
 
@@ -103,6 +106,44 @@ class AllScoreConsumerTestCase(cases.ScoreConsumerTests):
     )
 
 
+class ThresholdScoreConsumerTestCase(cases.ScoreConsumerTests):
+    """Test the threshold score consumer."""
+
+    cls = pykeen.predict.ThresholdScoreConsumer
+    kwargs = dict(threshold=0.5)
+
+    def check(self):  # noqa: D102
+        pack = self.instance.finalize()
+        assert (pack.scores >= 0.5).all()
+        assert pack.result.shape == (pack.scores.shape[0], 3)
+
+    def test_spill(self):
+        """Test spilling to disk, and keeping the top k per task."""
+        generator = torch.manual_seed(seed=42)
+        batches = [torch.randint(self.num_entities, size=(self.batch_size, 2), generator=generator) for _ in range(5)]
+        scores = [torch.rand(self.batch_size, self.num_entities, generator=generator) for _ in range(5)]
+        expected = pykeen.predict.ThresholdScoreConsumer(threshold=0.3, k=2)
+        with tempfile.TemporaryDirectory() as directory:
+            # a file of another run in the same directory
+            other = pathlib.Path(directory).joinpath("other.npz")
+            other.touch()
+            instance = pykeen.predict.ThresholdScoreConsumer(
+                threshold=0.3, k=2, max_in_memory=1, spill_directory=directory
+            )
+            for batch, batch_scores in zip(batches, scores):
+                expected(batch=batch, target=self.target, scores=batch_scores)
+                instance(batch=batch, target=self.target, scores=batch_scores)
+            assert len(list(pathlib.Path(directory).iterdir())) > 1
+            pack = instance.finalize()
+            # the consumer's own files are removed
+            assert list(pathlib.Path(directory).iterdir()) == [other]
+        expected_pack = expected.finalize()
+        assert torch.equal(pack.scores, expected_pack.scores)
+        assert torch.equal(pack.result, expected_pack.result)
+        # at most k per task
+        assert pack.result.shape[0] <= 2 * 5 * self.batch_size
+
+
 class ScoreConsumerMetaTestCase(unittest_templates.MetaTestCase[pykeen.predict.ScoreConsumer]):
     """Test for tests for score consumers."""
 
@@ -110,17 +151,40 @@ class ScoreConsumerMetaTestCase(unittest_templates.MetaTestCase[pykeen.predict.S
     base_test = cases.ScoreConsumerTests
 
 
-@pytest.mark.parametrize(["num_entities", "num_relations"], [(3, 2)])
-def test_consume_scores(num_entities: int, num_relations: int):
+@pytest.mark.parametrize(
+    ["num_entities", "num_relations", "batch_size", "num_workers", "pipelined"],
+    [(3, 2, 1, 0, False), (3, 2, 4, 0, True), (3, 2, 4, 2, True)],
+)
+def test_consume_scores(num_entities: int, num_relations: int, batch_size: int, num_workers: int, pipelined: bool):
     """Test for consume_scores."""
     dataset = pykeen.predict.AllPredictionDataset(num_entities=num_entities, num_relations=num_relations)
     model = pykeen.models.mocks.FixedModel(
         triples_factory=KGInfo(num_entities=num_entities, num_relations=num_relations, create_inverse_triples=False)
     )
     consumer = pykeen.predict.CountScoreConsumer()
-    pykeen.predict.consume_scores(model, dataset, consumer)
+    top_k_consumer = pykeen.predict.TopKScoreConsumer(k=5)
+    pykeen.predict.consume_scores(
+        model,
+        dataset,
+        consumer,
+        top_k_consumer,
+        batch_size=batch_size,
+        num_workers=num_workers,
+        pipelined=pipelined,
+    )
     assert consumer.batch_count == num_relations * num_entities
     assert consumer.score_count == num_relations * num_entities**2
+    # compare to exhaustive scoring
+    expected = pykeen.predict.predict_all(model=model, k=5)
+    assert torch.allclose(top_k_consumer.finalize().scores, expected.scores)
+
+
+@pytest.mark.parametrize("target", COLUMN_LABELS)
+def test_all_prediction_dataset_get_batch(target: pykeen.typing.Target):
+    """Test the vectorized batch creation of AllPredictionDataset."""
+    dataset = pykeen.predict.AllPredictionDataset(num_entities=5, num_relations=3, target=target)
+    indices = torch.arange(len(dataset))
+    assert torch.equal(dataset.get_batch(indices), pykeen.predict.PredictionDataset.get_batch(dataset, indices))
 
 
 def _iter_predict_all_inputs() -> Iterable[Tuple[pykeen.models.Model, Optional[int], pykeen.typing.Target, int]]:
@@ -191,6 +255,98 @@ def test_predict_top_k_consistency():
         numpy.testing.assert_equal(dfs[0][column].values, dfs[1][column].values)
 
 
+def test_predict_all_threshold():
+    """Test predicting all triples exceeding a threshold."""
+    model = pykeen.models.TransE(
+        triples_factory=KGInfo(num_entities=7, num_relations=3, create_inverse_triples=False),
+        random_seed=42,
+    )
+    dense = pykeen.predict.predict_all(model=model)
+    threshold = dense.scores.quantile(0.8).item()
+    pack = pykeen.predict.predict_all(model=model, threshold=threshold, batch_size=2)
+    assert torch.allclose(pack.scores, dense.scores[dense.scores >= threshold])
+    # check sparse conversion
+    sparse = pack.to_sparse(num_entities=model.num_entities, num_relations=model.num_relations)
+    assert sparse.shape == (model.num_entities, model.num_relations, model.num_entities)
+    assert sparse._nnz() == pack.scores.shape[0]
+    assert torch.allclose(sparse.to_dense()[tuple(pack.result.t())], pack.scores)
+    # combined with top-k
+    pack = pykeen.predict.predict_all(model=model, threshold=threshold, k=3)
+    assert torch.allclose(pack.scores, dense.scores[:3])
+    # combined with top-k per task
+    k_per_task = 2
+    pack = pykeen.predict.predict_all(model=model, threshold=threshold, k_per_task=k_per_task, batch_size=2)
+    assert (pack.scores >= threshold).all()
+    counts = torch.unique(pack.result[:, :2], dim=0, return_counts=True)[1]
+    assert (counts <= k_per_task).all()
+    # each kept score is among the top k of its (h, r) pair
+    all_scores = model.predict_t(pack.result[:, :2].clone())
+    kth_scores = all_scores.topk(k=k_per_task, dim=1).values[:, -1]
+    assert (pack.scores >= kth_scores - 1.0e-06).all()
+    # ... and the k highest scoring of these triples are returned with a global k
+    top = pykeen.predict.predict_all(model=model, threshold=threshold, k_per_task=k_per_task, k=3)
+    assert torch.allclose(top.scores, pack.scores[:3])
+
+
+@pytest.mark.parametrize(["k", "quantile"], [(None, None), (5, None), (None, 0.5), (50, 0.5)])
+def test_predict_all_sharded(k: Optional[int], quantile: Optional[float]):
+    """Test sharded prediction of all triples."""
+    model = pykeen.models.TransE(
+        triples_factory=KGInfo(num_entities=7, num_relations=3, create_inverse_triples=False),
+        random_seed=42,
+    )
+    threshold = None
+    expected = pykeen.predict.predict_all(model=model, k=k)
+    if quantile is not None:
+        threshold = pykeen.predict.predict_all(model=model).scores.quantile(quantile).item()
+        mask = expected.scores >= threshold
+        expected = pykeen.predict.ScorePack(result=expected.result[mask], scores=expected.scores[mask])
+    with tempfile.TemporaryDirectory() as directory:
+        pykeen.predict.predict_all_sharded(
+            model=model, directory=directory, k=k, threshold=threshold, num_shards=4, batch_size=2
+        )
+        pack = pykeen.predict.load_sharded_predictions(directory)
+    assert torch.allclose(pack.scores, expected.scores)
+    # note: there may be ties, so we check that the scores belong to the triples, instead of comparing the triples
+    assert torch.allclose(pack.scores, model.predict_hrt(pack.result).view(-1))
+    assert len(triple_tensor_to_set(pack.result)) == pack.result.shape[0]
+
+
+def test_predict_all_sharded_resume():
+    """Test resuming sharded prediction, and calculating shards separately."""
+    model = pykeen.models.mocks.FixedModel(
+        triples_factory=KGInfo(num_entities=3, num_relations=2, create_inverse_triples=False)
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        # calculate only some shards
+        pykeen.predict.predict_all_sharded(model=model, directory=directory, k=3, num_shards=3, shards=[0, 2])
+        with pytest.raises(FileNotFoundError):
+            pykeen.predict.load_sharded_predictions(directory)
+        # resume, which only calculates the missing shard
+        with mock.patch("pykeen.predict.consume_scores", wraps=pykeen.predict.consume_scores) as consume_scores:
+            pykeen.predict.predict_all_sharded(model=model, directory=directory, k=3, num_shards=3)
+        assert consume_scores.call_count == 1
+        pack = pykeen.predict.load_sharded_predictions(directory)
+        assert torch.allclose(pack.scores, pykeen.predict.predict_all(model=model, k=3).scores)
+        # a different configuration must not be mixed with existing shards
+        with pytest.raises(ValueError):
+            pykeen.predict.predict_all_sharded(model=model, directory=directory, k=5, num_shards=3)
+
+
+def test_predict_all_sharded_different_model():
+    """Test that shards of a different model of the same shape are not mixed."""
+    kwargs = dict(triples_factory=KGInfo(num_entities=3, num_relations=2, create_inverse_triples=False))
+    model = pykeen.models.TransE(**kwargs, random_seed=42)
+    with tempfile.TemporaryDirectory() as directory:
+        pykeen.predict.predict_all_sharded(model=model, directory=directory, k=3, num_shards=3, shards=[0])
+        # the same model may resume
+        pykeen.predict.predict_all_sharded(model=model, directory=directory, k=3, num_shards=3, shards=[1])
+        with pytest.raises(ValueError):
+            pykeen.predict.predict_all_sharded(
+                model=pykeen.models.TransE(**kwargs, random_seed=43), directory=directory, k=3, num_shards=3
+            )
+
+
 def _iter_predict_triples_inputs() -> (
     Iterable[Tuple[pykeen.models.Model, AnyTriples, Optional[CoreTriplesFactory], Optional[int]]]
 ):
@@ -366,6 +522,18 @@ def test_predict_target(
     )
     assert isinstance(pred, pykeen.predict.TargetPredictions)
     assert pred.factory == factory
+    # restrict to scores exceeding a threshold
+    threshold = pred.df["score"].median()
+    pred = pykeen.predict.predict_target(
+        model=model,
+        head=head,
+        relation=relation,
+        tail=tail,
+        triples_factory=factory,
+        targets=targets,
+        threshold=threshold,
+    )
+    assert (pred.df["score"] >= threshold).all()
 
 
 @pytest.mark.parametrize(
@@ -383,3 +551,72 @@ def test_partially_restricted_prediction_dataset(heads, relations, tails, target
     # try accessing each element
     for i in range(len(ds)):
         _ = ds[i]
+    # compare vectorized batch creation
+    indices = torch.arange(len(ds))
+    assert torch.equal(ds.get_batch(indices), pykeen.predict.PredictionDataset.get_batch(ds, indices))
+
+
+@pytest.mark.parametrize(["p", "num_probes"], [(None, None), (None, 2), (2, None), (1, 2)])
+def test_similarity_index_search(p: Optional[int], num_probes: Optional[int]):
+    """Test similarity search with the inverted file index."""
+    generator = torch.manual_seed(seed=42)
+    keys = torch.rand(50, 4, generator=generator)
+    queries = torch.rand(7, 4, generator=generator)
+    k = 5
+    index = pykeen.predict.SimilarityIndex(keys=keys, p=p, num_lists=6, num_probes=num_probes)
+    scores, ids = index.search(queries=queries, k=k)
+    assert scores.shape == ids.shape == (queries.shape[0], k)
+    exact_scores = index.similarity(queries, keys)
+    valid = ids >= 0
+    # the returned scores are the similarities of the returned entities
+    numpy.testing.assert_allclose(scores[valid], exact_scores.gather(dim=1, index=ids.clamp_min(0))[valid], rtol=1e-5)
+    if num_probes is None:
+        # exact search
+        assert valid.all()
+        numpy.testing.assert_allclose(scores, exact_scores.topk(k=k, dim=1).values, rtol=1e-5)
+
+
+def _iter_similarity_index_models() -> Iterable[Tuple[pykeen.models.Model, pykeen.typing.Target]]:
+    factory = Nations().training
+    for model_cls in (pykeen.models.DistMult, pykeen.models.ComplEx, pykeen.models.TransE, pykeen.models.RotatE):
+        for create_inverse_triples in (False, True):
+            model = model_cls(
+                triples_factory=KGInfo(
+                    num_entities=factory.num_entities,
+                    num_relations=factory.num_relations,
+                    create_inverse_triples=create_inverse_triples,
+                ),
+                random_seed=42,
+            )
+            for target in (pykeen.typing.LABEL_HEAD, pykeen.typing.LABEL_TAIL):
+                yield model, target
+
+
+@pytest.mark.parametrize(["model", "target"], _iter_similarity_index_models())
+def test_predict_all_similarity_index(model: pykeen.models.Model, target: pykeen.typing.Target):
+    """Test that predict_all with an exact similarity index is consistent with exhaustive scoring."""
+    k = 10
+    expected = pykeen.predict.predict_all(model=model, k=k, target=target, batch_size=64)
+    index = pykeen.predict.SimilarityIndex.from_model(model=model, num_lists=4)
+    pack = pykeen.predict.predict_all(model=model, k=k, target=target, index=index, batch_size=64)
+    _check_score_pack(pack=pack, model=model, num_triples=k)
+    numpy.testing.assert_allclose(pack.scores, expected.scores, rtol=1e-4, atol=1e-5)
+    # approximate search
+    pack = pykeen.predict.predict_all(model=model, k=k, target=target, index=index, num_probes=1, batch_size=64)
+    _check_score_pack(pack=pack, model=model, num_triples=k)
+    assert (pack.scores <= expected.scores + 1e-4 * (1 + expected.scores.abs())).all()
+
+
+def test_predict_target_similarity_index():
+    """Test target prediction with a similarity index, and the fallback for unsupported models."""
+    factory = Nations().training
+    k = 5
+    for model in (
+        pykeen.models.DistMult(triples_factory=factory, random_seed=42),
+        pykeen.models.mocks.FixedModel(triples_factory=factory),
+    ):
+        expected = pykeen.predict.predict_target(model=model, head=0, relation=1, k=k).df
+        df = pykeen.predict.predict_target(model=model, head=0, relation=1, k=k, index=True).df
+        assert len(df) == k
+        numpy.testing.assert_equal(df["tail_id"].values, expected["tail_id"].values)
+        numpy.testing.assert_allclose(df["score"].values, expected["score"].values, rtol=1e-5)
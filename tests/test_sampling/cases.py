@@ -10,7 +10,7 @@ import unittest_templates
 
 from pykeen.datasets import Nations
 from pykeen.sampling import NegativeSampler
-from pykeen.sampling.filtering import BloomFilterer, PythonSetFilterer
+from pykeen.sampling.filtering import BloomFilterer, PythonSetFilterer, SortedFilterer
 from pykeen.triples import Instances, TriplesFactory
 
 __all__ = [
@@ -111,6 +111,11 @@ class NegativeSamplerGenericTestCase(unittest_templates.GenericTestCase[Negative
         instance = self.cls(**self.instance_kwargs, filterer=BloomFilterer)
         self.check_sample(instance)
 
+    def test_sample_sorted_filtered(self):
+        """Test generating a negative sample with sorted filtering."""
+        instance = self.cls(**self.instance_kwargs, filterer=SortedFilterer)
+        self.check_sample(instance)
+
     def _update_positive_batch(self, positive_batch, batch_filter):
         # shape: (batch_size, 1, num_neg)
         positive_batch = positive_batch.unsqueeze(dim=1)
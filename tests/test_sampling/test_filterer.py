@@ -8,7 +8,7 @@ import torch
 import unittest_templates
 
 from pykeen.datasets import Nations
-from pykeen.sampling.filtering import BloomFilterer, Filterer, PythonSetFilterer
+from pykeen.sampling.filtering import BloomFilterer, Filterer, PythonSetFilterer, SortedFilterer
 from pykeen.utils import set_random_seed
 
 
@@ -63,6 +63,28 @@ class BloomFiltererTest(FiltererTest):
     cls = BloomFilterer
 
 
+class SortedFiltererTest(FiltererTest):
+    """Tests for the sorted filterer."""
+
+    cls = SortedFilterer
+
+    def test_add(self):
+        """Test incrementally adding triples, including ones which enlarge the ID ranges."""
+        num_entities, num_relations = self.triples_factory.num_entities, self.triples_factory.num_relations
+        new_triples = self.positive_batch + torch.as_tensor([num_entities, num_relations, num_entities])
+        assert not self.instance.contains(batch=new_triples).any()
+        self.instance.add(triples=new_triples)
+        assert self.instance.contains(batch=new_triples).all()
+        # previously added triples are still contained
+        assert self.instance.contains(batch=self.mapped_triples).all()
+        # compare to exact set-based filtering
+        negative_batch = torch.randint(2 * num_relations, size=(self.batch_size, self.num_negs_per_pos, 3))
+        expected = PythonSetFilterer(mapped_triples=torch.cat([self.mapped_triples, new_triples])).contains(
+            batch=negative_batch
+        )
+        assert (self.instance.contains(batch=negative_batch) == expected).all()
+
+
 class FiltererMetaTestCase(unittest_templates.MetaTestCase[Filterer]):
     """Test all filterers are tested."""
 
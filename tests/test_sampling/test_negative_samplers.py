@@ -55,6 +55,15 @@ class BernoulliNegativeSamplerTest(cases.NegativeSamplerGenericTestCase):
         """Verify entity corruption."""
         _verify_entity_corruption(instance=self.instance, positive_batch=self.positive_batch)
 
+    def test_corrupt_head_probability(self):
+        """Test the head corruption probabilities against a per-relation computation."""
+        triples = self.triples_factory.mapped_triples
+        for r in range(self.triples_factory.num_relations):
+            triples_with_r = triples[triples[:, 1] == r]
+            tph = triples_with_r.shape[0] / triples_with_r[:, 0].unique().numel()
+            hpt = triples_with_r.shape[0] / triples_with_r[:, 2].unique().numel()
+            self.assertAlmostEqual(self.instance.corrupt_head_probability[r].item(), tph / (tph + hpt), places=5)
+
 
 class PseudoTypedNegativeSamplerTest(cases.NegativeSamplerGenericTestCase):
     """Test the pseudo-type negative sampler."""
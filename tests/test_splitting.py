@@ -8,7 +8,9 @@ from pykeen.triples.splitting import (
     CoverageSplitter,
     DeterministicCleaner,
     RandomizedCleaner,
+    RandomizedCoverageSplitter,
     _get_cover_deterministic,
+    _get_cover_randomized,
     get_absolute_split_sizes,
     normalize_ratios,
 )
@@ -209,3 +211,56 @@ class CoverageSplitterTest(SplitterTestCase):
             get_relations(self.mapped_triples[cover]),
             msg="relation coverage is not full",
         )
+
+
+class RandomizedCoverageSplitterTest(SplitterTestCase):
+    """Tests for the randomized coverage splitter."""
+
+    cls = RandomizedCoverageSplitter
+
+    def test_get_cover_randomized(self):
+        """Test _get_cover_randomized."""
+        num_triples = self.mapped_triples.shape[0]
+        permutation = torch.randperm(num_triples)
+        cover = _get_cover_randomized(triples=self.mapped_triples, permutation=permutation)
+
+        # check type
+        assert torch.is_tensor(cover)
+        assert cover.dtype == torch.bool
+        # check format
+        assert cover.shape == (num_triples,)
+        # check size
+        assert cover.sum() <= len(get_entities(self.mapped_triples)) + len(get_relations(self.mapped_triples))
+
+        # check coverage
+        self.assertEqual(
+            get_entities(self.mapped_triples),
+            get_entities(self.mapped_triples[cover]),
+            msg="entity coverage is not full",
+        )
+        self.assertEqual(
+            get_relations(self.mapped_triples),
+            get_relations(self.mapped_triples[cover]),
+            msg="relation coverage is not full",
+        )
+
+        # the first triple in the random order is always chosen
+        assert cover[permutation[0]]
+
+    def test_split(self):
+        """Test splitting into a partition with full coverage in the first part."""
+        ratios = (0.8, 0.1, 0.1)
+        train, *rest = self.instance.split(mapped_triples=self.mapped_triples, ratios=ratios, random_state=42)
+        # check that no triple got lost, and none got duplicated
+        assert sum(part.shape[0] for part in (train, *rest)) == self.mapped_triples.shape[0]
+        assert triple_tensor_to_set(self.mapped_triples) == triple_tensor_to_set(torch.cat([train, *rest]))
+        # check sizes
+        assert [part.shape[0] for part in (train, *rest)] == list(
+            get_absolute_split_sizes(n_total=self.mapped_triples.shape[0], ratios=ratios)
+        )
+        # check that all entities and relations are covered in first part
+        assert get_entities(train) == get_entities(self.mapped_triples)
+        assert get_relations(train) == get_relations(self.mapped_triples)
+        # check reproducibility
+        train_2, *_ = self.instance.split(mapped_triples=self.mapped_triples, ratios=ratios, random_state=42)
+        assert torch.equal(train, train_2)
@@ -181,6 +181,25 @@ class TrainingLoopTestCase(unittest_templates.GenericTestCase[TrainingLoop]):
         # check non-empty metrics
         assert self.instance.result_tracker.metrics
 
+    def test_memory_budget(self):
+        """Test the selection of batch and sub-batch size for a memory budget."""
+        self.instance.result_tracker = PythonResultTracker()
+        # a generous budget allows for full-batch training
+        batch_size, sub_batch_size, slice_size = self.instance.memory_budget_search(
+            triples_factory=self.triples_factory, memory_budget=2**30
+        )
+        assert batch_size > 1
+        assert sub_batch_size == batch_size
+        assert slice_size is None
+        # a tight budget requires sub-batching
+        predicted_peak_memory = self.instance.result_tracker.configuration["training_memory.predicted_peak_memory"]
+        budget = predicted_peak_memory // 2
+        batch_size, sub_batch_size, slice_size = self.instance.memory_budget_search(
+            triples_factory=self.triples_factory, memory_budget=budget, batch_size=batch_size
+        )
+        assert 0 < sub_batch_size < batch_size
+        assert self.instance.result_tracker.configuration["training_memory.predicted_peak_memory"] <= budget
+
     def test_error_on_no_batch(self):
         """Verify that an error is raised if no training batch is available."""
         with self.assertRaises(NoTrainingBatchError):
@@ -66,6 +66,15 @@ class BloomFilteredSLCWATrainingLoopTestCase(cases.SLCWATrainingLoopTestCase):
     loss_cls = MarginRankingLoss
 
 
+class OnDeviceSLCWATrainingLoopTestCase(cases.SLCWATrainingLoopTestCase):
+    """Test sLCWA with batching and negative sampling on the device."""
+
+    cls = SLCWATrainingLoop
+    filterer_cls = PythonSetFilterer
+    loss_cls = MarginRankingLoss
+    kwargs = dict(sample_on_device=True)
+
+
 class MRLossLCWATrainingLoopTestCase(cases.TrainingLoopTestCase):
     """Test LCWA with margin ranking loss."""
 
@@ -12,6 +12,7 @@ from typing import Any, Collection, Iterable, Mapping, Optional, Tuple
 from unittest.mock import patch
 
 import numpy as np
+import pandas as pd
 import pytest
 import torch
 
@@ -19,8 +20,13 @@ from pykeen.datasets import Hetionet, Nations, SingleTabbedDataset
 from pykeen.datasets.nations import NATIONS_TRAIN_PATH
 from pykeen.triples import CoreTriplesFactory, LCWAInstances, TriplesFactory, TriplesNumericLiteralsFactory
 from pykeen.triples.splitting import splitter_resolver
-from pykeen.triples.triples_factory import INVERSE_SUFFIX, _map_triples_elements_to_ids, get_mapped_triples
-from pykeen.triples.utils import TRIPLES_DF_COLUMNS, load_triples
+from pykeen.triples.triples_factory import (
+    INVERSE_SUFFIX,
+    ArrayLabeling,
+    _map_triples_elements_to_ids,
+    get_mapped_triples,
+)
+from pykeen.triples.utils import TRIPLES_DF_COLUMNS, load_triples, tensor_to_df
 from tests.constants import RESOURCES
 from tests.utils import needs_packages
 
@@ -272,6 +278,32 @@ class TestTriplesFactory(unittest.TestCase):
         wc = self.factory.relation_word_cloud(top=3)
         self.assertIsNotNone(wc)
 
+    def test_from_path_chunked(self):
+        """Test streaming triples from a file in chunks."""
+        expected = TriplesFactory.from_path(NATIONS_TRAIN_PATH)
+        for chunk_size in (1, 77, 10_000):
+            with self.subTest(chunk_size=chunk_size):
+                factory = TriplesFactory.from_path(NATIONS_TRAIN_PATH, chunk_size=chunk_size)
+                self.assertEqual(expected, factory)
+
+    def test_from_path_chunked_compressed(self):
+        """Test streaming triples from a compressed file, with given mappings and pre-existing inverse triples."""
+        # drop an entity from the mapping, and leave gaps in the IDs
+        entity_to_id = {
+            label: 2 * i for i, label in enumerate(sorted(set(triples[:, [0, 2]].flat))) if label != "peter"
+        }
+        inverse_triples = triples[:, [2, 1, 0]].astype(object)
+        inverse_triples[:, 1] += INVERSE_SUFFIX
+        labeled_triples = np.concatenate([triples, inverse_triples.astype(str)])
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("triples.tsv.gz")
+            pd.DataFrame(labeled_triples).to_csv(path, sep="\t", header=False, index=False)
+            for kwargs in (dict(), dict(entity_to_id=entity_to_id)):
+                with self.subTest(**kwargs):
+                    expected = TriplesFactory.from_labeled_triples(labeled_triples, **kwargs)
+                    factory = TriplesFactory.from_path(path, chunk_size=3, **kwargs)
+                    self.assertEqual(expected, factory)
+
 
 class TestSplit(unittest.TestCase):
     """Test splitting."""
@@ -506,6 +538,31 @@ class TestUtils(unittest.TestCase):
         tf1 = Nations(create_inverse_triples=True).training.to_core_triples_factory()
         self.assert_binary_io(tf1, CoreTriplesFactory)
 
+    def test_binary_mmap(self):
+        """Test memory-mapped binary i/o with non-ASCII labels."""
+        tf1 = TriplesFactory.from_labeled_triples(triples=np.array([["ä", "r", "b"], ["b", "r€", "𝔠"]]))
+        with tempfile.TemporaryDirectory() as directory:
+            tf1.to_path_binary(directory)
+            tf2 = TriplesFactory.from_path_binary(directory, mmap=True)
+            self.assert_tf_equal(tf1, tf2)
+
+    def test_legacy_binary(self):
+        """Test loading the legacy TSV-based binary format, and rejecting unknown versions."""
+        tf1 = CoreTriplesFactory.create(mapped_triples=torch.as_tensor([[0, 0, 1], [1, 1, 2]]))
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory)
+            tensor_to_df(tf1.mapped_triples).to_csv(
+                path.joinpath(CoreTriplesFactory.triples_file_name), sep="\t", index=False
+            )
+            state = tf1._get_binary_state()
+            state.pop("format_version")
+            torch.save(state, path.joinpath(CoreTriplesFactory.base_file_name))
+            self.assert_tf_equal(tf1, CoreTriplesFactory.from_path_binary(path))
+            state["format_version"] = CoreTriplesFactory.binary_format_version + 1
+            torch.save(state, path.joinpath(CoreTriplesFactory.base_file_name))
+            with self.assertRaises(ValueError):
+                CoreTriplesFactory.from_path_binary(path)
+
     def assert_binary_io(self, tf, tf_cls):
         """Check the triples factory can be written and reloaded properly."""
         self.assertIsInstance(tf, tf_cls)
@@ -535,6 +592,66 @@ class TestUtils(unittest.TestCase):
         )
 
 
+class ArrayLabelingTests(unittest.TestCase):
+    """Tests for the array-backed labeling."""
+
+    def setUp(self) -> None:
+        """Prepare the labelings."""
+        self.factory = Nations().training
+        self.reference = self.factory.entity_labeling
+        self.labeling = ArrayLabeling.from_label_to_id(self.reference.label_to_id)
+
+    def test_map(self):
+        """Test mapping labels to IDs."""
+        labels = np.asarray([["usa", "unknown-entity"], ["china", "burma"]])
+        np.testing.assert_array_equal(self.labeling.map(labels), self.reference.map(labels))
+        assert self.labeling.label_to_id["usa"] == self.reference.label_to_id["usa"]
+        assert "unknown-entity" not in self.labeling.label_to_id
+
+    def test_label(self):
+        """Test mapping IDs to labels."""
+        ids = np.arange(-1, self.reference.max_id + 1)
+        np.testing.assert_array_equal(self.labeling.label(ids), self.reference.label(ids))
+        np.testing.assert_array_equal(self.labeling.all_labels(), self.reference.all_labels())
+        assert self.labeling.max_id == self.reference.max_id
+        assert self.labeling == self.reference
+
+    def test_non_ascii(self):
+        """Test labels with non-ASCII characters, and labels which are prefixes of each other."""
+        labels = ["ä", "äb", "€", "𝔠", ""]
+        labeling = ArrayLabeling.from_labels(labels)
+        assert labeling.map(labels).tolist() == list(range(len(labels)))
+        assert labeling.all_labels().tolist() == labels
+        assert labeling.map(["äbc", "a"]).tolist() == [-1, -1]
+
+    def test_duplicates(self):
+        """Test that duplicate labels are rejected."""
+        with self.assertRaises(ValueError):
+            ArrayLabeling.from_labels(["a", "b", "a"])
+
+    def test_save_load(self):
+        """Test saving and memory-mapped loading."""
+        with tempfile.TemporaryDirectory() as directory:
+            self.labeling.save(directory)
+            labeling = ArrayLabeling.load(directory)
+            assert labeling == self.labeling
+
+    def test_triples_factory(self):
+        """Test using array labelings in a triples factory."""
+        factory = TriplesFactory(
+            mapped_triples=self.factory.mapped_triples,
+            entity_to_id=self.labeling,
+            relation_to_id=ArrayLabeling.from_label_to_id(self.factory.relation_to_id),
+        )
+        triples = self.factory.label_triples(self.factory.mapped_triples)
+        np.testing.assert_array_equal(factory.label_triples(self.factory.mapped_triples), triples)
+        assert torch.equal(factory.map_triples(triples), self.factory.map_triples(triples))
+        entities = ["usa", 3, "china"]
+        assert factory.entities_to_ids(entities) == self.factory.entities_to_ids(entities)
+        # cloning keeps the array labeling
+        assert isinstance(factory.clone_and_exchange_triples(factory.mapped_triples).entity_labeling, ArrayLabeling)
+
+
 # cf. https://docs.pytest.org/en/7.1.x/example/parametrize.html#parametrizing-conditional-raising
 @pytest.mark.parametrize(
     ["dtype", "size", "expectation"],
@@ -16,14 +16,18 @@ import pytest
 import torch
 
 from pykeen.utils import (
+    LinearMemoryEstimate,
     _weisfeiler_lehman_iteration,
     _weisfeiler_lehman_iteration_approx,
+    _weisfeiler_lehman_iteration_hashed,
     calculate_broadcasted_elementwise_result_shape,
     clamp_norm,
     combine_complex,
     compact_mapping,
     compose,
+    create_relation_to_entity_set_mapping,
     estimate_cost_of_sequence,
+    estimate_peak_memory,
     flatten_dictionary,
     get_optimal_sequence,
     get_until_first_blank,
@@ -37,6 +41,35 @@ from pykeen.utils import (
 )
 
 
+class MemoryEstimationTests(unittest.TestCase):
+    """Tests for memory estimation."""
+
+    def test_estimate_peak_memory(self):
+        """Test estimating the peak memory of a forward pass."""
+        weight = torch.rand(7, 5, requires_grad=True)
+        x = torch.rand(11, 7)
+        # matmul saves x (excluded) and weight (excluded); relu saves its output, which is also the result
+        peak = estimate_peak_memory(closure=lambda: torch.relu(x @ weight), exclude=[x, weight])
+        self.assertEqual(peak, 11 * 5 * 4)
+        # without gradient tracking, only the result is counted
+        with torch.no_grad():
+            peak = estimate_peak_memory(closure=lambda: (x @ weight).exp().sum(dim=-1))
+        self.assertEqual(peak, 11 * 4)
+
+    def test_linear_memory_estimate(self):
+        """Test fitting and using a linear memory estimate."""
+        estimate = LinearMemoryEstimate.from_probes(sizes=[4, 8, 16], peaks=[140, 180, 260])
+        self.assertAlmostEqual(estimate.slope, 10.0)
+        self.assertAlmostEqual(estimate.intercept, 100.0)
+        self.assertEqual(estimate(10), 200)
+        self.assertEqual(estimate.get_max_size(budget=205, maximum=1000), 10)
+        self.assertEqual(estimate.get_max_size(budget=205, maximum=7), 7)
+        self.assertEqual(estimate.get_max_size(budget=100, maximum=7), 0)
+        # a single probe size gives a constant estimate
+        estimate = LinearMemoryEstimate.from_probes(sizes=[1], peaks=[13])
+        self.assertEqual(estimate.get_max_size(budget=13, maximum=5), 5)
+
+
 class TestCompose(unittest.TestCase):
     """Tests for composition."""
 
@@ -368,6 +401,14 @@ class TestUtils(unittest.TestCase):
             count += 1
         assert count == max_iter
 
+    def test_create_relation_to_entity_set_mapping(self):
+        """Test creating the mapping from relations to head and tail entity sets."""
+        triples = [(0, 0, 1), (0, 0, 2), (3, 0, 2), (4, 2, 0), (4, 2, 0)]
+        expected = ({0: {0, 3}, 2: {4}}, {0: {1, 2}, 2: {0}})
+        for hint in (triples, iter(triples), torch.as_tensor(triples), numpy.asarray(triples)):
+            heads, tails = create_relation_to_entity_set_mapping(triples=hint)
+            self.assertEqual((heads, tails), expected)
+
     def test_weisfeiler_lehman_approximation(self):
         """Verify approximate WL."""
         _, generator, _ = set_random_seed(seed=42)
@@ -385,3 +426,24 @@ class TestUtils(unittest.TestCase):
         sim_ref = reference[None, :] == reference[:, None]
         sim_approx = approx[None, :] == approx[:, None]
         assert torch.allclose(sim_ref, sim_approx)
+
+    def test_weisfeiler_lehman_hashed(self):
+        """Verify that hashed WL yields the same partitions as exact WL."""
+        _, generator, _ = set_random_seed(seed=42)
+        num_nodes = 13
+        num_edges = 31
+        edge_index = torch.randint(num_nodes, size=(2, num_edges), generator=generator)
+        # ensure each node participates in at least one edge
+        edge_index[0, :num_nodes] = torch.arange(num_nodes)
+        edge_index = edge_index.unique(dim=1)
+        adj = torch.sparse_coo_tensor(indices=edge_index, values=torch.ones(size=edge_index[0].shape))
+        colors = torch.randint(3, size=(num_nodes,), generator=generator)
+        reference = _weisfeiler_lehman_iteration(adj=adj, colors=colors)
+        for chunk_size in (None, 5):
+            hashed = _weisfeiler_lehman_iteration_hashed(edge_index=edge_index, colors=colors, chunk_size=chunk_size)
+            assert torch.equal(reference[None, :] == reference[:, None], hashed[None, :] == hashed[:, None])
+        for reference, hashed in zip(
+            iter_weisfeiler_lehman(edge_index=edge_index, max_iter=4),
+            iter_weisfeiler_lehman(edge_index=edge_index, max_iter=4, hashed=True),
+        ):
+            assert torch.equal(reference[None, :] == reference[:, None], hashed[None, :] == hashed[:, None])